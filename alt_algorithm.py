@@ -0,0 +1,249 @@
+#ALT (A*, Landmarks and Triangle inequality) is a way to use A* on general weighted graphs (like road networks) where there is no geometric heuristic such as the Manhattan distance used in A*_algorithm.py. Instead, a few nodes are chosen as "landmarks", and the exact distances from and to every landmark are computed once. These distances give a lower bound for the distance between any two nodes.
+
+#Key Concepts:
+# 1 - Triangle Inequality: For any landmark L and nodes v, t: d(L, t) <= d(L, v) + d(v, t), so d(v, t) >= d(L, t) - d(L, v). In the same way, d(v, t) >= d(v, L) - d(t, L).
+# 2 - Heuristic: h(v) = the largest of these lower bounds over all landmarks (and at least 0). It never overestimates, and it is consistent, so A* with h finds shortest paths and never has to reopen a node.
+# 3 - Landmark Selection: The bound is tight when a landmark lies "behind" the target or "behind" the source. Good landmarks are far apart and near the border of the graph:
+# 3.1 - Farthest: Repeatedly pick the node that is farthest from all landmarks chosen so far.
+# 3.2 - Avoid: Build a shortest-path tree from a random root and weight every node by how badly the current landmarks bound its distance from the root. Then walk down the heaviest subtree that contains no landmark, and pick the leaf at its end. This places new landmarks in the regions the current ones cover worst.
+# 4 - Tables: The distances are stored as two NumPy arrays of shape (V, k), one for d(L, v) and one for d(v, L), so the k bounds of a node are read as one row.
+
+#Steps:
+# 1 - Preprocessing: Select k landmarks. Run Dijkstra from every landmark on the graph and on the reversed graph to fill the two tables.
+# 2 - Query: Run A* from the start node with h(v) computed from the table rows of v and of the target.
+
+#Python Implementation:
+#The graph is a CSRGraph (see csr_graph.py). a_star_graph is A* for any weighted graph and any admissible heuristic. The file A*_algorithm.py cannot be imported (its name contains '*'), and it only works on unit-cost grids, so the general version lives here.
+
+import heapq
+from array import array
+from itertools import repeat
+
+import numpy as np
+
+from csr_graph import CSRGraph, csr_dijkstra
+
+def a_star_graph(graph, start, target, heuristic=None):
+    """
+    A* search on a CSRGraph with non-negative weights (weight 1 on every edge if the graph has none).
+
+    :param heuristic: Function node -> lower bound of the distance to the target (None = Dijkstra)
+    :return: (distance, path as node ids, number of expanded nodes); (inf, None, expanded) if unreachable
+    """
+    offsets = memoryview(graph.offsets)
+    weights = graph.weights
+    g_score = {start: 0.0}
+    came_from = {start: None}
+    closed = set()
+    h_start = heuristic(start) if heuristic else 0.0
+    open_set = [(h_start, 0.0, start)]  # (f, g, node)
+    while open_set:
+        _, current_g, current = heapq.heappop(open_set)
+        if current in closed:
+            continue
+        if current == target:
+            path = []
+            while current is not None:
+                path.append(current)
+                current = came_from[current]
+            path.reverse()
+            return current_g, path, len(closed)
+        closed.add(current)
+        s, e = offsets[current], offsets[current + 1]
+        for neighbor, weight in zip(graph.targets[s:e].tolist(), weights[s:e].tolist() if weights is not None else
+                                    repeat(1.0, e - s)):
+            tentative_g_score = current_g + weight
+            if tentative_g_score < g_score.get(neighbor, float('inf')):
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                h = heuristic(neighbor) if heuristic else 0.0
+                heapq.heappush(open_set, (tentative_g_score + h, tentative_g_score, neighbor))
+    return float('inf'), None, len(closed)
+
+def _shortest_path_tree(graph, root):
+    """Dijkstra from root that also returns the parent array and the order in which nodes were settled."""
+    offsets = memoryview(graph.offsets)
+    weights = graph.weights
+    dist = array('d', [float('inf')]) * graph.num_nodes
+    parent = array('q', [-1]) * graph.num_nodes
+    settled = bytearray(graph.num_nodes)
+    order = array('q')
+    dist[root] = 0.0
+    queue = [(0.0, root)]
+    while queue:
+        d, u = heapq.heappop(queue)
+        if settled[u]:
+            continue
+        settled[u] = 1
+        order.append(u)
+        s, e = offsets[u], offsets[u + 1]
+        for v, weight in zip(graph.targets[s:e].tolist(), weights[s:e].tolist() if weights is not None else
+                             repeat(1.0, e - s)):
+            if d + weight < dist[v]:
+                dist[v] = d + weight
+                parent[v] = u
+                heapq.heappush(queue, (d + weight, v))
+    return np.frombuffer(dist), np.frombuffer(parent, dtype=np.int64), np.frombuffer(order, dtype=np.int64)
+
+class ALT:
+    def __init__(self, graph, num_landmarks=8, strategy='avoid', seed=0, dtype=np.float64):
+        """
+        Select landmarks and precompute the distance tables.
+
+        :param graph: CSRGraph with non-negative weights
+        :param strategy: 'avoid' or 'farthest'
+        :param dtype: dtype of the tables (np.float32 or np.int32 halve the memory; use them only when the
+                      distances are represented exactly, otherwise the bounds may overestimate slightly)
+        """
+        self.graph = graph
+        self.reverse = graph.reverse()
+        self.rng = np.random.default_rng(seed)
+        if strategy not in ('avoid', 'farthest'):
+            raise ValueError("strategy must be 'avoid' or 'farthest'")
+        num_landmarks = min(num_landmarks, graph.num_nodes)
+        self.landmarks = []
+        from_columns, to_columns = [], []  # d(L, v) and d(v, L) for each landmark L
+        for _ in range(num_landmarks):
+            landmark = None
+            if strategy == 'avoid':
+                landmark = self._select_avoid(from_columns, to_columns)
+            if landmark is None:  # The walk ended in a subtree that already has a landmark
+                landmark = self._select_farthest(from_columns, to_columns)
+            if landmark is None:  # Every remaining node is unreachable from or to the landmarks
+                candidates = np.setdiff1d(np.arange(graph.num_nodes), self.landmarks)
+                if not len(candidates):
+                    break
+                landmark = int(self.rng.choice(candidates))
+            self.landmarks.append(landmark)
+            from_columns.append(csr_dijkstra(graph, landmark))
+            to_columns.append(csr_dijkstra(self.reverse, landmark))
+        # Shape (V, k)
+        self.from_landmark = np.column_stack(from_columns).astype(dtype) if from_columns else \
+            np.zeros((graph.num_nodes, 0), dtype=dtype)
+        self.to_landmark = np.column_stack(to_columns).astype(dtype) if to_columns else \
+            np.zeros((graph.num_nodes, 0), dtype=dtype)
+
+    def _select_farthest(self, from_columns, to_columns):
+        """Node that is farthest (in both directions) from all landmarks chosen so far."""
+        if not from_columns:
+            # Start from a random node and take the node farthest from it
+            distance = csr_dijkstra(self.graph, int(self.rng.integers(self.graph.num_nodes)))
+        else:
+            distance = np.minimum.reduce([f + t for f, t in zip(from_columns, to_columns)])
+            distance[self.landmarks] = -1.0
+        distance = np.where(np.isfinite(distance), distance, -1.0)
+        if distance.max() < 0:
+            return None
+        return int(np.argmax(distance))
+
+    def _select_avoid(self, from_columns, to_columns):
+        """Goldberg-Harrelson 'avoid': the leaf at the end of the worst-covered subtree of a random tree."""
+        root = int(self.rng.integers(self.graph.num_nodes))
+        dist, parent, order = _shortest_path_tree(self.graph, root)
+        # weight(v) = d(root, v) - lower bound of d(root, v) from the current landmarks
+        weight = dist[order].copy()
+        best_bound = np.zeros(len(order))
+        for f, t in zip(from_columns, to_columns):
+            with np.errstate(invalid='ignore'):
+                bound = np.fmax(f[order] - f[root], t[root] - t[order])
+            best_bound = np.fmax(best_bound, np.where(np.isfinite(bound), bound, 0.0))
+        weight -= np.minimum(best_bound, weight)
+        # size(v) = total weight of v's subtree, or 0 if the subtree contains a landmark
+        position = np.full(self.graph.num_nodes, -1, dtype=np.int64)
+        position[order] = np.arange(len(order))
+        size = weight.tolist()
+        has_landmark = [False] * len(order)
+        for landmark in self.landmarks:
+            if position[landmark] >= 0:
+                has_landmark[position[landmark]] = True
+        parent_position = [int(position[p]) if p >= 0 else -1 for p in parent[order].tolist()]
+        for i in range(len(order) - 1, 0, -1):  # Children are settled after their parents
+            p = parent_position[i]
+            if has_landmark[i]:
+                has_landmark[p] = True
+            else:
+                size[p] += size[i]
+        for i in range(len(order)):
+            if has_landmark[i]:
+                size[i] = 0.0
+        # Walk down from the root, always into the heaviest child
+        children = [[] for _ in range(len(order))]
+        for i in range(1, len(order)):
+            children[parent_position[i]].append(i)
+        node = 0
+        while True:
+            best = max(children[node], key=lambda child: size[child], default=None)
+            if best is None or size[best] <= 0.0:
+                break
+            node = best
+        if has_landmark[node]:
+            return None
+        return int(order[node])
+
+    def heuristic(self, target):
+        """h(v) for a fixed target: largest triangle-inequality lower bound over all landmarks (cached per node)."""
+        if not self.landmarks:
+            return lambda v: 0.0
+        from_target = self.from_landmark[target]  # d(L, t)
+        to_target = self.to_landmark[target]  # d(t, L)
+        from_landmark = self.from_landmark
+        to_landmark = self.to_landmark
+        cache = {}
+
+        def h(v):
+            bound = cache.get(v)
+            if bound is None:
+                with np.errstate(invalid='ignore'):
+                    # np.fmax skips the NaN of inf - inf (no bound from that landmark) and keeps the other landmarks
+                    bound = np.fmax.reduce(np.fmax(from_target - from_landmark[v], to_landmark[v] - to_target))
+                bound = cache[v] = float(bound) if bound > 0 else 0.0  # NaN (no bound at all) and negatives give 0
+            return bound
+        return h
+
+    def query(self, start, target):
+        """(distance, path, number of expanded nodes) using A* with the landmark heuristic."""
+        return a_star_graph(self.graph, start, target, self.heuristic(target))
+
+if __name__ == "__main__":
+    # Example Usage
+    graph = CSRGraph.from_adjacency({
+        'A': {'B': 1, 'C': 4},
+        'B': {'A': 1, 'C': 2, 'D': 5},
+        'C': {'A': 4, 'B': 2, 'D': 1},
+        'D': {'B': 5, 'C': 1}
+    })
+    alt = ALT(graph, num_landmarks=2)
+    distance, path, expanded = alt.query(graph.node_id('A'), graph.node_id('D'))
+    print(distance, [graph.node_label(v) for v in path])  # 4.0 ['A', 'B', 'C', 'D']
+
+    # A 100 x 100 grid road network with random travel times: compare node expansions with Dijkstra
+    rng = np.random.default_rng(0)
+    size = 100
+    ids = np.arange(size * size).reshape(size, size)
+    sources = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    targets = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    road = CSRGraph.from_edges(sources, targets, rng.integers(1, 10, len(sources)).astype(np.float64),
+                               num_nodes=size * size, directed=False)
+    alt = ALT(road, num_landmarks=8, strategy='avoid')
+    dijkstra_total, alt_total = 0, 0
+    for _ in range(50):
+        s, t = (int(x) for x in rng.integers(0, size * size, 2))
+        d1, _, e1 = a_star_graph(road, s, t)
+        d2, _, e2 = alt.query(s, t)
+        assert d1 == d2
+        dijkstra_total += e1
+        alt_total += e2
+    print("Expanded nodes - Dijkstra: %d, ALT: %d (%.1fx fewer)" % (dijkstra_total, alt_total,
+                                                                     dijkstra_total / alt_total))
+
+#Explanation of the Code:
+# 1 - a_star_graph: The A* loop of A*_algorithm.py on a weighted CSR graph. g(n) adds the edge weights instead of 1, and the heuristic is a function passed by the caller. Without a heuristic it is exactly Dijkstra's algorithm, which is used as the baseline.
+# 2 - Landmark Selection:
+# 2.1 - _select_farthest uses the landmark tables already computed: the next landmark maximizes the smallest d(L, v) + d(v, L) over the current landmarks.
+# 2.2 - _select_avoid builds a shortest-path tree from a random root, computes the weight of every node (true distance minus the current lower bound), adds the weights up the tree in reverse settle order (subtrees with a landmark get size 0), and walks down the heaviest children to a leaf. If the walk ends in a subtree that already has a landmark, __init__ falls back to _select_farthest, and to a random remaining node when no landmark reaches the rest of the graph, so it only stops early when every node is a landmark.
+# 3 - Tables: from_landmark and to_landmark have one row per node and one column per landmark. d(v, L) is computed with Dijkstra on the reversed graph, so directed graphs are supported.
+# 4 - heuristic(target) reads the target's rows once and returns h(v), which combines both kinds of bounds of the row of v with np.fmax over the k landmarks. np.fmax ignores the NaN of inf - inf (no bound from that landmark) and keeps the bounds of the other landmarks. Only the nodes that A* reaches are computed, each once per query (cache).
+
+#Time Complexity:
+# 1 - Preprocessing: 2k Dijkstra runs, O(k (V + E) log V). Space: 2 * V * k numbers.
+# 2 - Query: The same worst case as Dijkstra (plus O(k) per reached node for h), but with a good set of landmarks A* only expands the nodes close to the shortest path, typically several times fewer than Dijkstra.
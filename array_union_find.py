@@ -0,0 +1,311 @@
+#union_find_algorithm.UnionFind (and its copy in kruskals_algorithm.py) stores the forest in Python lists and merges one pair per method call. For graphs with millions of edges, the time goes into the Python calls and the boxed integers, not into the algorithm. This file keeps the same data structure in flat integer arrays, merges whole NumPy edge arrays at once, and adds a variant that can undo unions.
+
+#Key Concepts:
+# 1 - Path Halving: While walking up to the root, every visited node is linked to its grandparent (parent[x] = parent[parent[x]]). It is a loop instead of a recursion, needs one pass instead of two, and gives the same O(α(n)) amortized bound as full path compression.
+# 2 - Union by Size: The root of the smaller set is attached to the root of the larger one, so trees stay O(log n) deep even without compression.
+# 3 - Batch Union (Hooking and Pointer Jumping): For a whole array of edges at once: find the roots of both endpoints (vectorized), hook every root with a cross edge onto the smallest root it is connected to, then let every node jump to its grandparent until all nodes point to their root. Repeat with the edges that still connect different roots. Hooking always goes to a smaller root id, so no cycles can form.
+# 4 - Rollback: Path compression changes many parents during find, which is impossible to undo cheaply. Without compression (union by size alone keeps finds at O(log n)), every union changes exactly one parent and one size, so it can be undone from a stack. This is what offline dynamic connectivity (edges that are added AND removed) needs.
+
+#Python Implementation:
+#ArrayUnionFind stores parent and size in NumPy int64 arrays. Single operations (find, union) read and write them through a memoryview, which is much faster than NumPy scalar indexing; union_many and component_labels work on the arrays directly. RollbackUnionFind uses array('q') and an undo stack.
+
+from array import array
+
+import numpy as np
+
+class ArrayUnionFind:
+    def __init__(self, n, track_sizes=True):
+        """
+        :param track_sizes: False = no size array (half the memory). union then always attaches the larger root to
+                            the smaller one, like union_many, so every root is the smallest element of its set.
+        """
+        self.parent = np.arange(n, dtype=np.int64)
+        self.size = np.ones(n, dtype=np.int64) if track_sizes else None
+        self._parent = memoryview(self.parent)  # Same memory, fast access to single elements
+        self._size = memoryview(self.size) if track_sizes else None
+        self.num_components = n
+
+    def find(self, x):
+        """Root of the set of x, with path halving (no recursion)."""
+        parent = self._parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        """Merge the sets of x and y (union by size); returns True if they were different sets."""
+        root_x, root_y = self.find(x), self.find(y)
+        if root_x == root_y:
+            return False
+        size = self._size
+        if size is None:
+            if root_x > root_y:
+                root_x, root_y = root_y, root_x
+        else:
+            if size[root_x] < size[root_y]:
+                root_x, root_y = root_y, root_x
+            size[root_x] += size[root_y]
+        self._parent[root_y] = root_x
+        self.num_components -= 1
+        return True
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def _compress(self):
+        """Pointer jumping until every node points directly to its root."""
+        parent = self.parent
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                return
+            parent[:] = grandparent
+
+    def find_many(self, x):
+        """Roots of all nodes in the array x; every node on the way is linked directly to its root."""
+        parent = self.parent
+        root = parent[x]
+        pending = np.flatnonzero(parent[root] != root)  # Entries whose parent is not a root yet
+        if not len(pending):
+            return root
+        first = pending
+        passed = []  # (entries, node they passed) for every step
+        while len(pending):
+            passed.append((pending, root[pending]))
+            root[pending] = parent[root[pending]]
+            pending = pending[parent[root[pending]] != root[pending]]
+        parent[x[first]] = root[first]
+        for entries, nodes in passed:
+            parent[nodes] = root[entries]
+        return root
+
+    def union_many(self, u, v):
+        """
+        Merge the sets of all pairs (u[i], v[i]) at once. With fewer than n / 2 pairs, only the nodes of the pairs
+        and their paths to the roots are read or written, so a call costs O(len(u) * rounds), not O(n).
+
+        :param u, v: Integer arrays of the same length (e.g. the edge list of a graph)
+        :return: Number of merges (how much the number of components went down)
+        """
+        u = np.asarray(u, dtype=np.int64)
+        v = np.asarray(v, dtype=np.int64)
+        parent, size = self.parent, self.size
+        before = self.num_components
+        whole = 2 * len(u) >= len(parent)  # With this many pairs, pointer jumping over the whole array is cheaper
+        while len(u):
+            if whole:
+                self._compress()
+                root_u, root_v = parent[u], parent[v]
+            else:
+                root_u, root_v = self.find_many(u), self.find_many(v)
+            cross = root_u != root_v
+            if not cross.any():
+                break
+            u, v, root_u, root_v = u[cross], v[cross], root_u[cross], root_v[cross]  # Only active edges remain
+            high, low = np.maximum(root_u, root_v), np.minimum(root_u, root_v)
+            hooked = np.sort(high)
+            hooked = hooked[np.concatenate(([True], hooked[1:] != hooked[:-1]))]  # Distinct (faster than np.unique)
+            np.minimum.at(parent, high, low)  # Hook every larger root onto the smallest root it touches
+            self.num_components -= len(hooked)  # Each hooked root stops being a root
+            if size is not None:
+                # Hooking ignores sizes; the new roots collect the sizes of the roots hooked below them
+                np.add.at(size, self.find_many(hooked), size[hooked])
+        return before - self.num_components
+
+    def recount(self):
+        """Recompute the number of components (and the sizes) from the parent array alone, e.g. after loading it."""
+        self._compress()
+        if self.size is not None:
+            self.size[:] = np.bincount(self.parent, minlength=len(self.parent))
+        self.num_components = int(np.count_nonzero(self.parent == np.arange(len(self.parent))))
+
+    def component_labels(self):
+        """
+        Component of every element, numbered 0, 1, 2, ... in the order of their smallest element.
+
+        :return: (int64 label array, number of components)
+        """
+        self._compress()
+        if self.size is None:
+            # Every root is the smallest element of its set: number the roots in order, then look them up
+            is_root = self.parent == np.arange(len(self.parent))
+            labels = np.cumsum(is_root) - 1
+            return labels[self.parent], int(labels[-1]) + 1 if len(labels) else 0
+        roots, labels = np.unique(self.parent, return_inverse=True)  # The root of a set is not always its smallest element,
+        first = np.full(len(roots), len(self.parent), dtype=np.int64)  # so renumber by first occurrence
+        np.minimum.at(first, labels, np.arange(len(labels)))
+        renumber = np.empty(len(roots), dtype=np.int64)
+        renumber[np.argsort(first, kind='stable')] = np.arange(len(roots))
+        return renumber[labels], len(roots)
+
+class RollbackUnionFind:
+    def __init__(self, n):
+        self.parent = array('q', range(n))
+        self.size = array('q', [1]) * n
+        self.history = []  # Child root of every successful union, -1 for unions that changed nothing
+        self.num_components = n
+
+    def find(self, x):
+        """Root of the set of x; no compression, so the tree stays exactly as union left it."""
+        parent = self.parent
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        root_x, root_y = self.find(x), self.find(y)
+        if root_x == root_y:
+            self.history.append(-1)  # Also recorded, so that every union can be undone with one pop
+            return False
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+        self.num_components -= 1
+        self.history.append(root_y)
+        return True
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def snapshot(self):
+        """A marker for rollback: the number of unions so far."""
+        return len(self.history)
+
+    def rollback(self, snapshot=None):
+        """Undo the unions made after snapshot (default: undo only the last union)."""
+        if snapshot is None:
+            snapshot = len(self.history) - 1
+        while len(self.history) > snapshot:
+            child = self.history.pop()
+            if child == -1:
+                continue
+            root = self.parent[child]
+            self.size[root] -= self.size[child]
+            self.parent[child] = child
+            self.num_components += 1
+
+def offline_dynamic_connectivity(n, operations):
+    """
+    Answer connectivity queries while edges are added and removed, when all operations are known in advance.
+
+    Every edge is alive during an interval of operation indices. The intervals are stored in a segment tree over
+    the operations; a depth-first walk of the tree applies the unions of each node on the way down and rolls them
+    back on the way up, so every leaf sees exactly the edges alive at its time.
+
+    :param operations: List of ('add', u, v), ('remove', u, v) or ('query', u, v)
+    :return: List of booleans, one per query
+    """
+    Q = len(operations)
+    if Q == 0:
+        return []
+    size = 1
+    while size < Q:
+        size *= 2
+    tree_edges = [[] for _ in range(2 * size)]
+
+    def insert(left, right, edge):
+        """Store edge in the O(log Q) tree nodes that cover the times [left, right) (iterative segment tree)."""
+        left += size
+        right += size
+        while left < right:
+            if left & 1:
+                tree_edges[left].append(edge)
+                left += 1
+            if right & 1:
+                right -= 1
+                tree_edges[right].append(edge)
+            left //= 2
+            right //= 2
+
+    alive = {}  # Edge -> time it was added
+    for time, (kind, u, v) in enumerate(operations):
+        edge = (min(u, v), max(u, v))
+        if kind == 'add':
+            alive.setdefault(edge, time)
+        elif kind == 'remove':
+            insert(alive.pop(edge), time, edge)
+    for edge, start in alive.items():
+        insert(start, Q, edge)
+
+    uf = RollbackUnionFind(n)
+    answers = []
+    stack = [(1, False)]  # (tree node, leaving); explicit stack, like the iterative searches of iterative_dfs.py
+    snapshots = []
+    while stack:
+        node, leaving = stack.pop()
+        if leaving:
+            uf.rollback(snapshots.pop())
+            continue
+        snapshots.append(uf.snapshot())
+        for u, v in tree_edges[node]:
+            uf.union(u, v)
+        stack.append((node, True))
+        if node >= size:
+            time = node - size
+            if time < Q and operations[time][0] == 'query':
+                answers.append(uf.connected(operations[time][1], operations[time][2]))
+        else:
+            stack.append((2 * node + 1, False))  # Pushed first, so the left child (earlier times) runs first
+            stack.append((2 * node, False))
+    return answers
+
+if __name__ == "__main__":
+    import time
+
+    # Example Usage: the example of union_find_algorithm.py
+    uf = ArrayUnionFind(5)
+    uf.union(0, 1)
+    uf.union(1, 2)
+    uf.union(3, 4)
+    print(uf.connected(0, 2), uf.connected(0, 4))  # True False
+    uf.union_many(np.array([2]), np.array([4]))
+    print(uf.connected(0, 4), uf.component_labels())  # True (array([0, 0, 0, 0, 0]), 1)
+
+    # Rollback
+    ruf = RollbackUnionFind(4)
+    ruf.union(0, 1)
+    marker = ruf.snapshot()
+    ruf.union(1, 2)
+    ruf.union(2, 3)
+    print(ruf.num_components, ruf.connected(0, 3))  # 1 True
+    ruf.rollback(marker)
+    print(ruf.num_components, ruf.connected(0, 3))  # 3 False
+
+    # Offline dynamic connectivity
+    print(offline_dynamic_connectivity(3, [('add', 0, 1), ('add', 1, 2), ('query', 0, 2),
+                                           ('remove', 0, 1), ('query', 0, 2), ('query', 1, 2)]))  # [True, False, True]
+
+    # 10^6 random edges on 10^6 nodes: one union call per edge vs one union_many call
+    from union_find_algorithm import UnionFind
+    rng = np.random.default_rng(0)
+    n = m = 10 ** 6
+    u, v = rng.integers(0, n, m), rng.integers(0, n, m)
+    begin = time.perf_counter()
+    lists = UnionFind(n)
+    for a, b in zip(u.tolist(), v.tolist()):
+        lists.union(a, b)
+    print("UnionFind.union loop: %.2f s" % (time.perf_counter() - begin))
+    begin = time.perf_counter()
+    batch = ArrayUnionFind(n)
+    batch.union_many(u, v)
+    print("ArrayUnionFind.union_many: %.2f s, %d components" % (time.perf_counter() - begin, batch.num_components))
+
+#Explanation of the Code:
+# 1 - ArrayUnionFind.find walks up with path halving: each step points the node to its grandparent and moves there. union attaches the smaller root under the larger one and updates the size of the new root.
+# 2 - union_many:
+# 2.1 - find_many follows the parent pointers of all endpoints at once until they stop changing, then links every node it passed directly to its root. Only these nodes are touched, never the whole parent array. With at least n / 2 pairs the whole array is touched anyway, so _compress (parent = parent[parent] until nothing changes) is used instead, and parent[u] IS the root of u.
+# 2.2 - Edges whose endpoints already have the same root are dropped; they can never become cross edges again.
+# 2.3 - np.minimum.at hooks every larger root onto the smallest root it shares an edge with. Since roots only ever point to smaller ids, the parent pointers cannot form a cycle. Every distinct hooked root is one merge.
+# 2.4 - The sizes of the hooked roots are added to their new roots with np.add.at, so single union calls can continue by size. With track_sizes=False there is no size array at all, and union also hooks onto the smaller root.
+# 2.5 - recount rebuilds the number of components and the sizes from a parent array set from outside (a checkpoint) in one O(n) pass.
+# 3 - component_labels renumbers the roots so that the components are numbered in the order of their smallest element, which makes the labels independent of the union order. Without sizes every root already is the smallest element of its set, so a running count of the roots gives the labels without sorting.
+# 4 - RollbackUnionFind.union pushes the root that was attached (or -1); rollback pops these entries, detaches the root again and restores the size of its former parent. find does not compress, so no other pointer ever changes.
+# 5 - offline_dynamic_connectivity turns every edge into its lifetime [added, removed) and stores it in the segment tree nodes that cover this interval. The walk over the tree applies the edges of each node with union, answers the query at the leaf, and rolls back when it leaves the node.
+
+#Time Complexity:
+# 1 - ArrayUnionFind.find / union: O(α(n)) amortized.
+# 2 - union_many: O(m * (rounds + path length)) NumPy work for m pairs, independent of n; in practice a few rounds.
+# 3 - RollbackUnionFind.find / union: O(log n); rollback: O(1) per undone union.
+# 4 - offline_dynamic_connectivity: O(Q log Q log n) for Q operations.
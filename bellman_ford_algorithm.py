@@ -15,58 +15,237 @@
 #Bellman-Ford Algorithm Code in Python
 #Here is a Python implementation of the Bellman-Ford algorithm:
 
+from collections import deque
+
+import numpy as np
+
 class Edge:
     def __init__(self, u, v, weight):
+        self.graph = None  # Graph that holds this edge (set by add_edge)
         self.u = u  # start node
         self.v = v  # end node
         self.weight = weight  # weight of the edge
 
+    def __setattr__(self, name, value):
+        # Changing u, v or weight (e.g. a new exchange rate) clears the cached edge arrays of the graph.
+        # Reading stays a plain attribute access, so the loops of bellman_ford and spfa are not slowed down.
+        object.__setattr__(self, name, value)
+        graph = self.__dict__.get('graph')
+        if graph is not None:
+            graph._arrays = None
+
 class Graph:
     def __init__(self, vertices):
         self.V = vertices  # number of vertices
         self.edges = []  # list to store edges
+        self._arrays = None  # cached NumPy edge arrays for bellman_ford_numpy
 
     def add_edge(self, u, v, weight):
-        self.edges.append(Edge(u, v, weight))  # add edge to the list
+        edge = Edge(u, v, weight)
+        edge.graph = self
+        self.edges.append(edge)  # add edge to the list
+        self._arrays = None
 
     def bellman_ford(self, src):
+        """
+        Shortest distances from src.
+
+        :return: (dist list, None), or (dist list, negative cycle as a list of vertices in edge order)
+                 if a negative cycle is reachable from src
+        """
         # Step 1: Initialize distances from source to all other vertices as INFINITE
         dist = [float("inf")] * self.V
         dist[src] = 0  # distance from source to itself is always 0
+        pred = [-1] * self.V  # predecessor of every vertex on its current shortest path
 
         # Step 2: Relax all edges (V - 1) times
         for _ in range(self.V - 1):
+            updated = False
             for edge in self.edges:
                 if dist[edge.u] != float("inf") and dist[edge.u] + edge.weight < dist[edge.v]:
                     dist[edge.v] = dist[edge.u] + edge.weight
+                    pred[edge.v] = edge.u
+                    updated = True
+            if not updated:
+                return dist, None  # Early termination: a pass without changes means the distances are final (and no negative cycle)
 
-        # Step 3: Check for negative-weight cycles
+        # Step 3: Check for negative-weight cycles: a V-th pass that still improves a distance leaves a cycle
+        # in the predecessor pointers
+        updated = False
         for edge in self.edges:
             if dist[edge.u] != float("inf") and dist[edge.u] + edge.weight < dist[edge.v]:
-                print("Graph contains negative weight cycle")
-                return None  # If negative cycle is detected
-
-        return dist
-
-# Example usage:
-# Create a graph with 5 vertices (0 to 4)
-g = Graph(5)
-g.add_edge(0, 1, -1)
-g.add_edge(0, 2, 4)
-g.add_edge(1, 2, 3)
-g.add_edge(1, 3, 2)
-g.add_edge(1, 4, 2)
-g.add_edge(3, 2, 5)
-g.add_edge(3, 1, 1)
-g.add_edge(4, 3, -3)
-
-# Run Bellman-Ford algorithm from source vertex 0
-distances = g.bellman_ford(0)
-
-if distances:
-    print("Shortest distances from source vertex 0:")
-    for i in range(len(distances)):
-        print(f"Vertex {i}: {distances[i]}")
+                dist[edge.v] = dist[edge.u] + edge.weight
+                pred[edge.v] = edge.u
+                updated = True
+        if updated:
+            return dist, _predecessor_cycle(pred)
+
+        return dist, None
+
+    def spfa(self, src=None):
+        """
+        Queue-based Bellman-Ford (SPFA) with the SLF and LLL heuristics.
+
+        :param src: Source vertex, or None to start from every vertex at distance 0 (finds any negative cycle)
+        :return: (dist list, None), or (partial dist list, negative cycle as a list of vertices in edge order)
+        """
+        V = self.V
+        adjacency = [[] for _ in range(V)]
+        for edge in self.edges:
+            adjacency[edge.u].append((edge.v, edge.weight))
+        pred = [-1] * V
+        length = [0] * V  # Number of edges of the current path to every vertex
+        if src is None:
+            dist = [0] * V
+            queue = deque(range(V))
+            in_queue = [True] * V
+        else:
+            dist = [float("inf")] * V
+            dist[src] = 0
+            queue = deque([src])
+            in_queue = [False] * V
+            in_queue[src] = True
+        total = sum(dist[v] for v in queue)  # Sum of the labels in the queue, for LLL
+        relaxations = 0
+        next_check = V
+
+        while queue:
+            # LLL (Large Label Last): move vertices with a label above the average to the back
+            average = total / len(queue)
+            for _ in range(len(queue)):
+                if dist[queue[0]] <= average:
+                    break
+                queue.rotate(-1)
+            u = queue.popleft()
+            in_queue[u] = False
+            total -= dist[u]
+
+            for v, weight in adjacency[u]:
+                distance = dist[u] + weight
+                if distance < dist[v]:
+                    if in_queue[v]:
+                        total += distance - dist[v]
+                    dist[v] = distance
+                    pred[v] = u
+                    length[v] = length[u] + 1
+                    relaxations += 1
+                    # A path with V edges repeats a vertex; look for a cycle in the predecessor graph
+                    # (at most once every V relaxations, so the check costs O(1) per relaxation)
+                    if length[v] >= V and relaxations >= next_check:
+                        next_check = relaxations + V
+                        cycle = _predecessor_cycle(pred)
+                        if cycle is not None:
+                            return dist, cycle
+                    if not in_queue[v]:
+                        in_queue[v] = True
+                        total += distance
+                        # SLF (Small Label First): a label smaller than the front goes to the front
+                        if queue and distance < dist[queue[0]]:
+                            queue.appendleft(v)
+                        else:
+                            queue.append(v)
+        return dist, None
+
+    def edge_arrays(self):
+        """(u, v, weight) NumPy arrays of all edges, cached until an edge is added or changed."""
+        if self._arrays is None or len(self._arrays[0]) != len(self.edges):
+            self._arrays = (np.array([edge.u for edge in self.edges], dtype=np.int64),
+                            np.array([edge.v for edge in self.edges], dtype=np.int64),
+                            np.array([edge.weight for edge in self.edges], dtype=np.float64))
+        return self._arrays
+
+    def bellman_ford_numpy(self, src=None, weights=None):
+        """
+        Bellman-Ford that relaxes all edges of a pass at once with NumPy.
+
+        :param src: Source vertex, or None to start from every vertex at distance 0 (finds any negative cycle)
+        :param weights: Optional new weight of every edge (same order as self.edges), for reruns with changed
+                        weights without rebuilding the edge arrays
+        :return: (dist array, None), or (partial dist array, negative cycle as a list of vertices in edge order)
+        """
+        u, v, w = self.edge_arrays()
+        if weights is not None:
+            w = np.asarray(weights, dtype=np.float64)
+        if src is None:
+            dist = np.zeros(self.V)
+        else:
+            dist = np.full(self.V, np.inf)
+            dist[src] = 0.0
+        pred = np.full(self.V, -1, dtype=np.int64)
+
+        for _ in range(self.V):  # V - 1 passes, plus one more to detect a negative cycle
+            candidate = dist[u] + w
+            new_dist = dist.copy()
+            np.minimum.at(new_dist, v, candidate)  # Smallest candidate per target vertex (duplicates allowed)
+            improved = new_dist < dist
+            if not improved.any():
+                return dist, None  # Early termination
+            # Predecessor: any edge that produced the new distance of an improved vertex
+            best = improved[v] & (candidate == new_dist[v])
+            pred[v[best]] = u[best]
+            dist = new_dist
+        # Still improving after V passes: there is a negative cycle
+        return dist, _predecessor_cycle(pred.tolist())
+
+def _predecessor_cycle(pred):
+    """A cycle in the predecessor graph (a list of vertices in edge order), or None if there is none."""
+    mark = [0] * len(pred)  # Start vertex + 1 of the walk that visited the vertex
+    for start in range(len(pred)):
+        x = start
+        while x != -1 and not mark[x]:
+            mark[x] = start + 1
+            x = pred[x]
+        if x != -1 and mark[x] == start + 1:
+            # The walk came back to a vertex of its own: x is on a cycle
+            cycle = [x]
+            y = pred[x]
+            while y != x:
+                cycle.append(y)
+                y = pred[y]
+            cycle.reverse()  # pred points backwards along the edges
+            return cycle
+    return None
+
+if __name__ == "__main__":
+    # Example usage:
+    # Create a graph with 5 vertices (0 to 4)
+    g = Graph(5)
+    g.add_edge(0, 1, -1)
+    g.add_edge(0, 2, 4)
+    g.add_edge(1, 2, 3)
+    g.add_edge(1, 3, 2)
+    g.add_edge(1, 4, 2)
+    g.add_edge(3, 2, 5)
+    g.add_edge(3, 1, 1)
+    g.add_edge(4, 3, -3)
+
+    # Run Bellman-Ford algorithm from source vertex 0
+    distances, cycle = g.bellman_ford(0)
+
+    if cycle is None:
+        print("Shortest distances from source vertex 0:")
+        for i in range(len(distances)):
+            print(f"Vertex {i}: {distances[i]}")
+    else:
+        print("Graph contains negative weight cycle:", cycle)
+
+    # Same graph with SPFA and the vectorized version
+    print(g.spfa(0))  # ([0, -1, 2, -2, 1], None)
+    print(g.bellman_ford_numpy(0))  # (array([ 0., -1.,  2., -2.,  1.]), None)
+
+    # Currency arbitrage: with weights -log(rate), a negative cycle is a sequence of trades that makes money
+    import math
+    currencies = ['USD', 'EUR', 'GBP', 'JPY']
+    rates = {('USD', 'EUR'): 0.92, ('EUR', 'GBP'): 0.86, ('GBP', 'USD'): 1.28,
+             ('USD', 'JPY'): 150.0, ('JPY', 'EUR'): 0.0061}
+    market = Graph(len(currencies))
+    for (a, b), rate in rates.items():
+        market.add_edge(currencies.index(a), currencies.index(b), -math.log(rate))
+    dist, cycle = market.bellman_ford_numpy()
+    print("Arbitrage:", [currencies[v] for v in cycle])  # ['EUR', 'GBP', 'USD'] (0.86 * 1.28 * 0.92 = 1.0127)
+    print([currencies[v] for v in market.bellman_ford(0)[1]])  # ['JPY', 'EUR', 'GBP', 'USD'] (another cycle: 150 * 0.0061 * 0.86 * 1.28 = 1.007)
+    market.edges[2].weight = -math.log(1.20)  # GBP -> USD falls to 1.20: no more arbitrage
+    print(market.bellman_ford_numpy()[1])  # None
 
 #Explanation of the Code:
 # 1 - Edge Class: This class represents an edge in the graph, which has a start node (u), an end node (v), and a weight for the edge.
@@ -78,16 +257,26 @@ if distances:
 # 3 - Initialization:
 # 3.1 - The dist list is initialized with infinity (inf), and the distance to the source vertex is set to 0.
 # 4 - Relaxation: The edges are relaxed for V-1 times, updating the shortest known distances.
-# 5 - Negative Cycle Check: After the relaxation step, the algorithm checks if any edge can still be relaxed, indicating a negative weight cycle.
+# 5 - Negative Cycle Check: After the relaxation step, the algorithm checks if any edge can still be relaxed, indicating a negative weight cycle. bellman_ford returns (dist, cycle): cycle is None, or the negative cycle itself, taken from the predecessor pointers kept during the passes.
+
+# 6 - Early Termination: If a whole pass changes no distance, the next passes would not change anything either, so bellman_ford returns right away. On many graphs the distances are final after a few passes instead of V - 1.
+# 7 - SPFA (spfa): Instead of relaxing every edge in every pass, only the outgoing edges of vertices whose distance changed are relaxed. These vertices wait in a deque:
+# 7.1 - SLF (Small Label First): A vertex whose new distance is smaller than the distance of the vertex at the front is added at the front instead of the back.
+# 7.2 - LLL (Large Label Last): Before taking a vertex, vertices at the front with a distance above the average of the queue are moved to the back. total keeps the sum of the queued distances, so the average costs O(1).
+# 7.3 - length[v] counts the edges of the current path to v. A path with V or more edges must repeat a vertex, so a negative cycle is likely; _predecessor_cycle then looks for a cycle in the predecessor graph (every such cycle is a negative cycle).
+# 8 - Vectorized Mode (bellman_ford_numpy): The edges are stored once as NumPy arrays u, v and weight (edge_arrays, cached; add_edge and any change of an edge's u, v or weight clear the cache through Edge.__setattr__). One pass computes dist[u] + weight for all edges and keeps the smallest candidate per vertex with np.minimum.at. The weights argument lets the same graph be rerun with new weights (for example new exchange rates) without rebuilding the arrays.
+# 9 - Negative Cycle Extraction: bellman_ford, spfa and bellman_ford_numpy return the cycle itself instead of only printing a message. If distances still improve in pass V, the predecessor pointers contain a cycle, and _predecessor_cycle finds it by walking the pointers and marking the vertices of each walk.
+# 10 - src=None starts every vertex at distance 0, as if a new vertex had a 0-weight edge to all vertices, so any negative cycle in the graph is found (not only the ones reachable from a source). This is what arbitrage detection needs.
 
 #Time Complexity:
 #O(V * E): Where V is the number of vertices and E is the number of edges. This is because we perform V-1 relaxations over all edges.
+#With early termination the cost is O(k * E) for k passes. SPFA has the same worst case but is usually close to O(E) on random graphs. The vectorized mode does the same passes as bellman_ford, but each pass is a few NumPy operations instead of a Python loop over Edge objects.
 
 #Example Output:
 #For the graph in the example, the output might look like this:
-Shortest distances from source vertex 0:
-Vertex 0: 0
-Vertex 1: -1
-Vertex 2: 2
-Vertex 3: -2
-Vertex 4: 1
+#Shortest distances from source vertex 0:
+#Vertex 0: 0
+#Vertex 1: -1
+#Vertex 2: 2
+#Vertex 3: -2
+#Vertex 4: 1
@@ -15,19 +15,95 @@
 # 3.2 - If any of the bits are 0, the element is definitely not in the set.
 
 #Python Example:
-#Here’s an implementation of a simple Bloom Filter in Python using the hashlib module for hashing:
+#Here’s an implementation of a simple Bloom Filter in Python. Single items are hashed one at a time, and batches are hashed all at once with NumPy:
 
-import hashlib
+import numpy as np
+
+# 64-bit constants used by the hash functions below
+MASK64 = 0xFFFFFFFFFFFFFFFF
+FNV_OFFSET = 0xCBF29CE484222325  # FNV-1a 64-bit offset basis
+FNV_PRIME = 0x100000001B3  # FNV-1a 64-bit prime
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15  # splitmix64 increment, used to derive the second hash
+
+def _mix64(x):
+    """splitmix64 finalizer: scrambles a 64-bit integer so every input bit affects every output bit."""
+    x = (x + GOLDEN_GAMMA) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+def _mix64_array(x):
+    """Vectorized splitmix64 finalizer over a NumPy uint64 array (multiplications wrap modulo 2**64)."""
+    x = x + np.uint64(GOLDEN_GAMMA)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+def _fnv1a_64(data):
+    """FNV-1a 64-bit hash of a bytes object."""
+    h = FNV_OFFSET
+    for byte in data:
+        h = ((h ^ byte) * FNV_PRIME) & MASK64
+    return h
+
+def _fnv1a_64_array(items):
+    """Vectorized FNV-1a: hashes a whole batch of bytes at once, one byte column per step."""
+    lengths = np.fromiter((len(item) for item in items), dtype=np.int64, count=len(items))
+    width = int(lengths.max()) if len(items) else 0
+    # Fixed-width byte matrix, shorter items padded with zeros; the real lengths decide which bytes count,
+    # so trailing NUL bytes are hashed like any other byte (a NumPy 'S' array would strip them)
+    columns = np.zeros((len(items), width), dtype=np.uint8)
+    columns[np.arange(width) < lengths[:, None]] = np.frombuffer(b''.join(items), dtype=np.uint8)
+    h = np.full(len(items), FNV_OFFSET, dtype=np.uint64)
+    prime = np.uint64(FNV_PRIME)
+    for j in range(width):
+        # Only items that are longer than j consume the j-th byte
+        h = np.where(lengths > j, (h ^ columns[:, j]) * prime, h)
+    return h
+
+def _key_hash(item):
+    """64-bit base hash of a single key: integers are mixed directly, strings and bytes go through FNV-1a."""
+    if isinstance(item, (int, np.integer)):
+        return int(item) & MASK64
+    if isinstance(item, str):
+        item = item.encode('utf-8')
+    return _fnv1a_64(item)
+
+def _key_hash_array(items):
+    """64-bit base hashes for a batch (NumPy array or sequence), identical to _key_hash of every item."""
+    if isinstance(items, np.ndarray) and items.dtype.kind in 'iub':
+        return items.astype(np.uint64)  # Reinterprets negative ints the same way as `& MASK64`
+    items = list(items)
+    is_int = np.fromiter((isinstance(item, (int, np.integer)) for item in items), dtype=bool, count=len(items))
+    base = np.empty(len(items), dtype=np.uint64)
+    if is_int.any():
+        base[is_int] = np.array([int(item) & MASK64 for item, flag in zip(items, is_int) if flag], dtype=np.uint64)
+    if not is_int.all():
+        data = [item.encode('utf-8') if isinstance(item, str) else bytes(item)
+                for item, flag in zip(items, is_int) if not flag]
+        base[~is_int] = _fnv1a_64_array(data)
+    return base
 
 class BloomFilter:
     def __init__(self, size, num_hashes):
         self.size = size  # Size of the bit array
         self.num_hashes = num_hashes  # Number of hash functions
-        self.bit_array = [0] * self.size  # Initialize a bit array of 0s
+        self.bit_array = np.zeros(self.size, dtype=bool)  # Initialize a bit array of 0s
 
     def _hash(self, item, i):
         """Generate a hash for the item and hash index `i`."""
-        return int(hashlib.md5((str(i) + item).encode('utf-8')).hexdigest(), 16) % self.size
+        base = _key_hash(item)
+        h1 = _mix64(base)
+        h2 = _mix64(base ^ GOLDEN_GAMMA) | 1  # Odd step so the k positions do not collapse
+        return ((h1 + i * h2) & MASK64) % self.size
+
+    def _hash_many(self, items):
+        """Generate the (len(items), num_hashes) matrix of bit positions for a batch of items."""
+        base = _key_hash_array(items)
+        h1 = _mix64_array(base)
+        h2 = _mix64_array(base ^ np.uint64(GOLDEN_GAMMA)) | np.uint64(1)
+        i = np.arange(self.num_hashes, dtype=np.uint64)
+        return (h1[:, None] + i[None, :] * h2[:, None]) % np.uint64(self.size)
 
     def add(self, item):
         """Add an item to the Bloom Filter."""
@@ -43,28 +119,70 @@ class BloomFilter:
                 return False
         return True
 
-# Example Usage
-bloom = BloomFilter(500, 10)
+    def add_many(self, items, chunk_size=65536):
+        """Add a batch of items (NumPy integer array or sequence of str/bytes) to the Bloom Filter."""
+        for start in range(0, len(items), chunk_size):
+            positions = self._hash_many(items[start:start + chunk_size])
+            self.bit_array[positions.ravel()] = True  # Set all k bits of every item in one fancy-indexing write
+
+    def contains_many(self, items, chunk_size=65536):
+        """Check a batch of items; returns a boolean NumPy mask (True = possibly present)."""
+        result = np.empty(len(items), dtype=bool)
+        for start in range(0, len(items), chunk_size):
+            positions = self._hash_many(items[start:start + chunk_size])
+            result[start:start + len(positions)] = self.bit_array[positions].all(axis=1)
+        return result
+
+# Example Usage (guarded so hyperloglog.py and count_min_sketch.py can import the hash functions)
+if __name__ == "__main__":
+    bloom = BloomFilter(500, 10)
+
+    # Add items to the Bloom Filter
+    bloom.add("apple")
+    bloom.add("banana")
+    bloom.add("cherry")
+
+    # Check if items are in the Bloom Filter
+    print(bloom.contains("apple"))   # True
+    print(bloom.contains("banana"))  # True
+    print(bloom.contains("grapes"))  # False (most likely)
+
+    # Batch usage: both paths share the same hash functions, so they can be mixed freely
+    bloom.add_many(["kiwi", "mango"])
+    print(bloom.contains_many(["apple", "kiwi", "mango", "grapes"]))  # [ True  True  True False] (most likely)
 
-# Add items to the Bloom Filter
-bloom.add("apple")
-bloom.add("banana")
-bloom.add("cherry")
+    # Integer keys are hashed fully vectorized, without any per-item Python work
+    ids = BloomFilter(1 << 20, 7)
+    ids.add_many(np.arange(0, 100000, 2, dtype=np.int64))
+    print(ids.contains_many(np.array([0, 2, 1, 3], dtype=np.int64)))  # [ True  True False False] (most likely)
 
-# Check if items are in the Bloom Filter
-print(bloom.contains("apple"))   # True
-print(bloom.contains("banana"))  # True
-print(bloom.contains("grapes"))  # False (most likely)
+    # The single-item and batch paths hash every key identically (ints in lists, bytes with trailing NULs)
+    keys = [1, 2, 3, -5, 2 ** 70, "kiwi", b"a\x00", b"", np.int32(9)]
+    check = BloomFilter(1 << 16, 5)
+    check.add_many(keys)
+    assert all(check.contains(key) for key in keys)
+    check = BloomFilter(1 << 16, 5)
+    for key in keys:
+        check.add(key)
+    assert check.contains_many(keys).all()
+    assert (check._hash_many(keys) == [[check._hash(key, i) for i in range(5)] for key in keys]).all()
 
 #Explanation of the Code:
 # 1 - Initialization:
 # 1.1 - The BloomFilter class initializes with two main parameters: size (size of the bit array) and num_hashes (the number of hash functions used).
 # 2 - Hash Function:
-# 2.1 - The _hash function generates a hash value for the element by concatenating the index of the hash function (i) with the item itself. The result is passed through MD5 and then reduced modulo the size of the bit array.
+# 2.1 - The _hash function computes a 64-bit base hash of the element (FNV-1a for strings and bytes, the value itself for integers) and derives two independent hashes h1 and h2 from it with the splitmix64 finalizer.
+# 2.2 - The i-th position is (h1 + i * h2) mod size (double hashing), so k hash functions cost only two real hash computations. The result has the same false-positive rate as k independent hashes.
 # 3 - Adding an Element:
 # 3.1 - When an element is added with the add method, we compute multiple hash values (one for each hash function) and mark the corresponding bit positions in the bit array as 1.
 # 4 - Testing Membership:
 # 4.1 - To check if an element exists in the Bloom Filter, the contains method computes hash values for the element and checks the corresponding bits in the bit array. If any bit is 0, the element is not in the set. If all bits are 1, it may be in the set (false positives possible).
+# 5 - Batch Operations:
+# 5.1 - add_many and contains_many hash a whole batch at once. Integer keys (a NumPy integer array, or ints in any sequence) are mixed with a vectorized splitmix64, exactly like _key_hash does for a single int. Strings and bytes are packed into a fixed-width byte matrix and FNV-1a runs over one byte column at a time for all items together, using the real length of every item.
+# 5.2 - The (n, k) matrix of positions is used directly for NumPy fancy indexing: add_many sets every bit in one write, and contains_many gathers the bits and reduces them with all(axis=1) into a boolean mask.
+# 5.3 - Batches are processed in chunks (chunk_size rows) so the position matrix stays small even for millions of keys.
+# 5.4 - The vectorized and the per-item functions produce identical bit positions, so add/contains and add_many/contains_many can be mixed on the same filter.
+# 5.5 - For large batches of integer keys this removes the per-item Python loop entirely and is well over an order of magnitude faster than calling contains in a loop.
 
 #Limitations:
 # 1 - False Positives: Due to the nature of the Bloom Filter, it can return false positives.
@@ -0,0 +1,320 @@
+#Contraction Hierarchies (CH) is a speed-up technique for shortest-path queries on graphs that do not change, like road networks. A slow preprocessing step runs once. After it, every point-to-point query only explores a tiny part of the graph (a few hundred nodes instead of millions).
+
+#Key Concepts:
+# 1 - Node Order: All nodes are ranked by "importance". Unimportant nodes (dead ends, nodes in the middle of a road) get low ranks. Important nodes (highway junctions) get high ranks.
+# 2 - Contraction: Nodes are removed from the graph one by one, from the least important to the most important. When node v is removed, every shortest path u -> v -> x that goes through v must be kept, so a shortcut edge u -> x with weight w(u, v) + w(v, x) is added.
+# 3 - Witness Search: A shortcut is not needed if there is another path from u to x (a "witness") that is not longer. A small, bounded Dijkstra search from u that avoids v finds such paths.
+# 4 - Edge Difference: The importance of a node is (number of shortcuts its contraction would add) - (number of edges it removes) + (number of already contracted neighbors). Contracting nodes with a small edge difference first keeps the graph sparse.
+# 5 - Upward Graph: After preprocessing, every edge (original or shortcut) goes from a lower ranked to a higher ranked node in one of the two directions. For every shortest path there is an equally short path in the augmented graph that first goes up in rank and then goes down.
+
+#Query (Bidirectional Upward Search):
+# 1 - Run Dijkstra from the source that only follows edges to higher ranked nodes (forward search).
+# 2 - Run Dijkstra from the target on the reversed graph that also only goes upward (backward search).
+# 3 - The shortest distance is the minimum of forward(v) + backward(v) over all nodes v reached by both searches. Each search stops when its smallest key is not below the best distance found.
+# 4 - To get the actual path, every shortcut is replaced by the two edges it stands for (its "middle" node), recursively.
+
+#Python Implementation:
+#The input graph uses the same dictionary format as dijkstras_algorithm.py ({node: {neighbor: weight}}). The augmented graph is stored in CSR arrays (as in csr_graph.py) and can be saved to and loaded from a .npz file, so the preprocessing runs only once.
+
+import heapq
+
+import numpy as np
+
+def _to_csr(num_nodes, sources, targets, weights, middles):
+    """Group edge lists by source into CSR arrays (offsets, targets, weights, middles)."""
+    sources = np.asarray(sources, dtype=np.int64)
+    order = np.argsort(sources, kind='stable')
+    offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_nodes), out=offsets[1:])
+    return (offsets, np.asarray(targets, dtype=np.int64)[order],
+            np.asarray(weights, dtype=np.float64)[order], np.asarray(middles, dtype=np.int64)[order])
+
+def _label_array(labels):
+    """
+    1-D NumPy array of node labels. Only labels that are all ints or all strings get a NumPy type; any other
+    labels (tuples, mixes like [1, 'a'] that NumPy would turn into strings) are kept as they are in an object array.
+    """
+    if labels and (all(isinstance(label, (int, np.integer)) for label in labels)
+                   or all(isinstance(label, str) for label in labels)):
+        arr = np.array(labels)
+        if arr.dtype.kind in 'iuU' and arr.tolist() == labels:  # Not too large for int64, no trailing '\0'
+            return arr
+    arr = np.empty(len(labels), dtype=object)
+    for i, label in enumerate(labels):
+        arr[i] = label
+    return arr
+
+class ContractionHierarchy:
+    def __init__(self, labels, rank, up, down):
+        self.labels = labels  # labels[id] = original node label
+        self.ids = {label: i for i, label in enumerate(labels.tolist())}
+        self.rank = rank  # Contraction order of every node
+        self.up = up  # Forward upward graph: (offsets, targets, weights, middles)
+        self.down = down  # Backward upward graph: edge x -> y with rank[x] > rank[y], stored at y
+
+    @classmethod
+    def build(cls, graph, witness_limit=64):
+        """
+        Preprocess a graph given as {node: {neighbor: weight}} with non-negative weights.
+
+        :param witness_limit: Maximum number of nodes settled by each witness search. A smaller
+                              limit makes preprocessing faster but may add unnecessary shortcuts.
+        """
+        labels = list(graph)
+        for neighbors in graph.values():
+            labels.extend(v for v in neighbors if v not in graph)
+        labels = list(dict.fromkeys(labels))
+        ids = {label: i for i, label in enumerate(labels)}
+        n = len(labels)
+
+        # Remaining (not yet contracted) graph in both directions, with middles for shortcuts
+        out_edges = [{} for _ in range(n)]
+        in_edges = [{} for _ in range(n)]
+        middle = {}  # (u, x) -> middle node of the shortcut u -> x
+        for u, neighbors in graph.items():
+            for v, weight in neighbors.items():
+                a, b = ids[u], ids[v]
+                if a != b and weight < out_edges[a].get(b, float('inf')):
+                    out_edges[a][b] = in_edges[b][a] = weight
+
+        deleted_neighbors = [0] * n
+
+        def witness_search(source, skip, max_distance):
+            # Bounded Dijkstra in the remaining graph that never visits `skip`
+            dist = {source: 0}
+            queue = [(0, source)]
+            settled = 0
+            while queue and settled < witness_limit:
+                d, u = heapq.heappop(queue)
+                if d > dist[u]:
+                    continue
+                if d > max_distance:
+                    break
+                settled += 1
+                for v, weight in out_edges[u].items():
+                    if v == skip:
+                        continue
+                    nd = d + weight
+                    if nd < dist.get(v, float('inf')):
+                        dist[v] = nd
+                        heapq.heappush(queue, (nd, v))
+            return dist
+
+        def shortcuts_for(v):
+            # Shortcuts u -> x needed when v is contracted
+            shortcuts = []
+            if not out_edges[v]:
+                return shortcuts
+            max_out = max(out_edges[v].values())
+            for u, w1 in in_edges[v].items():
+                dist = witness_search(u, v, w1 + max_out)
+                for x, w2 in out_edges[v].items():
+                    if x != u and dist.get(x, float('inf')) > w1 + w2:
+                        shortcuts.append((u, x, w1 + w2))
+            return shortcuts
+
+        def importance(v, shortcuts):
+            edge_difference = len(shortcuts) - len(in_edges[v]) - len(out_edges[v])
+            return edge_difference + deleted_neighbors[v]
+
+        queue = [(importance(v, shortcuts_for(v)), v) for v in range(n)]
+        heapq.heapify(queue)
+        rank = np.zeros(n, dtype=np.int64)
+        up_edges = ([], [], [], [])  # sources, targets, weights, middles
+        down_edges = ([], [], [], [])
+        order = 0
+        while queue:
+            _, v = heapq.heappop(queue)
+            # Lazy update: the importance may have changed since it was pushed
+            shortcuts = shortcuts_for(v)
+            current = importance(v, shortcuts)
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, v))
+                continue
+
+            # Every remaining edge of v goes to a node that will get a higher rank
+            for x, weight in out_edges[v].items():
+                for edges, value in zip(up_edges, (v, x, weight, middle.get((v, x), -1))):
+                    edges.append(value)
+            for u, weight in in_edges[v].items():
+                for edges, value in zip(down_edges, (v, u, weight, middle.get((u, v), -1))):
+                    edges.append(value)
+
+            for u, x, weight in shortcuts:
+                if weight < out_edges[u].get(x, float('inf')):
+                    out_edges[u][x] = in_edges[x][u] = weight
+                    middle[(u, x)] = v
+
+            # Remove v from the remaining graph
+            for x in out_edges[v]:
+                del in_edges[x][v]
+                deleted_neighbors[x] += 1
+            for u in in_edges[v]:
+                del out_edges[u][v]
+                deleted_neighbors[u] += 1
+            out_edges[v] = {}
+            in_edges[v] = {}
+            rank[v] = order
+            order += 1
+
+        return cls(_label_array(labels), rank, _to_csr(n, *up_edges), _to_csr(n, *down_edges))
+
+    def save(self, path):
+        """Store the augmented graph in a .npz file."""
+        np.savez(path, labels=self.labels, rank=self.rank,
+                 up_offsets=self.up[0], up_targets=self.up[1], up_weights=self.up[2], up_middles=self.up[3],
+                 down_offsets=self.down[0], down_targets=self.down[1], down_weights=self.down[2],
+                 down_middles=self.down[3])
+
+    @classmethod
+    def load(cls, path):
+        """Load an augmented graph written by save (no preprocessing needed). Labels that are not all ints or all
+        strings (e.g. tuples) are stored with pickle; only load such files if you trust them."""
+        with np.load(path) as data:
+            up = tuple(data['up_' + name] for name in ('offsets', 'targets', 'weights', 'middles'))
+            down = tuple(data['down_' + name] for name in ('offsets', 'targets', 'weights', 'middles'))
+            rank = data['rank']
+            try:
+                labels = data['labels']
+            except ValueError:  # An object array, which np.load only reads with allow_pickle
+                labels = None
+        if labels is None:
+            with np.load(path, allow_pickle=True) as data:
+                labels = data['labels']
+        return cls(labels, rank, up, down)
+
+    def _upward_search_step(self, csr, queue, dist, predecessors, settled):
+        """Settle one node of an upward search; returns it (or None for an outdated entry)."""
+        offsets, targets, weights, middles = csr
+        d, u = heapq.heappop(queue)
+        if u in settled:
+            return None
+        settled.add(u)
+        s, e = offsets[u], offsets[u + 1]
+        for v, weight, mid in zip(targets[s:e].tolist(), weights[s:e].tolist(), middles[s:e].tolist()):
+            nd = d + weight
+            if nd < dist.get(v, float('inf')):
+                dist[v] = nd
+                predecessors[v] = (u, mid)
+                heapq.heappush(queue, (nd, v))
+        return u
+
+    def query(self, source, target):
+        """Shortest distance and path (as labels) from source to target; (inf, None) if unreachable."""
+        s, t = self.ids[source], self.ids[target]
+        dist = ({s: 0.0}, {t: 0.0})
+        predecessors = ({s: None}, {t: None})
+        queues = ([(0.0, s)], [(0.0, t)])
+        settled = (set(), set())
+        csrs = (self.up, self.down)
+        best = float('inf')
+        meeting_node = None
+        while queues[0] or queues[1]:
+            for side in (0, 1):
+                queue = queues[side]
+                if queue and queue[0][0] >= best:
+                    queue.clear()  # This side cannot improve the best distance any more
+                if not queue:
+                    continue
+                u = self._upward_search_step(csrs[side], queue, dist[side], predecessors[side], settled[side])
+                if u is not None and u in dist[1 - side]:
+                    total = dist[side][u] + dist[1 - side][u]
+                    if total < best:
+                        best = total
+                        meeting_node = u
+        if meeting_node is None:
+            return float('inf'), None
+        return best, self.labels[self._unpack_path(predecessors, meeting_node)].tolist()
+
+    def distance(self, source, target):
+        return self.query(source, target)[0]
+
+    def _middle_of(self, csr, node, neighbor):
+        """Middle node of the edge stored at `node` that leads to `neighbor`."""
+        offsets, targets, _, middles = csr
+        s, e = offsets[node], offsets[node + 1]
+        return int(middles[s + np.flatnonzero(targets[s:e] == neighbor)[0]])
+
+    def _unpack_path(self, predecessors, meeting_node):
+        """Turn the two search trees into a list of original edges (node ids)."""
+        edges = []  # (a, b, middle) in path order
+        node = meeting_node
+        while predecessors[0][node] is not None:
+            parent, mid = predecessors[0][node]
+            edges.append((parent, node, mid))
+            node = parent
+        edges.reverse()
+        node = meeting_node
+        while predecessors[1][node] is not None:
+            parent, mid = predecessors[1][node]
+            edges.append((node, parent, mid))
+            node = parent
+
+        path = [edges[0][0]] if edges else [meeting_node]
+        stack = list(reversed(edges))
+        while stack:
+            a, b, mid = stack.pop()
+            if mid == -1:
+                path.append(b)  # Original edge
+                continue
+            # Shortcut a -> b = (a -> mid) + (mid -> b). The middle was contracted before a and b,
+            # so a -> mid is stored in the backward graph at mid and mid -> b in the forward graph at mid.
+            stack.append((mid, b, self._middle_of(self.up, mid, b)))
+            stack.append((a, mid, self._middle_of(self.down, mid, a)))
+        return path
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+
+    # Example Usage
+    graph = {
+        'A': {'B': 1, 'C': 4},
+        'B': {'A': 1, 'C': 2, 'D': 5},
+        'C': {'A': 4, 'B': 2, 'D': 1},
+        'D': {'B': 5, 'C': 1}
+    }
+    ch = ContractionHierarchy.build(graph)
+    print(ch.query('A', 'D'))  # (4.0, ['A', 'B', 'C', 'D'])
+
+    # A 60 x 60 grid "road network" with random travel times
+    random.seed(1)
+    size = 60
+    grid = {(r, c): {} for r in range(size) for c in range(size)}
+    for r in range(size):
+        for c in range(size):
+            for nr, nc in ((r + 1, c), (r, c + 1)):
+                if nr < size and nc < size:
+                    weight = random.randint(1, 10)
+                    grid[(r, c)][(nr, nc)] = weight
+                    grid[(nr, nc)][(r, c)] = weight
+    begin = time.perf_counter()
+    road_ch = ContractionHierarchy.build(grid)
+    print("Preprocessing: %.1f s" % (time.perf_counter() - begin))
+
+    # Preprocess once, save, and answer queries from the loaded file
+    path = os.path.join(tempfile.mkdtemp(), 'grid_ch.npz')
+    road_ch.save(path)
+    loaded = ContractionHierarchy.load(path)
+    begin = time.perf_counter()
+    for _ in range(100):
+        loaded.query((random.randrange(size), random.randrange(size)), (random.randrange(size), random.randrange(size)))
+    print("Average query: %.2f ms" % ((time.perf_counter() - begin) * 10))
+
+#Explanation of the Code:
+# 1 - Preprocessing (build):
+# 1.1 - out_edges and in_edges hold the remaining graph in both directions. middle remembers which contracted node every shortcut replaces.
+# 1.2 - witness_search is a Dijkstra from u that skips v and stops after witness_limit settled nodes or when distances exceed the longest possible shortcut. If it cannot prove a witness, the shortcut is added anyway, which is always safe (it is a real path).
+# 1.3 - The nodes are kept in a heap by importance (edge difference + contracted neighbors). Importance changes as neighbors are contracted, so it is recomputed when a node is popped, and the node is pushed back if it is no longer the minimum (lazy update).
+# 1.4 - When v is contracted, its remaining outgoing edges go to the forward upward graph, and its remaining incoming edges go (reversed) to the backward upward graph. Then the shortcuts are added and v is removed.
+# 2 - Storage: Both upward graphs are CSR arrays with an extra middles array (-1 for original edges). save and load write them to a single .npz file.
+# 3 - Query:
+# 3.1 - query alternates one step of the forward search (on up) and one step of the backward search (on down). A search stops when its smallest key is not below the best distance found.
+# 3.2 - _unpack_path collects the edges of both search trees and replaces every shortcut with its two halves using an explicit stack, so the path contains only original edges.
+
+#Time Complexity:
+# 1 - Preprocessing: Depends on the graph. For road-like graphs it is roughly O(V log V) witness searches with bounded size.
+# 2 - Query: Only a few hundred nodes are settled on road networks with millions of nodes, which gives query times of microseconds to milliseconds.
+# 3 - Space: The augmented graph usually has less than twice the number of original edges.
@@ -0,0 +1,169 @@
+#A Count-Min Sketch is a probabilistic data structure used to estimate how often each element appears in a stream. Instead of a dictionary with one counter per distinct key, it keeps a small fixed table of counters, so memory does not grow with the number of keys.
+
+#Key Properties:
+# 1 - Never Underestimates: The estimated frequency of a key is always greater than or equal to its true frequency.
+# 2 - Bounded Error: With width w = ceil(e / epsilon) and depth d = ceil(ln(1 / delta)), the overestimate is at most epsilon * N (N = total count of the stream) with probability 1 - delta.
+# 3 - Mergeable: Sketches built with the same width, depth and hash functions on different shards can be added together.
+
+#How it Works:
+#The sketch is a table with d rows and w columns. Each row has its own hash function that maps a key to one column.
+# 1 - Update: For a key with count c, add c to one counter in every row (the column chosen by that row's hash function).
+# 2 - Query: Look at the same d counters and return the smallest one. Other keys can only increase a counter, so the minimum is the least polluted estimate.
+
+#Conservative Update:
+#The plain update adds c to all d counters, even to those that are already larger than the key's current estimate. Conservative update first computes the current estimate (the minimum), and then raises each counter only up to estimate + c. The estimates are still never below the true counts, but the error from other keys becomes much smaller, especially for heavy-tailed streams.
+
+#Python Implementation:
+#The hashing reuses the 64-bit hash functions from bloom_filters.py. Like the Bloom Filter, the d row hashes are derived from two hashes with double hashing: column_i = (h1 + i * h2) mod w.
+
+import math
+import struct
+
+import numpy as np
+
+from bloom_filters import GOLDEN_GAMMA, MASK64, _key_hash, _key_hash_array, _mix64, _mix64_array
+
+SERIAL_HEADER = struct.Struct('<4sIIQ')  # magic, width, depth, total
+SERIAL_MAGIC = b'CMS1'
+
+class CountMinSketch:
+    def __init__(self, width, depth):
+        self.width = width  # Number of columns (w)
+        self.depth = depth  # Number of rows / hash functions (d)
+        self.table = np.zeros((depth, width), dtype=np.int64)  # Counter table
+        self.total = 0  # Sum of all counts added (N)
+        self.rows = np.arange(depth)  # Row indexes, reused for fancy indexing
+
+    @classmethod
+    def from_error(cls, epsilon, delta):
+        """Create a sketch whose overestimate is at most epsilon * N with probability 1 - delta."""
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1.0 / delta)))
+
+    def _columns(self, item):
+        """Column of the item in every row."""
+        base = _key_hash(item)
+        h1 = _mix64(base)
+        h2 = _mix64(base ^ GOLDEN_GAMMA) | 1
+        return [((h1 + i * h2) & MASK64) % self.width for i in range(self.depth)]
+
+    def _columns_many(self, items):
+        """(len(items), depth) matrix of columns for a batch of items."""
+        return self._columns_from_hash(_key_hash_array(items))
+
+    def _columns_from_hash(self, base):
+        """(len(base), depth) matrix of columns for an array of 64-bit base hashes."""
+        h1 = _mix64_array(base)
+        h2 = _mix64_array(base ^ np.uint64(GOLDEN_GAMMA)) | np.uint64(1)
+        i = np.arange(self.depth, dtype=np.uint64)
+        return ((h1[:, None] + i[None, :] * h2[:, None]) % np.uint64(self.width)).astype(np.int64)
+
+    def add(self, item, count=1):
+        """Add `count` occurrences of the item using conservative update."""
+        columns = self._columns(item)
+        new_value = self.table[self.rows, columns].min() + count
+        # Only raise the counters that are below the new estimate
+        np.maximum.at(self.table, (self.rows, columns), new_value)
+        self.total += count
+
+    def add_many(self, items, counts=None):
+        """Add a batch of items (NumPy integer array or sequence of str/bytes) using conservative update."""
+        if len(items) == 0:
+            return
+        base = _key_hash_array(items)
+        counts = np.ones(len(base), dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+        # Aggregate duplicate keys in the batch first, so each key is updated once with its total count
+        base, inverse = np.unique(base, return_inverse=True)
+        totals = np.zeros(len(base), dtype=np.int64)
+        np.add.at(totals, inverse.ravel(), counts)  # Integer sums: np.bincount(weights=) would round through float64
+        counts = totals
+        columns = self._columns_from_hash(base)
+        new_values = self.table[self.rows[None, :], columns].min(axis=1) + counts
+        # Every key raises its own counters to at least its new estimate; np.maximum.at keeps the
+        # largest value when several keys of the batch share a counter
+        np.maximum.at(self.table, (np.broadcast_to(self.rows, columns.shape), columns),
+                      new_values[:, None])
+        self.total += int(counts.sum())
+
+    def estimate(self, item):
+        """Estimated frequency of the item (never below the true frequency)."""
+        return int(self.table[self.rows, self._columns(item)].min())
+
+    def estimate_many(self, items):
+        """Estimated frequencies of a batch of items as a NumPy int64 array."""
+        return self.table[self.rows[None, :], self._columns_many(items)].min(axis=1)
+
+    def merge(self, other):
+        """Merge another sketch (e.g. from another shard) into this one by adding the counters."""
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Cannot merge Count-Min sketches with different dimensions")
+        self.table += other.table
+        self.total += other.total
+        return self
+
+    def to_bytes(self):
+        """Serialize the sketch: header followed by the raw counter table."""
+        header = SERIAL_HEADER.pack(SERIAL_MAGIC, self.width, self.depth, self.total)
+        return header + self.table.astype('<i8').tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Rebuild a sketch written by to_bytes."""
+        magic, width, depth, total = SERIAL_HEADER.unpack_from(data)
+        if magic != SERIAL_MAGIC:
+            raise ValueError("Not a serialized Count-Min sketch")
+        sketch = cls(width, depth)
+        sketch.table = np.frombuffer(data, dtype='<i8', count=width * depth,
+                                     offset=SERIAL_HEADER.size).reshape(depth, width).astype(np.int64)
+        sketch.total = total
+        return sketch
+
+if __name__ == "__main__":
+    # Example Usage
+    cms = CountMinSketch.from_error(epsilon=0.001, delta=0.01)  # 2719 columns x 5 rows
+
+    # Single updates
+    cms.add("apple")
+    cms.add("apple")
+    cms.add("banana", count=5)
+    print(cms.estimate("apple"), cms.estimate("banana"), cms.estimate("cherry"))  # 2 5 0 (most likely)
+
+    # Batch updates on two shards of a Zipf-distributed stream
+    events = np.random.zipf(1.3, size=1000000) % 100000
+    shard_a = CountMinSketch(2719, 5)
+    shard_b = CountMinSketch(2719, 5)
+    shard_a.add_many(events[:500000])
+    shard_b.add_many(events[500000:])
+    shard_a.merge(shard_b)
+
+    # Compare with the exact counts of the five most frequent keys
+    keys, exact = np.unique(events, return_counts=True)
+    top = np.argsort(exact)[-5:][::-1]
+    print("Exact:    ", exact[top])
+    print("Estimated:", shard_a.estimate_many(keys[top]))
+
+    # Round trip through bytes
+    restored = CountMinSketch.from_bytes(shard_a.to_bytes())
+    print((restored.table == shard_a.table).all(), restored.total)  # True 1000000
+
+    # Single and batch updates hash keys identically, so they can be mixed
+    mixed = CountMinSketch(2719, 5)
+    mixed.add(7)
+    mixed.add_many([7])
+    mixed.add("pear", count=3)
+    mixed.add_many(np.array([7]), counts=[2 ** 60])
+    assert mixed.estimate(7) == 2 ** 60 + 2 and list(mixed.estimate_many([7, "pear"])) == [2 ** 60 + 2, 3]
+
+#Explanation of the Code:
+# 1 - Hashing:
+# 1.1 - _columns and _columns_many compute the column of a key in every row with double hashing on top of the hash functions from bloom_filters.py, so strings, bytes and NumPy integer arrays are supported.
+# 2 - Conservative Update:
+# 2.1 - add reads the d counters of the key, computes the new estimate (minimum + count) and raises each counter to at least that value with np.maximum.at.
+# 2.2 - add_many first merges duplicate keys of the batch with np.unique (on the 64-bit base hashes) and np.add.at on an int64 array, so even huge counts stay exact. Then every distinct key computes its new estimate from the table before the batch, and np.maximum.at applies all updates at once. When two keys of the batch share a counter, the larger target wins. Each key still ends up with counters at least as large as its true count, and no counter grows more than it would with the plain update.
+# 3 - Query: estimate and estimate_many return the minimum over the d rows.
+# 4 - Merge: Counters are added. The merged sketch never underestimates the combined stream.
+# 5 - Serialization: to_bytes writes a small header (magic, width, depth, total) and the counter table. from_bytes reads it back with np.frombuffer.
+
+#Time Complexity:
+# 1 - Update and Query: O(d) per item.
+# 2 - Merge: O(w * d).
+# 3 - Space: w * d counters (2719 x 5 counters of 8 bytes = about 106 KB for epsilon = 0.001 and delta = 0.01).
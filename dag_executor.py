@@ -0,0 +1,204 @@
+#topological_sort.topological_sort turns a dependency graph into one linear order, and running the tasks in that order one after another takes the SUM of all task durations. Many tasks do not depend on each other, though: every task whose dependencies are finished can run at the same time. A DAG executor starts each task as soon as its last dependency finishes, so with enough workers the total time (makespan) drops to the length of the critical path, the most expensive chain of dependent tasks.
+
+#Key Concepts:
+# 1 - Kahn's Bookkeeping: The in-degree of a task is the number of its dependencies that are not finished yet. Tasks with in-degree 0 are ready. When a task finishes, the in-degree of each of its dependents drops by one, and those that reach 0 become ready. This is exactly the queue of Kahn's algorithm, except that the "queue" is processed by several workers at once.
+# 2 - Critical Path Priority: When more tasks are ready than there are free workers, the executor has to choose. The best general rule is to start the task with the longest remaining chain behind it (its "bottom level": its own cost plus the most expensive path to a final task), because delaying it delays the end of the whole pipeline.
+# 3 - Bounded Concurrency: At most max_workers tasks run at the same time, which limits memory, connections or CPU use.
+# 4 - Instrumentation: The executor records when every task started and finished. The measured durations can be passed as costs to the next run, so the priorities follow the real critical path.
+
+#Python Implementation:
+#The tasks are a dictionary {name: callable} and the dependencies are edges (u, v) = "u must finish before v starts", the same format as topological_sort.py. run_dag runs the callables on a thread pool (I/O-bound tasks, or NumPy code that releases the GIL) or a process pool (CPU-bound Python code; the callables must then be picklable, e.g. module-level functions or functools.partial). run_dag_async does the same for coroutine functions on an asyncio loop.
+
+import asyncio
+import heapq
+import time
+from collections import defaultdict, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import partial
+
+TaskTiming = namedtuple('TaskTiming', ['start', 'end'])  # Seconds since the start of the run
+
+def bottom_levels(vertices, edges, costs=None):
+    """
+    Cost of the most expensive path from every task to a final task, including the task itself.
+
+    :param costs: {task: estimated cost}; missing tasks cost 1
+    :return: ({task: bottom level}, {task: list of dependents}, {task: in-degree})
+    :raises ValueError: if an edge names a task that is not in vertices, or the graph has a cycle
+    """
+    costs = costs or {}
+    successors = defaultdict(list)
+    in_degree = {v: 0 for v in vertices}
+    for u, v in edges:
+        for task in (u, v):
+            if task not in in_degree:
+                raise ValueError("Edge (%r, %r) names an unknown task: %r" % (u, v, task))
+        successors[u].append(v)
+        in_degree[v] += 1
+    # Kahn's algorithm (as in topological_sort.py), then the levels in reverse topological order
+    remaining = dict(in_degree)
+    order = [v for v in vertices if remaining[v] == 0]
+    for node in order:  # order grows while it is traversed, like the queue
+        for w in successors[node]:
+            remaining[w] -= 1
+            if remaining[w] == 0:
+                order.append(w)
+    if len(order) != len(in_degree):
+        raise ValueError("Graph has a cycle, the tasks cannot be scheduled.")
+    level = {}
+    for node in reversed(order):
+        level[node] = costs.get(node, 1) + max((level[w] for w in successors[node]), default=0)
+    return level, successors, in_degree
+
+def critical_path(vertices, edges, costs=None):
+    """The most expensive chain of dependent tasks: (total cost, list of tasks)."""
+    level, successors, in_degree = bottom_levels(vertices, edges, costs)
+    if not level:
+        return 0, []
+    node = max((v for v in in_degree if in_degree[v] == 0), key=level.__getitem__)
+    path = [node]
+    while successors[node]:
+        node = max(successors[node], key=level.__getitem__)
+        path.append(node)
+    return level[path[0]], path
+
+def _timed(function):
+    """Call function in the thread or worker process that runs it; returns (start, result, end) of perf_counter."""
+    start = time.perf_counter()
+    result = function()
+    return start, result, time.perf_counter()
+
+async def _timed_async(function):
+    start = time.perf_counter()
+    result = await function()
+    return start, result, time.perf_counter()
+
+class _Scheduler:
+    """Ready heap and in-degree counters shared by the thread/process and asyncio executors."""
+
+    def __init__(self, tasks, edges, costs, priority):
+        level, self.successors, self.in_degree = bottom_levels(list(tasks), edges, costs)
+        # Ties (and priority=None) keep the order of the tasks dictionary, so the run is deterministic
+        self.rank = {v: (-level[v] if priority else 0, i) for i, v in enumerate(tasks)}
+        self.ready = [self.rank[v] + (v,) for v in tasks if self.in_degree[v] == 0]
+        heapq.heapify(self.ready)
+        self.begin = time.perf_counter()
+        self.timings = {}
+
+    def pop(self):
+        return heapq.heappop(self.ready)[-1]
+
+    def finish(self, node, start, end):
+        """Record the times measured by _timed and release the dependents of node."""
+        self.timings[node] = TaskTiming(start - self.begin, end - self.begin)
+        for w in self.successors[node]:
+            self.in_degree[w] -= 1
+            if self.in_degree[w] == 0:
+                heapq.heappush(self.ready, self.rank[w] + (w,))
+
+def run_dag(tasks, edges, max_workers=4, backend='thread', costs=None, priority=True):
+    """
+    Run every task as soon as all its dependencies are finished.
+
+    :param tasks: {name: callable without arguments}
+    :param edges: List of (u, v): u must finish before v starts
+    :param max_workers: Maximum number of tasks running at the same time
+    :param backend: 'thread' or 'process'
+    :param costs: {name: estimated duration} for the critical path priority (default 1 per task),
+                  e.g. the durations measured in a previous run
+    :param priority: True = start ready tasks with the longest critical path first, False = in dictionary order
+    :return: ({name: return value}, {name: TaskTiming})
+    :raises ValueError: if an edge names an unknown task or the dependencies have a cycle; the first exception of a task is re-raised after the
+                        running tasks finish (tasks that did not start yet are not started)
+    """
+    if backend not in ('thread', 'process'):
+        raise ValueError("backend must be 'thread' or 'process'")
+    scheduler = _Scheduler(tasks, edges, costs, priority)
+    pool_class = ThreadPoolExecutor if backend == 'thread' else ProcessPoolExecutor
+    results = {}
+    error = None
+    with pool_class(max_workers=max_workers) as pool:
+        running = {}
+        while running or (scheduler.ready and error is None):
+            while scheduler.ready and len(running) < max_workers and error is None:
+                node = scheduler.pop()
+                running[pool.submit(partial(_timed, tasks[node]))] = node
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = running.pop(future)
+                if future.exception() is not None:
+                    error = error or future.exception()
+                    continue
+                start, results[node], end = future.result()
+                scheduler.finish(node, start, end)
+    if error is not None:
+        raise error
+    return results, scheduler.timings
+
+async def run_dag_async(tasks, edges, max_workers=4, costs=None, priority=True):
+    """Like run_dag for coroutine functions ({name: async function without arguments}) on the running loop."""
+    scheduler = _Scheduler(tasks, edges, costs, priority)
+    results = {}
+    error = None
+    running = {}
+    while running or (scheduler.ready and error is None):
+        while scheduler.ready and len(running) < max_workers and error is None:
+            node = scheduler.pop()
+            running[asyncio.ensure_future(_timed_async(tasks[node]))] = node
+        done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        for future in done:
+            node = running.pop(future)
+            if future.exception() is not None:
+                error = error or future.exception()
+                continue
+            start, results[node], end = future.result()
+            scheduler.finish(node, start, end)
+    if error is not None:
+        raise error
+    return results, scheduler.timings
+
+if __name__ == "__main__":
+    def work(name, seconds):
+        time.sleep(seconds)  # Stands for I/O or a call that releases the GIL
+        return name
+
+    # Example Usage: the graph of topological_sort.py, with a duration (in seconds) for every task
+    durations = {'A': 0.2, 'B': 0.1, 'C': 0.3, 'D': 0.2, 'E': 0.1, 'F': 0.2}
+    edges = [('A', 'D'), ('B', 'D'), ('C', 'E'), ('D', 'E'), ('E', 'F')]
+    tasks = {name: partial(work, name, seconds) for name, seconds in durations.items()}
+    print("Critical path:", critical_path(list(durations), edges, durations))  # (0.7, ['A', 'D', 'E', 'F'])
+    print("Serial time: %.1f s" % sum(durations.values()))  # 1.1 s
+    results, timings = run_dag(tasks, edges, max_workers=3, costs=durations)
+    print("Makespan: %.1f s" % max(timing.end for timing in timings.values()))  # 0.7 s
+    for name, timing in sorted(timings.items(), key=lambda item: item[1].start):
+        print("%s %.2f-%.2f" % (name, timing.start, timing.end))
+
+    # Priority matters with few workers: a long chain (X1 -> X2 -> X3) and four independent short tasks
+    durations = {'S1': 0.1, 'S2': 0.1, 'S3': 0.1, 'S4': 0.1, 'X1': 0.1, 'X2': 0.1, 'X3': 0.1}
+    edges = [('X1', 'X2'), ('X2', 'X3')]
+    tasks = {name: partial(work, name, seconds) for name, seconds in durations.items()}
+    for use_priority in (False, True):
+        _, timings = run_dag(tasks, edges, max_workers=2, costs=durations, priority=use_priority)
+        print("priority=%s: makespan %.1f s" % (use_priority, max(t.end for t in timings.values())))
+    # priority=False: makespan 0.5 s
+    # priority=True: makespan 0.4 s
+
+    # The same pipeline with coroutines
+    async def sleep_task(name, seconds):
+        await asyncio.sleep(seconds)
+        return name
+    coroutines = {name: partial(sleep_task, name, seconds) for name, seconds in durations.items()}
+    results, timings = asyncio.run(run_dag_async(coroutines, edges, max_workers=2, costs=durations))
+    print("asyncio makespan: %.1f s" % max(t.end for t in timings.values()))  # 0.4 s
+
+#Explanation of the Code:
+# 1 - bottom_levels builds the adjacency list and in-degrees like topological_sort (an edge with a task that is not in the tasks dictionary raises a ValueError naming it), checks for cycles with Kahn's algorithm, and computes the bottom level of every task in reverse topological order: its cost plus the largest bottom level of its dependents.
+# 2 - critical_path starts at the task without dependencies that has the largest bottom level and always follows the dependent with the largest bottom level.
+# 3 - _Scheduler keeps the ready tasks in a heap ordered by (-bottom level, position in the tasks dictionary). pop takes the most critical ready task; finish stores its timing and releases the dependents whose in-degree drops to 0 (Kahn's step).
+# 4 - run_dag wraps every task in _timed, which reads the clock in the thread or worker process right before and after the call, so a task that waits in the pool queue is not counted as running. time.perf_counter is a system-wide monotonic clock, so the times of worker processes are comparable with the scheduler's begin.
+# 5 - run_dag keeps submitting ready tasks until max_workers are running, then waits until at least one of them is done (FIRST_COMPLETED), finishes it, and repeats. If a task fails, no new tasks are submitted; the running ones are waited for and the exception is re-raised.
+# 6 - run_dag_async is the same loop (with _timed_async) with asyncio.wait on the event loop, so thousands of I/O-bound coroutines can run without threads.
+
+#Time Complexity:
+# 1 - Scheduling overhead: O(V log V + E) for the whole run (every task enters and leaves the heap once, every edge is followed once).
+# 2 - Makespan: with enough workers, the length of the critical path (plus the scheduling overhead) instead of the sum of all durations. With p workers, list scheduling guarantees at most (sum of durations) / p + critical path.
@@ -0,0 +1,215 @@
+#Dial's algorithm and the radix heap are two versions of Dijkstra's algorithm for graphs whose edge weights are small non-negative integers (for example network latencies in milliseconds, bounded by some C). The order in which Dijkstra settles the nodes stays the same. Only the priority queue changes: the binary heap (heapq) is replaced by a queue that uses the fact that the keys are integers.
+
+#Why it Helps:
+#With heapq every push creates a (distance, node) tuple and costs O(log V) comparisons of Python tuples. For small integer keys we can do better:
+# 1 - Monotone Keys: Dijkstra always extracts keys in non-decreasing order, and every key that is inserted is between the current minimum d and d + C.
+# 2 - Buckets Instead of Comparisons: Nodes can be put in buckets indexed by their distance, and the queue only stores node ids (no tuples). The distance of a node is read from the dist array.
+
+#Dial's Algorithm (Bucket Queue):
+# 1 - Keep C + 1 buckets, used as a circular array: a node with distance d is in bucket d mod (C + 1). Since all keys in the queue are between d and d + C, no two different distances share a bucket.
+# 2 - Scan the buckets in order of distance. Every node taken from bucket d is settled with distance d (old entries of nodes whose distance has decreased are skipped).
+# 3 - Cost: O(E + D), where D is the largest shortest-path distance, because every distance value is scanned once. It is the fastest choice when C is small.
+
+#Radix Heap:
+# 1 - Keep about log2(C) + 2 buckets with ranges of width 1, 1, 2, 4, 8, ..., starting at the last extracted minimum.
+# 2 - Insert and decrease-key put a node in the bucket whose range contains its distance (searching downward from where the node is).
+# 3 - Extract-min: if bucket 0 is empty, take the first non-empty bucket i, find its minimum and split bucket i's range into new ranges for buckets 0 to i - 1. Every node of bucket i moves to a lower bucket.
+# 4 - Cost: A node can only move down, so it moves at most O(log C) times. Total O(E + V log C), independent of the distance values.
+
+#Python Implementation:
+#The graph is a CSRGraph (see csr_graph.py) with integer weights. dijkstra_integer lets the caller choose the queue.
+
+import heapq
+import time
+from array import array
+
+import numpy as np
+
+from csr_graph import CSRGraph, csr_dijkstra
+
+INF = 1 << 62  # Larger than any real distance
+
+def _check_weights(graph, max_weight):
+    """Validate that all weights are integers between 0 and C; returns C."""
+    if graph.weights.dtype.kind not in 'iu':
+        raise ValueError("Edge weights must be integers")
+    largest = int(graph.weights.max(initial=0))
+    if graph.num_edges and int(graph.weights.min()) < 0:
+        raise ValueError("Edge weights must be non-negative")
+    if max_weight is None:
+        return largest
+    if largest > max_weight:
+        raise ValueError("Edge weight %d is larger than max_weight=%d" % (largest, max_weight))
+    return max_weight
+
+def _distances_to_array(dist):
+    """int64 NumPy array of distances, with -1 for unreachable nodes."""
+    result = np.frombuffer(dist, dtype=np.int64).copy()
+    result[result == INF] = -1
+    return result
+
+def dial_dijkstra(graph, start, max_weight=None):
+    """Dijkstra with Dial's circular bucket queue; returns int64 distances (-1 = unreachable)."""
+    num_buckets = _check_weights(graph, max_weight) + 1
+    offsets = memoryview(graph.offsets)
+    targets = memoryview(graph.targets)
+    weights = memoryview(graph.weights)
+    dist = array('q', [INF]) * graph.num_nodes
+    settled = bytearray(graph.num_nodes)
+    buckets = [[] for _ in range(num_buckets)]  # Node ids only, no (distance, node) tuples
+
+    dist[start] = 0
+    buckets[0].append(start)
+    pending = 1  # Number of entries (including outdated ones) in all buckets
+    d = 0
+    while pending:
+        bucket = buckets[d % num_buckets]
+        while bucket:  # 0-weight edges may add nodes to the bucket we are emptying
+            u = bucket.pop()
+            pending -= 1
+            if settled[u] or dist[u] != d:
+                continue  # Outdated entry: u was moved to a smaller distance
+            settled[u] = 1
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                distance = d + weights[i]
+                if distance < dist[v]:
+                    dist[v] = distance
+                    buckets[distance % num_buckets].append(v)
+                    pending += 1
+        d += 1
+    return _distances_to_array(dist)
+
+def radix_heap_dijkstra(graph, start, max_weight=None):
+    """Dijkstra with a radix heap (O(E + V log C)); returns int64 distances (-1 = unreachable)."""
+    c = _check_weights(graph, max_weight)
+    num_buckets = c.bit_length() + 2
+    offsets = memoryview(graph.offsets)
+    targets = memoryview(graph.targets)
+    weights = memoryview(graph.weights)
+    dist = array('q', [INF]) * graph.num_nodes
+    where = array('q', [-1]) * graph.num_nodes  # Bucket of every queued node, -1 = not queued
+    settled = bytearray(graph.num_nodes)
+    buckets = [set() for _ in range(num_buckets)]
+
+    # bounds[i] is the smallest key of bucket i; bucket widths are 1, 1, 2, 4, ...
+    bounds = [0] * (num_buckets + 1)
+    for i in range(1, num_buckets):
+        bounds[i] = bounds[i - 1] + (1 << max(i - 2, 0))
+    bounds[num_buckets] = INF + 1  # The last bucket is unbounded
+
+    dist[start] = 0
+    buckets[0].add(start)
+    where[start] = 0
+    size = 1
+    while size:
+        # Extract-min
+        i = 0
+        while not buckets[i]:
+            i += 1
+        if i > 0:
+            # Split the range of bucket i over buckets 0..i-1 and move its nodes down
+            items = buckets[i]
+            buckets[i] = set()
+            low = min(dist[x] for x in items)
+            high = bounds[i + 1]
+            bounds[0] = low
+            for j in range(1, i + 1):
+                bounds[j] = min(low + (1 << (j - 1)), high)
+            for x in items:
+                j = i
+                key = dist[x]
+                while bounds[j] > key:
+                    j -= 1
+                buckets[j].add(x)
+                where[x] = j
+        u = buckets[0].pop()
+        where[u] = -1
+        size -= 1
+        settled[u] = 1
+        d = dist[u]
+
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            distance = d + weights[e]
+            if distance < dist[v] and not settled[v]:
+                dist[v] = distance
+                j = where[v]
+                if j == -1:
+                    j = num_buckets - 1  # New node: search down from the top bucket
+                    size += 1
+                else:
+                    buckets[j].discard(v)  # Decrease-key: search down from its current bucket
+                while bounds[j] > distance:
+                    j -= 1
+                buckets[j].add(v)
+                where[v] = j
+    return _distances_to_array(dist)
+
+def heap_dijkstra(graph, start):
+    """Reference version with heapq (csr_graph.csr_dijkstra); returns int64 distances (-1 = unreachable)."""
+    dist = csr_dijkstra(graph, start)
+    dist[np.isinf(dist)] = -1
+    return dist.astype(np.int64)
+
+def dijkstra_integer(graph, start, max_weight=None, queue='radix'):
+    """
+    Dijkstra's algorithm for non-negative integer weights bounded by C.
+
+    :param graph: CSRGraph with integer weights
+    :param start: Source node id
+    :param max_weight: The bound C (default: the largest weight in the graph)
+    :param queue: 'dial' (bucket queue), 'radix' (radix heap) or 'heap' (heapq)
+    :return: int64 NumPy array of distances, -1 for unreachable nodes
+    """
+    if queue == 'dial':
+        return dial_dijkstra(graph, start, max_weight)
+    if queue == 'radix':
+        return radix_heap_dijkstra(graph, start, max_weight)
+    if queue == 'heap':
+        _check_weights(graph, max_weight)
+        return heap_dijkstra(graph, start)
+    raise ValueError("queue must be 'dial', 'radix' or 'heap'")
+
+def benchmark(num_nodes=250000, num_edges=1000000, max_weight=100, seed=0):
+    """Time the three queues on a random graph and check that they agree."""
+    rng = np.random.default_rng(seed)
+    graph = CSRGraph.from_edges(rng.integers(0, num_nodes, num_edges), rng.integers(0, num_nodes, num_edges),
+                                rng.integers(0, max_weight + 1, num_edges), num_nodes=num_nodes)
+    results = {}
+    for queue in ('heap', 'dial', 'radix'):
+        begin = time.perf_counter()
+        results[queue] = dijkstra_integer(graph, 0, max_weight, queue)
+        print("%-5s %.2f s" % (queue, time.perf_counter() - begin))
+    print("Same distances:", all(np.array_equal(results['heap'], r) for r in results.values()))
+
+if __name__ == "__main__":
+    # Example Usage: latencies in milliseconds
+    graph = CSRGraph.from_adjacency({
+        'A': {'B': 1, 'C': 4},
+        'B': {'A': 1, 'C': 2, 'D': 5},
+        'C': {'A': 4, 'B': 2, 'D': 1},
+        'D': {'B': 5, 'C': 1}
+    })
+    for queue in ('dial', 'radix', 'heap'):
+        print(queue, dijkstra_integer(graph, graph.node_id('A'), queue=queue))  # [0 1 3 4]
+
+    # Million-edge comparison
+    benchmark()
+
+#Explanation of the Code:
+# 1 - _check_weights verifies that the weights are non-negative integers and returns the bound C (either given or the largest weight).
+# 2 - dial_dijkstra:
+# 2.1 - buckets is a list of C + 1 Python lists that only hold node ids. The current distance d walks up one value at a time, and bucket d mod (C + 1) is emptied.
+# 2.2 - Instead of a decrease-key, a node is simply appended again. The old entry is skipped later because dist[u] no longer equals d.
+# 2.3 - pending counts the entries in all buckets, so the loop stops as soon as the queue is empty (no scanning past the largest distance).
+# 3 - radix_heap_dijkstra:
+# 3.1 - bounds holds the smallest key of every bucket. where[v] remembers the bucket of a queued node, so a decrease-key removes it from that bucket and searches downward from there.
+# 3.2 - When bucket 0 is empty, the first non-empty bucket i is split: its minimum becomes the new bounds[0], buckets 0..i-1 get widths 1, 1, 2, 4, ... inside the old range of bucket i, and every node of bucket i moves to a lower bucket.
+# 4 - heap_dijkstra is the heapq version from csr_graph.py, used as the reference in benchmark.
+# 5 - All three versions read the graph through memoryview or slices of the CSR arrays and store distances in a compact array('q').
+
+#Time Complexity:
+# 1 - heapq: O((V + E) log V).
+# 2 - Dial: O(E + D), where D is the largest distance (at most (V - 1) * C).
+# 3 - Radix heap: O(E + V log C).
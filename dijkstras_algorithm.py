@@ -50,17 +50,123 @@ def dijkstra(graph, start):
     
     return shortest_paths
 
-# Example graph: an adjacency dictionary where keys are nodes and values are dictionaries of neighbors with edge weights
-graph = {
-    'A': {'B': 1, 'C': 4},
-    'B': {'A': 1, 'C': 2, 'D': 5},
-    'C': {'A': 4, 'B': 2, 'D': 1},
-    'D': {'B': 5, 'C': 1}
-}
+# Point-to-point version: stops as soon as the target is settled and returns the path
+def dijkstra_path(graph, start, target):
+    priority_queue = [(0, start)]  # (distance, node)
+    shortest_paths = {start: 0}
+    predecessors = {start: None}  # Node we came from on the best known path
+    visited = set()
+    
+    while priority_queue:
+        current_distance, current_node = heapq.heappop(priority_queue)
+        if current_node in visited:
+            continue
+        
+        # The target is settled: its distance is final, so stop here
+        if current_node == target:
+            return current_distance, _reconstruct_path(predecessors, target)
+        
+        visited.add(current_node)
+        for neighbor, weight in graph[current_node].items():
+            if neighbor in visited:
+                continue
+            distance = current_distance + weight
+            if neighbor not in shortest_paths or distance < shortest_paths[neighbor]:
+                shortest_paths[neighbor] = distance
+                predecessors[neighbor] = current_node
+                heapq.heappush(priority_queue, (distance, neighbor))
+    
+    # The target is not reachable from the start node
+    return float('inf'), None
+
+# Follow the predecessors back from the target to the start
+def _reconstruct_path(predecessors, node):
+    path = []
+    while node is not None:
+        path.append(node)
+        node = predecessors[node]
+    path.reverse()
+    return path
+
+# Reverse adjacency dictionary: an edge u -> v with weight w becomes v -> u with weight w
+def reverse_graph(graph):
+    reverse = {node: {} for node in graph}
+    for node, neighbors in graph.items():
+        for neighbor, weight in neighbors.items():
+            reverse.setdefault(neighbor, {})[node] = weight
+    return reverse
+
+# Bidirectional Dijkstra: one search from the start (forward) and one from the target (backward)
+def bidirectional_dijkstra(graph, start, target, reverse=None):
+    if start == target:
+        return 0, [start]
+    if reverse is None:
+        reverse = reverse_graph(graph)  # Pass it in when running many queries on the same graph
+    
+    # Index 0 = forward search on graph, index 1 = backward search on the reversed graph
+    adjacency = (graph, reverse)
+    queues = ([(0, start)], [(0, target)])
+    distances = ({start: 0}, {target: 0})
+    predecessors = ({start: None}, {target: None})
+    visited = (set(), set())
+    
+    best_distance = float('inf')  # Length of the best complete path found so far (mu)
+    meeting_node = None
+    
+    while queues[0] and queues[1]:
+        # Stopping criterion: no path through an unsettled node can beat the best one found
+        if queues[0][0][0] + queues[1][0][0] >= best_distance:
+            break
+        
+        # Expand the side with the smaller queue
+        side = 0 if len(queues[0]) <= len(queues[1]) else 1
+        current_distance, current_node = heapq.heappop(queues[side])
+        if current_node in visited[side]:
+            continue
+        visited[side].add(current_node)
+        
+        for neighbor, weight in adjacency[side].get(current_node, {}).items():
+            distance = current_distance + weight
+            if neighbor not in distances[side] or distance < distances[side][neighbor]:
+                distances[side][neighbor] = distance
+                predecessors[side][neighbor] = current_node
+                heapq.heappush(queues[side], (distance, neighbor))
+            # Every edge that reaches a node seen by the other search is a candidate path
+            if neighbor in distances[1 - side]:
+                total = distances[side][neighbor] + distances[1 - side][neighbor]
+                if total < best_distance:
+                    best_distance = total
+                    meeting_node = neighbor
+    
+    if meeting_node is None:
+        return float('inf'), None
+    
+    # Forward half: start -> meeting node, backward half: meeting node -> target
+    path = _reconstruct_path(predecessors[0], meeting_node)
+    node = predecessors[1][meeting_node]
+    while node is not None:
+        path.append(node)
+        node = predecessors[1][node]
+    return best_distance, path
+
+if __name__ == "__main__":
+    # Example graph: an adjacency dictionary where keys are nodes and values are dictionaries of neighbors with edge weights
+    graph = {
+        'A': {'B': 1, 'C': 4},
+        'B': {'A': 1, 'C': 2, 'D': 5},
+        'C': {'A': 4, 'B': 2, 'D': 1},
+        'D': {'B': 5, 'C': 1}
+    }
+
+    # Find the shortest paths from node 'A'
+    shortest_paths = dijkstra(graph, 'A')
+    print(shortest_paths)
+
+    # Find the shortest route from 'A' to 'D' only
+    print(dijkstra_path(graph, 'A', 'D'))
 
-# Find the shortest paths from node 'A'
-shortest_paths = dijkstra(graph, 'A')
-print(shortest_paths)
+    # Same query, searching from both ends
+    print(bidirectional_dijkstra(graph, 'A', 'D'))
 
 #Explanation of the Code:
 # 1 - Graph Representation: The graph is represented as an adjacency dictionary where each key is a node, and each value is a dictionary representing the neighboring nodes and their edge weights.
@@ -68,10 +174,20 @@ print(shortest_paths)
 # 3 - Shortest Path Tracking: A dictionary shortest_paths keeps track of the shortest distance from the start node to every other node in the graph.
 # 4 - Processing: For each node, we examine its neighbors, calculate the tentative distances, and update the shortest path if a shorter one is found.
 # 5 - Result: The algorithm returns a dictionary with the shortest path distances from the starting node to all other nodes.
+# 6 - Point-to-Point Queries (dijkstra_path):
+# 6.1 - When a node is popped from the priority queue for the first time, its distance is final. So once the target is popped, the search can stop, without settling the rest of the graph.
+# 6.2 - The predecessors dictionary stores, for every node, the node it was reached from on the best known path. _reconstruct_path follows it back from the target and reverses the list.
+# 7 - Bidirectional Dijkstra (bidirectional_dijkstra):
+# 7.1 - A forward search runs from the start on the graph, and a backward search runs from the target on the reversed graph (reverse_graph). Each step expands the side with the smaller queue.
+# 7.2 - Whenever an edge reaches a node that the other search has already labeled, start -> node -> target is a complete path, and the best one is kept as best_distance.
+# 7.3 - Stopping criterion: when the sum of the smallest keys of both queues is at least best_distance, no unsettled node can be on a shorter path, so best_distance is optimal.
+# 7.4 - Both searches explore a "ball" around their endpoint with roughly half the radius, so on large road-like graphs they settle about half (or fewer) of the nodes of a one-sided search.
 
 #Output Example:
 #For the graph provided, the output would look like:
 #{'A': 0, 'B': 1, 'C': 3, 'D': 4}
+#(4, ['A', 'B', 'C', 'D'])
+#(4, ['A', 'B', 'C', 'D'])
 #This means:
 #The shortest distance from A to A is 0.
 #The shortest distance from A to B is 1.
@@ -0,0 +1,175 @@
+#Dinic's algorithm computes the maximum flow of a network much faster than Edmonds-Karp. The Graph class of edmonds_karp_algorithm.py (and network_flow_algorithm.py) also stores the capacities in a V x V matrix: its BFS looks at all V vertices for every dequeued vertex (O(V^2) per search), and a network with 100,000 vertices would need 10^10 matrix entries before the first search even starts. Here the network is stored as an edge array, so memory and BFS time grow with the number of edges.
+
+#Key Concepts:
+# 1 - Residual Graph: Every edge u -> v with capacity c becomes two arcs: a forward arc u -> v with residual capacity c - flow, and a reverse arc v -> u with residual capacity flow (pushing flow back cancels it). Pushing f units on an arc subtracts f from it and adds f to its reverse.
+# 2 - Level Graph: A BFS from the source over arcs with residual capacity > 0 gives every vertex its distance (level). Only arcs from level d to level d + 1 are used in the phase, so every path found is a shortest augmenting path.
+# 3 - Blocking Flow: In each phase, depth-first searches push flow along the level graph until no source-sink path is left in it. Each phase increases the distance from source to sink, so there are at most V phases.
+# 4 - Current-Arc Pointers: Each vertex remembers the first of its arcs that may still be useful in this phase. An arc that is saturated or leads to a dead end is never looked at again in the phase, so a phase costs O(V * E) in the worst case instead of exponential time.
+# 5 - Min Cut: When no augmenting path exists, the vertices reachable from the source in the residual graph form the source side S of a minimum cut. The edges from S to the rest are saturated, and their total capacity equals the maximum flow (max-flow min-cut theorem).
+
+#Python Implementation:
+#The network is given as the number of vertices n and three arrays: u, v (edge endpoints) and capacity. ResidualGraph stores all 2E arcs sorted by their tail (CSR format, as in csr_graph.py) with NumPy: head vertex, residual capacity, and the position of the reverse arc. The BFS works on whole frontiers with NumPy; the blocking-flow DFS is an explicit-stack loop (no recursion) over the same arrays.
+
+from collections import namedtuple
+
+import numpy as np
+
+FlowResult = namedtuple('FlowResult', ['flow_value', 'edge_flow', 'source_side', 'cut_edges'])
+
+class ResidualGraph:
+    def __init__(self, n, u, v, capacity):
+        """
+        :param n: Number of vertices (0 to n - 1)
+        :param u, v, capacity: Edge arrays; parallel edges and integer or float capacities are allowed
+        """
+        self.n = n
+        self.u = np.asarray(u, dtype=np.int64)
+        self.v = np.asarray(v, dtype=np.int64)
+        capacity = np.asarray(capacity)
+        self.capacity = capacity.astype(np.int64 if np.issubdtype(capacity.dtype, np.integer) else np.float64)
+        m = len(self.u)
+        if not len(self.v) == len(self.capacity) == m:
+            raise ValueError("u, v and capacity must have the same length")
+        if m and (self.capacity.min() < 0 or min(self.u.min(), self.v.min()) < 0
+                  or max(self.u.max(), self.v.max()) >= n):
+            raise ValueError("Capacities must be non-negative and vertices in 0..n-1")
+
+        # Arc k < m is the forward arc of edge k, arc k + m its reverse; sort all arcs by tail (CSR)
+        tails = np.concatenate((self.u, self.v))
+        order = np.argsort(tails, kind='stable')
+        self.offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(tails, minlength=n), out=self.offsets[1:])
+        self.head = np.concatenate((self.v, self.u))[order]
+        self.residual = np.concatenate((self.capacity, np.zeros_like(self.capacity)))[order]
+        position = np.empty(2 * m, dtype=np.int64)
+        position[order] = np.arange(2 * m)  # Original arc number -> CSR position
+        self.reverse = position[(order + m) % max(2 * m, 1)]  # CSR position of the reverse of every arc
+        self.forward = position[:m]  # CSR position of the forward arc of every edge
+
+    def levels(self, source, sink=None):
+        """BFS distances from source over arcs with residual capacity (-1 = unreachable); stops at sink's level."""
+        level = np.full(self.n, -1, dtype=np.int64)
+        level[source] = 0
+        frontier = np.array([source], dtype=np.int64)
+        depth = 0
+        while len(frontier):
+            starts = self.offsets[frontier]
+            counts = self.offsets[frontier + 1] - starts
+            # Positions of all arcs of the frontier (as in csr_graph._expand_frontier)
+            arcs = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(int(counts.sum()))
+            heads = self.head[arcs[self.residual[arcs] > 0]]
+            frontier = np.unique(heads[level[heads] == -1])
+            depth += 1
+            level[frontier] = depth
+            if sink is not None and level[sink] != -1:
+                break
+        return level
+
+    def edge_flow(self):
+        """Flow on every input edge: capacity - residual capacity of its forward arc."""
+        return self.capacity - self.residual[self.forward]
+
+    def result(self, source):
+        """The FlowResult of the current (maximum) flow, with the min cut from a residual BFS."""
+        source_side = self.levels(source) >= 0
+        edge_flow = self.edge_flow()
+        cut_edges = np.flatnonzero(source_side[self.u] & ~source_side[self.v] & (self.capacity > 0))
+        flow_value = self.capacity[cut_edges].sum()  # Max-flow min-cut: the cut capacity is the flow
+        return FlowResult(flow_value.item(), edge_flow, source_side, cut_edges)
+
+def _blocking_flow(graph, source, sink, level):
+    """Push flow along the level graph until it has no source-sink path; returns the amount pushed."""
+    head = graph.head.tolist()
+    reverse = graph.reverse.tolist()
+    end = graph.offsets[1:].tolist()
+    current = graph.offsets[:-1].tolist()  # Current-arc pointer of every vertex
+    level = level.tolist()
+    residual = memoryview(graph.residual)  # Same memory as the NumPy array, fast single-element access
+    total = 0
+    path = []  # Arcs from source to v
+    v = source
+    while True:
+        if v == sink:
+            pushed = min(residual[a] for a in path)
+            saturated = len(path)
+            for i, a in enumerate(path):
+                residual[a] -= pushed
+                residual[reverse[a]] += pushed
+                if residual[a] == 0 and i < saturated:
+                    saturated = i
+            total += pushed
+            del path[saturated:]  # Continue from the tail of the first saturated arc
+            v = head[path[-1]] if path else source
+            continue
+        i, next_level = current[v], level[v] + 1
+        while i < end[v] and (residual[i] <= 0 or level[head[i]] != next_level):
+            i += 1
+        current[v] = i
+        if i < end[v]:
+            path.append(i)  # Advance
+            v = head[i]
+        elif v == source:
+            return total
+        else:
+            level[v] = -1  # Dead end: no arc of the phase enters v again
+            path.pop()  # Retreat and skip the arc that led here
+            v = head[path[-1]] if path else source
+            current[v] += 1
+
+def dinic(n, u, v, capacity, source, sink):
+    """
+    Maximum flow from source to sink with Dinic's algorithm.
+
+    :return: FlowResult(flow_value, edge_flow, source_side, cut_edges):
+             edge_flow[i] is the flow on edge i, source_side is a bool array (the source side of a minimum cut),
+             cut_edges are the positions of the edges of that cut (all saturated)
+    """
+    if source == sink:
+        raise ValueError("source and sink must be different")
+    graph = ResidualGraph(n, u, v, capacity)
+    while True:
+        level = graph.levels(source, sink)
+        if level[sink] == -1:
+            break
+        _blocking_flow(graph, source, sink, level)
+    return graph.result(source)
+
+if __name__ == "__main__":
+    import time
+
+    # Example Usage: the network of edmonds_karp_algorithm.py
+    u = [0, 0, 1, 1, 2, 2, 3, 3, 4, 4]
+    v = [1, 2, 2, 3, 1, 4, 2, 5, 3, 5]
+    capacity = [16, 13, 10, 12, 4, 14, 9, 20, 7, 4]
+    result = dinic(6, u, v, capacity, 0, 5)
+    print("The maximum possible flow is", result.flow_value)  # 23
+    print("Source side:", np.flatnonzero(result.source_side))  # [0 1 2 4]
+    print("Cut edges:", [(u[i], v[i], capacity[i]) for i in result.cut_edges])  # [(1, 3, 12), (4, 3, 7), (4, 5, 4)]
+
+    # 100,000 vertices and 1,000,000 edges (the matrix version would need 10^10 entries)
+    rng = np.random.default_rng(0)
+    n, m = 10 ** 5, 10 ** 6
+    u, v = rng.integers(0, n, m), rng.integers(0, n, m)
+    capacity = rng.integers(1, 100, m)
+    u[:1000] = 0  # 1,000 wide edges out of the source and 1,000 into the sink, so the cut is not trivial
+    v[1000:2000] = n - 1
+    capacity[:2000] = 1000
+    begin = time.perf_counter()
+    result = dinic(n, u, v, capacity, 0, n - 1)
+    print("Max flow %d in %.1f s, %d cut edges" % (result.flow_value, time.perf_counter() - begin,
+                                                   len(result.cut_edges)))
+    # Max flow 499094 in 4.4 s, 9574 cut edges
+
+#Explanation of the Code:
+# 1 - ResidualGraph numbers the arcs so that arc k and arc k + m are reverses of each other, sorts them by tail with a stable argsort, and translates the pairing into CSR positions (reverse). forward remembers where the forward arc of every input edge ended up.
+# 2 - levels is a frontier BFS: it gathers all arcs of the frontier at once, keeps those with residual capacity, and assigns the next level to the heads that have none yet. During the phases it stops as soon as the sink has a level.
+# 3 - _blocking_flow keeps the current path as a list of arcs:
+# 3.1 - Advance: skip arcs (moving the current-arc pointer) until one has residual capacity and goes exactly one level up, then step along it.
+# 3.2 - Retreat: if v has no such arc left, v is a dead end for this phase; go back one arc and move the pointer of the previous vertex past it.
+# 3.3 - Augment: at the sink, push the bottleneck capacity along the whole path, update the reverse arcs, and continue from the tail of the first saturated arc (the part of the path before it is still usable).
+# 4 - dinic repeats BFS + blocking flow until the sink is unreachable. result runs one last BFS in the residual graph: the reachable vertices are the source side of a minimum cut, and the edges leaving it are the cut edges.
+
+#Time Complexity:
+# 1 - At most V - 1 phases, each with one BFS (O(V + E)) and one blocking flow (O(V * E)), so O(V^2 * E) in the worst case, usually far less in practice.
+# 2 - Unit capacity networks: O(E * min(V^(2/3), E^(1/2))); bipartite matching: O(E * sqrt(V)).
+# 3 - Memory: O(V + E) (two arcs per edge), instead of O(V^2) for the adjacency matrix.
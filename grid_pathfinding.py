@@ -0,0 +1,384 @@
+#Grid pathfinding finds the shortest route between two cells of a 2D map where some cells are blocked (walls, buildings). A*_algorithm.py solves it on small 4-connected grids stored as lists of lists. This file solves it on big maps (thousands of cells per side) with three changes:
+# 1 - Compact Storage: The map is a NumPy uint8 occupancy grid (0 = free, anything else = blocked). Cells are identified by one integer id (row * width + col) instead of (row, col) tuples.
+# 2 - Preallocated Search State: g-scores, parents and closed flags are flat arrays allocated once per map, not dictionaries filled per query. A "stamp" array records which query last wrote each cell, so nothing has to be cleared between queries.
+# 3 - Jump Point Search (JPS): On grids where every move has the same cost, many shortest paths are symmetric (the same moves in a different order). JPS prunes these and only puts "jump points" into the open list, so large open areas cost almost nothing.
+
+#Movement Rules:
+# 1 - 8-connected: A cell can move to its 4 straight neighbors (cost 1) and its 4 diagonal neighbors (cost sqrt(2)).
+# 2 - No Corner Cutting: A diagonal move is allowed only if both straight cells next to it are free, so paths never squeeze between two blocked corners.
+# 3 - Octile Heuristic: With dx and dy the differences in columns and rows, the cheapest possible path has cost max(dx, dy) - min(dx, dy) + sqrt(2) * min(dx, dy). It never overestimates.
+
+#Jump Point Search:
+# 1 - Pruning: A cell reached by a straight move only needs to continue straight and to its open sides. A cell reached by a diagonal move continues diagonally and along its two straight components.
+# 2 - Jumping: Instead of adding every neighbor to the open list, the search "jumps" in a direction until something interesting happens: the goal, a wall, or a "forced neighbor" (a cell next to an obstacle corner, where an optimal path could turn). Only that cell (the jump point) is added to the open list.
+# 3 - Precomputed Straight Jumps: For every cell and each of the 4 straight directions, we precompute (with NumPy, for the whole map at once) the first cell where a straight jump has to stop. A straight jump is then a single table lookup, and a diagonal jump does two lookups per diagonal step.
+
+#Python Implementation:
+
+import heapq
+import math
+from array import array
+
+import numpy as np
+
+SQRT2 = math.sqrt(2.0)
+
+def _next_stop(stop, axis, forward):
+    """For every cell, the index of the first `stop` cell at or after it along `axis` (or at or before it)."""
+    n = stop.shape[axis]
+    index = np.arange(n).reshape((-1, 1) if axis == 0 else (1, -1))
+    if forward:
+        values = np.where(stop, index, n)
+        return np.flip(np.minimum.accumulate(np.flip(values, axis), axis=axis), axis)
+    return np.maximum.accumulate(np.where(stop, index, -1), axis=axis)
+
+def _shift(free, dr, dc):
+    """shifted[r, c] = free[r + dr, c + dc] (False outside the grid)."""
+    shifted = np.zeros_like(free)
+    rows, cols = free.shape
+    shifted[max(-dr, 0):rows - max(dr, 0), max(-dc, 0):cols - max(dc, 0)] = \
+        free[max(dr, 0):rows - max(-dr, 0), max(dc, 0):cols - max(-dc, 0)]
+    return shifted
+
+class GridPathfinder:
+    def __init__(self, grid, diagonal=True):
+        """
+        :param grid: 2D NumPy array (uint8), 0 = free cell, anything else = blocked
+        :param diagonal: True for 8-connected movement (octile heuristic), False for 4-connected (Manhattan)
+        """
+        grid = np.asarray(grid)
+        self.rows, self.cols = grid.shape
+        self.width = self.cols + 2  # The map is padded with a blocked border, so no bounds checks are needed
+        self.diagonal = diagonal
+        free = np.zeros((self.rows + 2, self.cols + 2), dtype=bool)
+        free[1:-1, 1:-1] = grid == 0
+        self.free_grid = free
+        self.free = free.ravel().tobytes()  # Fast scalar access: self.free[cell_id]
+
+        size = free.size
+        self.g_score = array('d', [0.0]) * size
+        self.parent = array('q', [-1]) * size
+        self.stamp = array('i', [0]) * size  # Query id that last wrote g_score/parent of the cell (4 bytes)
+        self.closed = array('i', [0]) * size  # Query id that closed the cell
+        self.query_id = 0
+        self.jump_tables = None  # Built on the first JPS query
+
+        # (offset, cost, first side, second side): a diagonal move needs both straight sides to be free
+        w = self.width
+        self.moves = [(-w, 1.0, 0, 0), (w, 1.0, 0, 0), (-1, 1.0, 0, 0), (1, 1.0, 0, 0)]
+        if diagonal:
+            self.moves += [(dr * w + dc, SQRT2, dr * w, dc) for dr in (-1, 1) for dc in (-1, 1)]
+
+    def _next_query(self):
+        """A new query id. The stamps are 32-bit, so after 2^31 - 1 queries they are cleared and the ids restart."""
+        if self.query_id == 2 ** 31 - 1:
+            self.stamp = array('i', [0]) * len(self.stamp)
+            self.closed = array('i', [0]) * len(self.closed)
+            self.query_id = 0
+        self.query_id += 1
+        return self.query_id
+
+    def _cell(self, position):
+        row, col = position
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise ValueError("Cell %r is outside the grid" % (position,))
+        return (row + 1) * self.width + col + 1
+
+    def _position(self, cell):
+        row, col = divmod(cell, self.width)
+        return row - 1, col - 1
+
+    def _heuristic(self, cell, goal_row, goal_col):
+        row, col = divmod(cell, self.width)
+        dr = abs(row - goal_row)
+        dc = abs(col - goal_col)
+        if self.diagonal:
+            return max(dr, dc) + (SQRT2 - 1.0) * min(dr, dc)
+        return dr + dc
+
+    def astar(self, start, target):
+        """
+        A* on the grid.
+
+        :return: (cost, path as a list of (row, col), number of expanded cells); (inf, None, expanded) if no path
+        """
+        s, t = self._cell(start), self._cell(target)
+        if not (self.free[s] and self.free[t]):
+            return float('inf'), None, 0
+        query = self._next_query()
+        free, g_score, parent, stamp, closed = self.free, self.g_score, self.parent, self.stamp, self.closed
+        goal_row, goal_col = divmod(t, self.width)
+        g_score[s] = 0.0
+        parent[s] = -1
+        stamp[s] = query
+        open_set = [(self._heuristic(s, goal_row, goal_col), s)]
+        expanded = 0
+        while open_set:
+            _, u = heapq.heappop(open_set)
+            if closed[u] == query:
+                continue
+            if u == t:
+                return g_score[u], self._path(u), expanded
+            closed[u] = query
+            expanded += 1
+            g = g_score[u]
+            for move, cost, side_a, side_b in self.moves:
+                v = u + move
+                if not free[v] or closed[v] == query:
+                    continue
+                if side_a and not (free[u + side_a] and free[u + side_b]):
+                    continue  # No corner cutting
+                tentative = g + cost
+                if stamp[v] != query or tentative < g_score[v]:
+                    stamp[v] = query
+                    g_score[v] = tentative
+                    parent[v] = u
+                    heapq.heappush(open_set, (tentative + self._heuristic(v, goal_row, goal_col), v))
+        return float('inf'), None, expanded
+
+    def dijkstra(self, start, targets):
+        """Costs from start to every reachable cell in `targets` ({(row, col): cost}); stops once all are settled."""
+        s = self._cell(start)
+        remaining = {self._cell(target) for target in targets}
+        costs = {}
+        if not self.free[s]:
+            return costs
+        query = self._next_query()
+        free, g_score, stamp, closed = self.free, self.g_score, self.stamp, self.closed
+        g_score[s] = 0.0
+        stamp[s] = query
+        open_set = [(0.0, s)]
+        while open_set and remaining:
+            g, u = heapq.heappop(open_set)
+            if closed[u] == query:
+                continue
+            closed[u] = query
+            if u in remaining:
+                remaining.discard(u)
+                costs[self._position(u)] = g
+            for move, cost, side_a, side_b in self.moves:
+                v = u + move
+                if not free[v] or closed[v] == query:
+                    continue
+                if side_a and not (free[u + side_a] and free[u + side_b]):
+                    continue
+                tentative = g + cost
+                if stamp[v] != query or tentative < g_score[v]:
+                    stamp[v] = query
+                    g_score[v] = tentative
+                    heapq.heappush(open_set, (tentative, v))
+        return costs
+
+    def _build_jump_tables(self):
+        """First stop cell of a straight jump from every cell in each of the 4 directions."""
+        free = self.free_grid
+        dtype = np.int16 if max(free.shape) < 2 ** 15 else np.int32
+        # A straight jump stops at a wall or at a cell with a forced neighbor: a free side cell whose
+        # cell behind it (relative to the direction of travel) is blocked
+        east = (_shift(free, -1, 0) & ~_shift(free, -1, -1)) | (_shift(free, 1, 0) & ~_shift(free, 1, -1))
+        west = (_shift(free, -1, 0) & ~_shift(free, -1, 1)) | (_shift(free, 1, 0) & ~_shift(free, 1, 1))
+        south = (_shift(free, 0, -1) & ~_shift(free, -1, -1)) | (_shift(free, 0, 1) & ~_shift(free, -1, 1))
+        north = (_shift(free, 0, -1) & ~_shift(free, 1, -1)) | (_shift(free, 0, 1) & ~_shift(free, 1, 1))
+        tables = {
+            (0, 1): _next_stop(east | ~free, axis=1, forward=True),  # Column of the stop
+            (0, -1): _next_stop(west | ~free, axis=1, forward=False),
+            (1, 0): _next_stop(south | ~free, axis=0, forward=True),  # Row of the stop
+            (-1, 0): _next_stop(north | ~free, axis=0, forward=False),
+        }
+        self.jump_tables = {d: memoryview(np.ascontiguousarray(t.astype(dtype)).ravel()) for d, t in tables.items()}
+
+    def _jump_straight(self, row, col, dr, dc, goal_row, goal_col):
+        """Jump point reached from (row, col) going straight, or -1."""
+        w = self.width
+        stop = self.jump_tables[(dr, dc)][row * w + col]
+        if dr == 0:
+            if goal_row == row and min(col, stop) <= goal_col <= max(col, stop):
+                return goal_row * w + goal_col
+            cell = row * w + stop
+        else:
+            if goal_col == col and min(row, stop) <= goal_row <= max(row, stop):
+                return goal_row * w + goal_col
+            cell = stop * w + col
+        return cell if self.free[cell] else -1  # Stopped at a forced neighbor, or ran into a wall
+
+    def _jump(self, row, col, dr, dc, goal_row, goal_col):
+        """Jump point reached from (row, col) in direction (dr, dc), or -1."""
+        if dr == 0 or dc == 0:
+            return self._jump_straight(row, col, dr, dc, goal_row, goal_col)
+        free, w = self.free, self.width
+        while True:
+            cell = row * w + col
+            if not free[cell]:
+                return -1
+            if row == goal_row and col == goal_col:
+                return cell
+            # A diagonal jump stops where one of its straight components finds a jump point
+            if (self._jump_straight(row, col + dc, 0, dc, goal_row, goal_col) >= 0 or
+                    self._jump_straight(row + dr, col, dr, 0, goal_row, goal_col) >= 0):
+                return cell
+            if not (free[cell + dc] and free[cell + dr * w]):
+                return -1  # The next diagonal step would cut a corner
+            row += dr
+            col += dc
+
+    def _directions(self, cell, parent_cell):
+        """Pruned directions to search from a cell, given the cell it was reached from."""
+        free, w = self.free, self.width
+        if parent_cell == -1:
+            return [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)]
+        row, col = divmod(cell, w)
+        parent_row, parent_col = divmod(parent_cell, w)
+        dr = (row > parent_row) - (row < parent_row)
+        dc = (col > parent_col) - (col < parent_col)
+        directions = []
+        if dr and dc:
+            side_row, side_col = free[cell + dr * w], free[cell + dc]
+            if side_row:
+                directions.append((dr, 0))
+            if side_col:
+                directions.append((0, dc))
+            if side_row and side_col:
+                directions.append((dr, dc))
+        elif dc:
+            ahead, up, down = free[cell + dc], free[cell - w], free[cell + w]
+            if ahead:
+                directions.append((0, dc))
+                if up:
+                    directions.append((-1, dc))
+                if down:
+                    directions.append((1, dc))
+            if up:
+                directions.append((-1, 0))
+            if down:
+                directions.append((1, 0))
+        else:
+            ahead, left, right = free[cell + dr * w], free[cell - 1], free[cell + 1]
+            if ahead:
+                directions.append((dr, 0))
+                if left:
+                    directions.append((dr, -1))
+                if right:
+                    directions.append((dr, 1))
+            if left:
+                directions.append((0, -1))
+            if right:
+                directions.append((0, 1))
+        return directions
+
+    def jps(self, start, target):
+        """
+        Jump Point Search (8-connected, uniform cost, no corner cutting).
+
+        :return: (cost, path as a list of (row, col), number of expanded jump points); (inf, None, expanded) if no path
+        """
+        if not self.diagonal:
+            raise ValueError("Jump Point Search needs 8-connected movement (diagonal=True)")
+        if self.jump_tables is None:
+            self._build_jump_tables()
+        s, t = self._cell(start), self._cell(target)
+        if not (self.free[s] and self.free[t]):
+            return float('inf'), None, 0
+        query = self._next_query()
+        free, g_score, parent, stamp, closed = self.free, self.g_score, self.parent, self.stamp, self.closed
+        w = self.width
+        goal_row, goal_col = divmod(t, w)
+        g_score[s] = 0.0
+        parent[s] = -1
+        stamp[s] = query
+        open_set = [(self._heuristic(s, goal_row, goal_col), s)]
+        expanded = 0
+        while open_set:
+            _, u = heapq.heappop(open_set)
+            if closed[u] == query:
+                continue
+            if u == t:
+                return g_score[u], self._jps_path(u), expanded
+            closed[u] = query
+            expanded += 1
+            row, col = divmod(u, w)
+            g = g_score[u]
+            for dr, dc in self._directions(u, parent[u]):
+                if dr and dc and not (free[u + dr * w] and free[u + dc]):
+                    continue  # No corner cutting on the first diagonal step
+                jump_point = self._jump(row + dr, col + dc, dr, dc, goal_row, goal_col)
+                if jump_point < 0 or closed[jump_point] == query:
+                    continue
+                jump_row, jump_col = divmod(jump_point, w)
+                distance_row, distance_col = abs(jump_row - row), abs(jump_col - col)
+                tentative = g + max(distance_row, distance_col) + (SQRT2 - 1.0) * min(distance_row, distance_col)
+                if stamp[jump_point] != query or tentative < g_score[jump_point]:
+                    stamp[jump_point] = query
+                    g_score[jump_point] = tentative
+                    parent[jump_point] = u
+                    heapq.heappush(open_set, (tentative + self._heuristic(jump_point, goal_row, goal_col), jump_point))
+        return float('inf'), None, expanded
+
+    def _path(self, cell):
+        path = []
+        while cell != -1:
+            path.append(self._position(cell))
+            cell = self.parent[cell]
+        path.reverse()
+        return path
+
+    def _jps_path(self, cell):
+        """Expand the jump points into every cell of the path (segments are straight or diagonal)."""
+        jump_points = self._path(cell)
+        path = jump_points[:1]
+        for (row, col), (next_row, next_col) in zip(jump_points, jump_points[1:]):
+            dr = (next_row > row) - (next_row < row)
+            dc = (next_col > col) - (next_col < col)
+            while (row, col) != (next_row, next_col):
+                row += dr
+                col += dc
+                path.append((row, col))
+        return path
+
+if __name__ == "__main__":
+    import time
+
+    # Example Usage: the grid from A*_algorithm.py
+    grid = np.array([
+        [0, 0, 0, 0, 0],
+        [0, 1, 1, 1, 0],
+        [0, 0, 0, 0, 0],
+        [0, 1, 1, 1, 0],
+        [0, 0, 0, 0, 0]
+    ], dtype=np.uint8)
+    print(GridPathfinder(grid, diagonal=False).astar((0, 0), (4, 4))[:2])  # (8.0, [(0, 0), (0, 1), ...])
+    finder = GridPathfinder(grid)
+    print(finder.astar((0, 0), (4, 4))[:2])
+    print(finder.jps((0, 0), (4, 4))[:2])
+
+    # A 1024 x 1024 map with random rectangular obstacles
+    rng = np.random.default_rng(0)
+    size = 1024
+    big = np.zeros((size, size), dtype=np.uint8)
+    for _ in range(400):
+        r, c = rng.integers(0, size, 2)
+        big[r:r + rng.integers(5, 60), c:c + rng.integers(5, 60)] = 1
+    big[0, 0] = big[-1, -1] = 0
+    finder = GridPathfinder(big)
+    finder.jps((0, 0), (1, 1))  # Builds the jump tables once
+    for name, search in (("A*", finder.astar), ("JPS", finder.jps)):
+        begin = time.perf_counter()
+        cost, path, expanded = search((0, 0), (size - 1, size - 1))
+        print("%-3s cost %.2f, %d cells, %d expanded, %.3f s" % (name, cost, len(path), expanded,
+                                                                time.perf_counter() - begin))
+
+#Explanation of the Code:
+# 1 - Setup:
+# 1.1 - The grid is padded with a blocked border, and the free cells are stored as a bytes object, so free[cell] is a fast lookup and no neighbor can fall outside the map.
+# 1.2 - g_score, parent, stamp and closed are flat arrays of the whole map, allocated once. A value is only valid if its stamp equals the current query id, so a new query starts in O(1) instead of clearing millions of cells. The stamps are 32-bit ('i'): together with g_score and parent that is 24 bytes per cell (about 400 MB for 4096 x 4096), and _next_query clears them only once every 2^31 - 1 queries.
+# 1.3 - moves lists the offset and the cost of every move, plus the two straight side offsets of a diagonal move for the corner-cutting check.
+# 2 - astar: The A* loop of A*_algorithm.py on integer cell ids, with the octile heuristic for 8 directions (or Manhattan for 4).
+# 2.1 - dijkstra is the same loop without a heuristic. It returns the costs to a set of target cells and stops once all of them are settled (hierarchical_pathfinding.py uses it for the distances inside a cluster).
+# 3 - Jump Tables: _build_jump_tables marks, for each straight direction, the cells where a jump must stop (walls and cells with a forced neighbor), and _next_stop turns those masks into "index of the next stop cell" with one cumulative minimum (or maximum) over the whole map.
+# 4 - JPS:
+# 4.1 - _directions applies the pruning rules: after a straight move keep going straight and open to both sides, after a diagonal move keep going diagonally and along both straight components.
+# 4.2 - _jump_straight answers a straight jump with one table lookup, and also checks whether the goal is on the way. _jump walks diagonally and stops where a straight jump from the current cell finds something.
+# 4.3 - The cost between two jump points is their octile distance, because the cells between them form a straight or diagonal line. _jps_path fills in those cells.
+
+#Time Complexity:
+# 1 - A*: O(N log N) in the worst case for N free cells.
+# 2 - JPS: The same worst case, but on maps with open areas it expands only a handful of jump points. The jump tables take O(N) time and 4 * N small integers (int16 for maps up to 32767 cells per side, 128 MB for 4096 x 4096).
@@ -0,0 +1,269 @@
+#Hierarchical Pathfinding A* (HPA*) speeds up many queries on a big grid map by searching on two levels, similar to how people plan a trip: first choose the sequence of cities, then the streets inside each city.
+
+#Key Concepts:
+# 1 - Clusters: The grid is cut into square clusters (for example 32 x 32 cells).
+# 2 - Entrances: Where two neighboring clusters share a border, every maximal run of free cell pairs across the border is an entrance. Short entrances get one transition (in the middle), long ones get two (at both ends). Each transition is a pair of cells, one on each side, connected by a move of cost 1.
+# 3 - Abstract Graph: The transition cells are the nodes. Inter-cluster edges connect the two cells of a transition. Intra-cluster edges connect the transition cells of the same cluster, weighted with their shortest distance inside the cluster (precomputed).
+# 4 - Query: The start and goal are connected to the transition cells of their clusters, A* runs on the small abstract graph, and each abstract edge is then refined into real cells with a local search that stays inside one cluster.
+# 5 - Updates: When cells change, only the entrances on the borders of the affected clusters and the intra-cluster distances of those clusters (and of neighbors whose entrances changed) are recomputed.
+
+#Trade-off:
+#HPA* paths are near-optimal, not always optimal: inside the abstract graph a path can only cross borders at the chosen transitions. In exchange, a query on a huge map only explores a few hundred abstract nodes plus the cells along the final path.
+
+#Python Implementation:
+#Local searches use GridPathfinder from grid_pathfinding.py on the subgrid of one cluster (8-connected moves, no corner cutting, octile costs).
+
+import heapq
+import math
+
+import numpy as np
+
+from grid_pathfinding import SQRT2, GridPathfinder
+
+def _octile(a, b):
+    dr = abs(a[0] - b[0])
+    dc = abs(a[1] - b[1])
+    return max(dr, dc) + (SQRT2 - 1.0) * min(dr, dc)
+
+class HierarchicalPathfinder:
+    def __init__(self, grid, cluster_size=32):
+        """
+        :param grid: 2D NumPy array (uint8), 0 = free cell, anything else = blocked
+        :param cluster_size: Number of cells per side of a cluster
+        """
+        self.grid = np.array(grid, dtype=np.uint8)  # Own copy, changed through set_cells
+        self.rows, self.cols = self.grid.shape
+        self.cluster_size = cluster_size
+        self.cluster_rows = math.ceil(self.rows / cluster_size)
+        self.cluster_cols = math.ceil(self.cols / cluster_size)
+        self.local = {}  # cluster -> GridPathfinder of its subgrid
+        self.entrances = {}  # border (cluster, neighbor cluster) -> list of transitions (cell, cell)
+        self.intra = {}  # cluster -> {(cell, cell): distance inside the cluster}
+        self._adjacency = None  # Abstract graph, rebuilt lazily after changes
+
+        clusters = [(i, j) for i in range(self.cluster_rows) for j in range(self.cluster_cols)]
+        for cluster in clusters:
+            self.local[cluster] = GridPathfinder(self._subgrid(cluster))
+        for border in self._all_borders():
+            self.entrances[border] = self._find_entrances(border)
+        for cluster in clusters:
+            self.intra[cluster] = self._intra_distances(cluster)
+
+    def _bounds(self, cluster):
+        """(first row, end row, first col, end col) of a cluster."""
+        i, j = cluster
+        k = self.cluster_size
+        return i * k, min((i + 1) * k, self.rows), j * k, min((j + 1) * k, self.cols)
+
+    def _subgrid(self, cluster):
+        r0, r1, c0, c1 = self._bounds(cluster)
+        return self.grid[r0:r1, c0:c1]
+
+    def _cluster_of(self, cell):
+        return cell[0] // self.cluster_size, cell[1] // self.cluster_size
+
+    def _all_borders(self):
+        for i in range(self.cluster_rows):
+            for j in range(self.cluster_cols):
+                if j + 1 < self.cluster_cols:
+                    yield (i, j), (i, j + 1)
+                if i + 1 < self.cluster_rows:
+                    yield (i, j), (i + 1, j)
+
+    def _borders_of(self, cluster):
+        i, j = cluster
+        for neighbor in ((i, j - 1), (i, j + 1), (i - 1, j), (i + 1, j)):
+            if 0 <= neighbor[0] < self.cluster_rows and 0 <= neighbor[1] < self.cluster_cols:
+                yield (min(cluster, neighbor), max(cluster, neighbor))
+
+    def _find_entrances(self, border):
+        """Transitions of a border: one per short run of free cell pairs, two for long runs."""
+        first, second = border
+        r0, r1, c0, c1 = self._bounds(first)
+        free = self.grid == 0
+        if first[0] == second[0]:  # Left/right neighbors: the border is a column pair
+            open_pairs = free[r0:r1, c1 - 1] & free[r0:r1, c1]
+            cell_pair = lambda k: ((r0 + k, c1 - 1), (r0 + k, c1))
+        else:  # Top/bottom neighbors: the border is a row pair
+            open_pairs = free[r1 - 1, c0:c1] & free[r1, c0:c1]
+            cell_pair = lambda k: ((r1 - 1, c0 + k), (r1, c0 + k))
+        # Maximal runs of open pairs
+        padded = np.concatenate([[False], open_pairs, [False]])
+        changes = np.flatnonzero(padded[1:] != padded[:-1])
+        transitions = []
+        for start, end in zip(changes[::2].tolist(), changes[1::2].tolist()):
+            if end - start < 6:
+                transitions.append(cell_pair((start + end - 1) // 2))
+            else:
+                transitions.append(cell_pair(start))
+                transitions.append(cell_pair(end - 1))
+        return transitions
+
+    def _cluster_nodes(self, cluster):
+        """Transition cells that lie inside the cluster."""
+        nodes = set()
+        for border in self._borders_of(cluster):
+            for a, b in self.entrances[border]:
+                nodes.add(a if self._cluster_of(a) == cluster else b)
+        return sorted(nodes)
+
+    def _local_costs(self, cluster, source, targets):
+        """Distances inside a cluster from source to targets (global cell coordinates)."""
+        r0, _, c0, _ = self._bounds(cluster)
+        costs = self.local[cluster].dijkstra((source[0] - r0, source[1] - c0),
+                                             [(r - r0, c - c0) for r, c in targets])
+        return {(r + r0, c + c0): cost for (r, c), cost in costs.items()}
+
+    def _intra_distances(self, cluster):
+        nodes = self._cluster_nodes(cluster)
+        distances = {}
+        for index, a in enumerate(nodes):
+            for b, cost in self._local_costs(cluster, a, nodes[index + 1:]).items():
+                distances[(a, b)] = cost
+        return distances
+
+    def abstract_graph(self):
+        """Adjacency dictionary {cell: {cell: cost}} of the abstract graph."""
+        if self._adjacency is None:
+            adjacency = {}
+            for transitions in self.entrances.values():
+                for a, b in transitions:
+                    adjacency.setdefault(a, {})[b] = 1.0
+                    adjacency.setdefault(b, {})[a] = 1.0
+            for distances in self.intra.values():
+                for (a, b), cost in distances.items():
+                    adjacency.setdefault(a, {})[b] = cost
+                    adjacency.setdefault(b, {})[a] = cost
+            self._adjacency = adjacency
+        return self._adjacency
+
+    def set_cells(self, cells, value):
+        """Change cells ((row, col) list) to `value` (0 = free) and rebuild only the affected clusters."""
+        for r, c in cells:
+            self.grid[r, c] = value
+        dirty = {self._cluster_of(cell) for cell in cells}
+        rebuild = set(dirty)
+        for cluster in dirty:
+            self.local[cluster] = GridPathfinder(self._subgrid(cluster))
+        for border in {border for cluster in dirty for border in self._borders_of(cluster)}:
+            transitions = self._find_entrances(border)
+            if transitions != self.entrances[border]:
+                self.entrances[border] = transitions
+                rebuild.update(border)  # Both clusters got new transition cells
+        for cluster in rebuild:
+            self.intra[cluster] = self._intra_distances(cluster)
+        self._adjacency = None
+        return sorted(rebuild)
+
+    def find_path(self, start, goal):
+        """
+        Near-optimal path from start to goal.
+
+        :return: (cost, path as a list of (row, col)); (inf, None) if there is no path
+        """
+        if self.grid[start] or self.grid[goal]:
+            return float('inf'), None
+        start_cluster, goal_cluster = self._cluster_of(start), self._cluster_of(goal)
+        adjacency = self.abstract_graph()
+
+        # Temporary edges: start -> transition cells of its cluster, and transition cells -> goal
+        extra = {start: self._local_costs(start_cluster, start, self._cluster_nodes(start_cluster))}
+        for cell, cost in self._local_costs(goal_cluster, goal, self._cluster_nodes(goal_cluster)).items():
+            extra.setdefault(cell, {})[goal] = cost
+
+        # Abstract A*
+        g_score = {start: 0.0}
+        came_from = {start: None}
+        closed = set()
+        open_set = [(_octile(start, goal), start)]
+        best = (float('inf'), None)
+        while open_set:
+            _, u = heapq.heappop(open_set)
+            if u in closed:
+                continue
+            if u == goal:
+                best = (g_score[u], self._refine(came_from, goal))
+                break
+            closed.add(u)
+            neighbors = adjacency.get(u, {}).items()
+            if u in extra:
+                neighbors = list(neighbors) + list(extra[u].items())
+            for v, cost in neighbors:
+                tentative = g_score[u] + cost
+                if tentative < g_score.get(v, float('inf')):
+                    g_score[v] = tentative
+                    came_from[v] = u
+                    heapq.heappush(open_set, (tentative + _octile(v, goal), v))
+
+        # Start and goal in the same cluster: the direct local path may be shorter
+        if start_cluster == goal_cluster:
+            r0, _, c0, _ = self._bounds(start_cluster)
+            cost, local_path, _ = self.local[start_cluster].astar((start[0] - r0, start[1] - c0),
+                                                                  (goal[0] - r0, goal[1] - c0))
+            if cost < best[0]:
+                best = (cost, [(r + r0, c + c0) for r, c in local_path])
+        return best
+
+    def _refine(self, came_from, goal):
+        """Turn the abstract path into real cells."""
+        abstract = []
+        node = goal
+        while node is not None:
+            abstract.append(node)
+            node = came_from[node]
+        abstract.reverse()
+        path = [abstract[0]]
+        for a, b in zip(abstract, abstract[1:]):
+            if self._cluster_of(a) != self._cluster_of(b):
+                path.append(b)  # Inter-cluster edge: one step across the border
+                continue
+            cluster = self._cluster_of(a)
+            r0, _, c0, _ = self._bounds(cluster)
+            _, local_path, _ = self.local[cluster].astar((a[0] - r0, a[1] - c0), (b[0] - r0, b[1] - c0))
+            path.extend((r + r0, c + c0) for r, c in local_path[1:])
+        return path
+
+if __name__ == "__main__":
+    import time
+
+    # A 512 x 512 map with random rectangular obstacles
+    rng = np.random.default_rng(1)
+    size = 512
+    grid = np.zeros((size, size), dtype=np.uint8)
+    for _ in range(150):
+        r, c = rng.integers(0, size, 2)
+        grid[r:r + rng.integers(5, 40), c:c + rng.integers(5, 40)] = 1
+    grid[:8, :8] = grid[-8:, -8:] = 0  # Keep the corners open
+
+    begin = time.perf_counter()
+    hpa = HierarchicalPathfinder(grid, cluster_size=32)
+    print("Preprocessing: %.2f s, %d abstract nodes" % (time.perf_counter() - begin, len(hpa.abstract_graph())))
+
+    begin = time.perf_counter()
+    cost, path = hpa.find_path((0, 0), (size - 1, size - 1))
+    print("HPA*: cost %.2f, %d cells, %.3f s" % (cost, len(path), time.perf_counter() - begin))
+    optimal = GridPathfinder(grid).astar((0, 0), (size - 1, size - 1))[0]
+    print("Optimal cost %.2f (HPA* is %.1f%% longer)" % (optimal, 100 * (cost / optimal - 1)))
+
+    # Block a wall in the middle of the map: only the clusters it touches are rebuilt
+    begin = time.perf_counter()
+    rebuilt = hpa.set_cells([(250, c) for c in range(200, 300)], 1)
+    print("Update: %d clusters rebuilt in %.3f s" % (len(rebuilt), time.perf_counter() - begin))
+    print("New cost: %.2f" % hpa.find_path((0, 0), (size - 1, size - 1))[0])
+
+#Explanation of the Code:
+# 1 - Preprocessing:
+# 1.1 - Every cluster gets a GridPathfinder for its own subgrid, so local searches can never leave the cluster.
+# 1.2 - _find_entrances finds the runs of open cell pairs along a border with a NumPy diff and places one or two transitions per run.
+# 1.3 - _intra_distances runs one GridPathfinder.dijkstra from every transition cell of a cluster to the other transition cells of the same cluster.
+# 2 - abstract_graph combines the transitions (cost 1) and the intra-cluster distances into one adjacency dictionary. It is cached until the next change.
+# 3 - find_path:
+# 3.1 - The start and goal are connected to the transition cells of their clusters with local Dijkstra searches. These edges are kept in a separate extra dictionary, so the cached abstract graph is never modified.
+# 3.2 - A* runs on the abstract graph with the octile heuristic. _refine replaces every intra-cluster edge with a local A* path and every inter-cluster edge with the single step across the border.
+# 3.3 - If start and goal are in the same cluster, the direct local path is also computed, and the cheaper one wins.
+# 4 - set_cells changes the grid, rebuilds the local pathfinders of the changed clusters, recomputes the entrances on their borders, and recomputes the intra-cluster distances only for the changed clusters and for neighbors whose transitions changed.
+
+#Time Complexity:
+# 1 - Preprocessing: For C clusters with at most T transitions each, C * T local Dijkstra searches inside a cluster.
+# 2 - Query: A* on the abstract graph (a few nodes per cluster) plus local searches along the path, instead of a search over the whole grid.
+# 3 - Update: Proportional to the number of clusters touched by the change, not to the size of the map.
@@ -0,0 +1,257 @@
+#HyperLogLog is a probabilistic data structure used to estimate the number of distinct elements (the cardinality) of a stream. An exact answer needs a set that grows with every new element, while HyperLogLog answers with a typical error of about 1.04 / sqrt(m) using only m small registers (m = 2^14 registers of one byte each give roughly 0.8% error in 16 KB, no matter whether the stream has a thousand or a billion distinct elements).
+
+#Key Concepts:
+# 1 - Hashing: Every element is hashed to a 64-bit value. Equal elements always give the same hash, so duplicates never change the sketch.
+# 2 - Registers: The first p bits of the hash choose one of m = 2^p registers. The remaining bits are used to compute a rank.
+# 3 - Rank: The rank is the position of the first 1-bit in the remaining bits (number of leading zeros + 1). Seeing a rank of r is about as likely as seeing 2^r distinct elements, so each register stores the maximum rank it has seen.
+# 4 - Estimate: The cardinality is estimated from the harmonic mean of 2^register over all registers.
+# 5 - Bias Correction: The classic estimator is biased for small and very large cardinalities. Here we use Ertl's improved estimator, which corrects the bias from the histogram of register values without any empirical tables.
+# 6 - Sparse Representation: While only a few registers are set, we store just the (index, rank) pairs of the non-zero registers, with a higher precision p' = 25. Small sets are then almost exact and use little memory. Once the sparse map grows too large, it is converted to the dense register array.
+
+#Steps:
+# 1 - Initialization: Start in sparse mode with an empty map.
+# 2 - Add Operation: Hash the element, compute (index, rank) and keep the maximum rank for that index.
+# 3 - Count Operation: Build the histogram of register values and run the estimator.
+# 4 - Merge Operation: Two sketches with the same precision are combined by taking the register-wise maximum. This is how shards of a stream are combined.
+# 5 - Serialization: The sketch is written as a small header followed by the raw register array (or the sparse pairs).
+
+#Python Implementation:
+#The hashing reuses the 64-bit hash functions from bloom_filters.py, so strings, bytes and NumPy integer arrays are all supported and batches are hashed fully vectorized.
+
+import math
+import struct
+
+import numpy as np
+
+from bloom_filters import _key_hash, _key_hash_array, _mix64, _mix64_array
+
+SPARSE_PRECISION = 25  # p' used while the sketch is sparse
+SERIAL_HEADER = struct.Struct('<4sBBI')  # magic, precision, is_sparse, number of stored entries
+SERIAL_MAGIC = b'HLL1'
+
+def _bit_length_array(v):
+    """Exact bit length of every value in a NumPy uint64 array (binary search with shifts)."""
+    v = v.copy()
+    length = np.zeros(v.shape, dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = (v >> np.uint64(shift)) != 0
+        v = np.where(high, v >> np.uint64(shift), v)
+        length += np.where(high, shift, 0).astype(np.uint8)
+    return length + (v != 0).astype(np.uint8)
+
+def _split_hash(h, precision):
+    """Split a 64-bit hash into (register index, rank) for the given precision."""
+    q = 64 - precision
+    index = h >> q
+    rank = q - (h & ((1 << q) - 1)).bit_length() + 1
+    return index, rank
+
+def _split_hash_array(h, precision):
+    """Vectorized version of _split_hash over a NumPy uint64 array."""
+    q = 64 - precision
+    index = (h >> np.uint64(q)).astype(np.int64)
+    rank = (q + 1 - _bit_length_array(h & np.uint64((1 << q) - 1)).astype(np.int64)).astype(np.uint8)
+    return index, rank
+
+def _sigma(x):
+    """Helper series of Ertl's estimator for the registers that are still 0."""
+    if x == 1.0:
+        return math.inf
+    y = 1.0
+    z = x
+    while True:
+        x *= x
+        z_old = z
+        z += x * y
+        y += y
+        if z == z_old:
+            return z
+
+def _tau(x):
+    """Helper series of Ertl's estimator for the registers that hit the maximum rank."""
+    if x == 0.0 or x == 1.0:
+        return 0.0
+    y = 1.0
+    z = 1.0 - x
+    while True:
+        x = math.sqrt(x)
+        z_old = z
+        y *= 0.5
+        z -= (1.0 - x) ** 2 * y
+        if z == z_old:
+            return z / 3.0
+
+def _estimate(histogram, m, q):
+    """Ertl's improved (bias-corrected) estimator from the histogram of register values 0..q+1."""
+    z = m * _tau(1.0 - histogram[q + 1] / m)
+    for k in range(q, 0, -1):
+        z = 0.5 * (z + histogram[k])
+    z += m * _sigma(histogram[0] / m)
+    return m * m / (2.0 * math.log(2.0) * z)
+
+class HyperLogLog:
+    def __init__(self, precision=14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision  # p: number of index bits
+        self.m = 1 << precision  # Number of dense registers
+        self.sparse = {}  # index (p' bits) -> rank, used while the sketch is small
+        self.registers = None  # Dense NumPy uint8 registers, created on conversion
+        self.sparse_limit = self.m // 4  # Convert once the sparse map gets this large
+
+    def is_sparse(self):
+        return self.registers is None
+
+    def add(self, item):
+        """Add a single item to the sketch."""
+        h = _mix64(_key_hash(item))
+        if self.registers is None:
+            index, rank = _split_hash(h, SPARSE_PRECISION)
+            if rank > self.sparse.get(index, 0):
+                self.sparse[index] = rank
+                if len(self.sparse) > self.sparse_limit:
+                    self._to_dense()
+        else:
+            index, rank = _split_hash(h, self.precision)
+            if rank > self.registers[index]:
+                self.registers[index] = rank
+
+    def add_many(self, items):
+        """Add a batch of items (NumPy integer array or sequence of str/bytes) with vectorized hashing."""
+        if len(items) == 0:
+            return
+        h = _mix64_array(_key_hash_array(items))
+        if self.registers is None and len(self.sparse) + len(h) <= self.sparse_limit:
+            index, rank = _split_hash_array(h, SPARSE_PRECISION)
+            for i, r in zip(index.tolist(), rank.tolist()):
+                if r > self.sparse.get(i, 0):
+                    self.sparse[i] = r
+            return
+        if self.registers is None:
+            self._to_dense()
+        index, rank = _split_hash_array(h, self.precision)
+        np.maximum.at(self.registers, index, rank)  # Keep the maximum rank per register
+
+    def _to_dense(self):
+        """Convert the sparse (p' = 25) pairs to dense registers with precision p."""
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+        if self.sparse:
+            shift = SPARSE_PRECISION - self.precision
+            sparse_index = np.fromiter(self.sparse.keys(), dtype=np.uint64, count=len(self.sparse))
+            sparse_rank = np.fromiter(self.sparse.values(), dtype=np.int64, count=len(self.sparse))
+            low = sparse_index & np.uint64((1 << shift) - 1)  # Bits that move from the index into the rank
+            rank = np.where(low != 0,
+                            shift - _bit_length_array(low).astype(np.int64) + 1,
+                            sparse_rank + shift).astype(np.uint8)
+            np.maximum.at(self.registers, (sparse_index >> np.uint64(shift)).astype(np.int64), rank)
+        self.sparse = {}
+
+    def count(self):
+        """Estimate the number of distinct items added so far."""
+        if self.registers is None:
+            m = 1 << SPARSE_PRECISION
+            q = 64 - SPARSE_PRECISION
+            histogram = np.bincount(np.fromiter(self.sparse.values(), dtype=np.int64, count=len(self.sparse)),
+                                    minlength=q + 2).astype(np.float64)
+            histogram[0] = m - len(self.sparse)  # Every register that is not stored is 0
+        else:
+            m = self.m
+            q = 64 - self.precision
+            histogram = np.bincount(self.registers, minlength=q + 2).astype(np.float64)
+        return _estimate(histogram, m, q)
+
+    def merge(self, other):
+        """Merge another sketch (e.g. from another shard) into this one."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        if self.registers is None and other.registers is None:
+            for index, rank in other.sparse.items():
+                if rank > self.sparse.get(index, 0):
+                    self.sparse[index] = rank
+            if len(self.sparse) > self.sparse_limit:
+                self._to_dense()
+            return self
+        if self.registers is None:
+            self._to_dense()
+        if other.registers is None:
+            other_dense = HyperLogLog(other.precision)
+            other_dense.sparse = dict(other.sparse)
+            other_dense._to_dense()
+            other = other_dense
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def to_bytes(self):
+        """Serialize the sketch: header followed by registers (dense) or sorted index/rank arrays (sparse)."""
+        if self.registers is None:
+            index = np.array(sorted(self.sparse), dtype=np.uint32)
+            rank = np.array([self.sparse[i] for i in index.tolist()], dtype=np.uint8)
+            header = SERIAL_HEADER.pack(SERIAL_MAGIC, self.precision, 1, len(index))
+            return header + index.astype('<u4').tobytes() + rank.tobytes()
+        header = SERIAL_HEADER.pack(SERIAL_MAGIC, self.precision, 0, self.m)
+        return header + self.registers.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Rebuild a sketch written by to_bytes."""
+        magic, precision, is_sparse, n = SERIAL_HEADER.unpack_from(data)
+        if magic != SERIAL_MAGIC:
+            raise ValueError("Not a serialized HyperLogLog sketch")
+        sketch = cls(precision)
+        offset = SERIAL_HEADER.size
+        if is_sparse:
+            index = np.frombuffer(data, dtype='<u4', count=n, offset=offset)
+            rank = np.frombuffer(data, dtype=np.uint8, count=n, offset=offset + 4 * n)
+            sketch.sparse = dict(zip(index.tolist(), rank.tolist()))
+        else:
+            sketch.registers = np.frombuffer(data, dtype=np.uint8, count=n, offset=offset).copy()
+        return sketch
+
+if __name__ == "__main__":
+    # Example Usage
+    hll = HyperLogLog(precision=14)
+
+    # Small streams stay in sparse mode and are almost exact
+    for word in ["apple", "banana", "cherry", "apple", "banana"]:
+        hll.add(word)
+    print(hll.is_sparse(), round(hll.count()))  # True 3
+
+    # Large batches are hashed in one vectorized pass
+    events = np.random.randint(0, 1000000, size=2000000)
+    shard_a = HyperLogLog(14)
+    shard_b = HyperLogLog(14)
+    shard_a.add_many(events[:1000000])
+    shard_b.add_many(events[1000000:])
+
+    # Combine the shards and compare with the exact answer
+    shard_a.merge(shard_b)
+    print("Estimated:", round(shard_a.count()), "Exact:", len(np.unique(events)))
+
+    # Round trip through bytes (for storage or for sending the sketch to another process)
+    restored = HyperLogLog.from_bytes(shard_a.to_bytes())
+    print(len(shard_a.to_bytes()), "bytes,", round(restored.count()) == round(shard_a.count()))  # 16394 bytes, True
+
+    # Single and batch updates hash keys identically: adding the same items both ways changes nothing
+    single, both = HyperLogLog(14), HyperLogLog(14)
+    for i in range(1000):
+        single.add(i)
+        both.add(i)
+    both.add_many(list(range(1000)))
+    assert both.count() == single.count()
+
+#Explanation of the Code:
+# 1 - Hashing:
+# 1.1 - _key_hash and _key_hash_array come from bloom_filters.py and produce a 64-bit base hash. _mix64 scrambles it so that all bits are uniformly distributed.
+# 1.2 - _split_hash takes the top p bits as the register index and computes the rank from the remaining 64 - p bits. _bit_length_array does the same for a whole NumPy array using six shift steps (an exact, vectorized "count leading zeros").
+# 2 - Sparse Mode:
+# 2.1 - The sparse map is a dictionary from a 25-bit index to the rank. It is used while fewer than m / 4 registers are set, so small sets cost only a few bytes per distinct value.
+# 2.2 - _to_dense converts every (index, rank) pair to precision p: the top p bits of the index become the dense register, and the bits that are dropped from the index are moved in front of the rank bits.
+# 3 - Dense Mode: The registers are a NumPy uint8 array. add_many updates them with np.maximum.at, which correctly handles several items hitting the same register.
+# 4 - Estimate: count builds the histogram of register values with np.bincount and applies Ertl's improved estimator. It is accurate from 0 up to far beyond 10^9 distinct items, without switching between linear counting and the raw estimate.
+# 5 - Merge: Register-wise maximum, which gives exactly the sketch we would get from adding both streams into one sketch.
+# 6 - Serialization: to_bytes writes a 10-byte header (magic, precision, sparse flag, entry count) and the raw arrays, and from_bytes reads them back with np.frombuffer.
+
+#Time Complexity:
+# 1 - Add: O(1) per item.
+# 2 - Count and Merge: O(m).
+# 3 - Space: m bytes in dense mode (16 KB for p = 14) and a few bytes per distinct item in sparse mode.
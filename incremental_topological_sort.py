@@ -0,0 +1,220 @@
+#An incremental (dynamic) topological order keeps a valid topological order of a DAG while edges are added one at a time, for example a job scheduler that receives dependencies one by one. Running topological_sort.topological_sort from scratch after every new edge costs O(V + E) per edge. The Pearce-Kelly algorithm only reorders the nodes that are actually affected by the new edge.
+
+#Key Concepts:
+# 1 - Order Positions: Every node x has a position ord[x] in the current order, and every edge u -> v satisfies ord[u] < ord[v].
+# 2 - Nothing To Do: If a new edge x -> y already goes forward (ord[x] < ord[y]), the order is still valid.
+# 3 - Affected Region: Otherwise only the nodes with positions between ord[y] and ord[x] can be in the wrong order:
+# 3.1 - delta_F: nodes reachable from y with position <= ord[x] (forward search from y). If x is among them, the edge closes a cycle and is rejected.
+# 3.2 - delta_B: nodes that reach x with position >= ord[y] (backward search from x).
+# 4 - Reordering: All nodes of delta_B must now come before all nodes of delta_F. The positions they occupied are collected and sorted, and handed out again: first to delta_B (in their old relative order), then to delta_F (in their old relative order). Nodes outside the region keep their positions.
+# 5 - Removals: Removing an edge never breaks a topological order, so it costs O(1).
+
+#Python Implementation:
+#Nodes can be any hashable labels, as in topological_sort.py. Internally they are numbered; the positions are kept in an array('q') and the edges in one set of successors and one set of predecessors per node (sets make removal O(1)). The searches use explicit stacks, so long dependency chains do not hit the recursion limit.
+
+from array import array
+from collections import deque
+
+class DynamicTopologicalOrder:
+    def __init__(self, vertices=(), edges=()):
+        self.ids = {}  # label -> node id
+        self.labels = []  # node id -> label
+        self.successors = []  # node id -> set of successor ids
+        self.predecessors = []  # node id -> set of predecessor ids
+        self.position = array('q')  # node id -> position in the order
+        self.node_at = []  # position -> node id
+        for vertex in vertices:
+            self.add_node(vertex)
+        self.add_edges(edges)
+
+    def add_node(self, label):
+        """Add a node at the end of the order (no-op if it exists); returns its id."""
+        if label in self.ids:
+            return self.ids[label]
+        node = len(self.labels)
+        self.ids[label] = node
+        self.labels.append(label)
+        self.successors.append(set())
+        self.predecessors.append(set())
+        self.position.append(len(self.node_at))
+        self.node_at.append(node)
+        return node
+
+    def _search(self, start, neighbors, inside, target=-1):
+        """Nodes reachable from start through neighbors, staying inside(position); None if target is reached."""
+        seen = {start}
+        stack = [start]
+        while stack:
+            u = stack.pop()
+            for w in neighbors[u]:
+                if w == target:
+                    return None
+                if w not in seen and inside(self.position[w]):
+                    seen.add(w)
+                    stack.append(w)
+        return seen
+
+    def add_edge(self, u, v):
+        """
+        Add the edge u -> v and restore the topological order.
+
+        :raises ValueError: if the edge would create a cycle (the graph and the order are left unchanged)
+        """
+        if u == v:
+            raise ValueError("Edge %r -> %r would create a cycle" % (u, v))
+        x, y = self.add_node(u), self.add_node(v)
+        if y in self.successors[x]:
+            return
+        lower, upper = self.position[y], self.position[x]
+        if lower < upper:
+            # The edge goes backward in the current order: reorder the affected region
+            forward = self._search(y, self.successors, lambda p: p <= upper, target=x)
+            if forward is None:
+                raise ValueError("Edge %r -> %r would create a cycle" % (u, v))
+            backward = self._search(x, self.predecessors, lambda p: p >= lower)
+            self._reorder(backward, forward)
+        self.successors[x].add(y)
+        self.predecessors[y].add(x)
+
+    def _reorder(self, backward, forward):
+        """Give the positions of both sets to the backward nodes first, then to the forward nodes."""
+        position = self.position
+        backward = sorted(backward, key=position.__getitem__)
+        forward = sorted(forward, key=position.__getitem__)
+        slots = sorted(position[node] for node in backward + forward)
+        for slot, node in zip(slots, backward + forward):
+            position[node] = slot
+            self.node_at[slot] = node
+
+    def add_edges(self, edges):
+        """
+        Add many edges at once; all or nothing.
+
+        Small batches are inserted one by one. A batch with more edges than the graph has nodes is cheaper to
+        handle with one run of Kahn's algorithm over the whole graph.
+
+        :raises ValueError: if the edges would create a cycle (nothing is added)
+        """
+        num_nodes = len(self.labels)
+        edges = [(self.add_node(u), self.add_node(v)) for u, v in edges]
+        new = [(x, y) for x, y in dict.fromkeys(edges) if y not in self.successors[x]]
+        if len(new) <= len(self.labels):
+            added = []
+            try:
+                for x, y in new:
+                    self.add_edge(self.labels[x], self.labels[y])
+                    added.append((x, y))
+            except ValueError:
+                for x, y in added:  # Removing edges keeps the order valid, so the rollback is cheap
+                    self.successors[x].discard(y)
+                    self.predecessors[y].discard(x)
+                self._remove_nodes_from(num_nodes)
+                raise
+            return
+        for x, y in new:
+            self.successors[x].add(y)
+            self.predecessors[y].add(x)
+        try:
+            self._recompute()
+        except ValueError:
+            for x, y in new:
+                self.successors[x].discard(y)
+                self.predecessors[y].discard(x)
+            self._remove_nodes_from(num_nodes)
+            raise
+
+    def _remove_nodes_from(self, first):
+        """Remove the nodes with id >= first (added by a rejected batch, no edges left) and close the gaps."""
+        if first == len(self.labels):
+            return
+        for label in self.labels[first:]:
+            del self.ids[label]
+        del self.labels[first:], self.successors[first:], self.predecessors[first:], self.position[first:]
+        self.node_at = [node for node in self.node_at if node < first]
+        for slot, node in enumerate(self.node_at):
+            self.position[node] = slot
+
+    def _recompute(self):
+        """Kahn's algorithm over the whole graph; ties keep the current order."""
+        in_degree = [len(p) for p in self.predecessors]
+        queue = deque(node for node in self.node_at if in_degree[node] == 0)
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for w in self.successors[node]:
+                in_degree[w] -= 1
+                if in_degree[w] == 0:
+                    queue.append(w)
+        if len(order) != len(self.labels):
+            raise ValueError("Edges would create a cycle")
+        self.node_at = order
+        for slot, node in enumerate(order):
+            self.position[node] = slot
+
+    def remove_edge(self, u, v):
+        """Remove the edge u -> v (KeyError if it does not exist). The order stays valid."""
+        x, y = self.ids[u], self.ids[v]
+        self.successors[x].remove(y)
+        self.predecessors[y].remove(x)
+
+    def remove_edges(self, edges):
+        for u, v in edges:
+            self.remove_edge(u, v)
+
+    def order(self):
+        """The current topological order as a list of labels."""
+        return [self.labels[node] for node in self.node_at]
+
+    def precedes(self, u, v):
+        """True if u comes before v in the current order (O(1))."""
+        return self.position[self.ids[u]] < self.position[self.ids[v]]
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # Example Usage: the graph of topological_sort.py, one edge at a time
+    dto = DynamicTopologicalOrder(['A', 'B', 'C', 'D', 'E', 'F'])
+    for u, v in [('A', 'D'), ('B', 'D'), ('C', 'E'), ('D', 'E'), ('E', 'F')]:
+        dto.add_edge(u, v)
+    print("Topological Sort:", dto.order())  # ['A', 'B', 'C', 'D', 'E', 'F']
+    dto.add_edge('D', 'C')  # Goes backward: only C and D are reordered
+    print("After D -> C:", dto.order())  # ['A', 'B', 'D', 'C', 'E', 'F']
+    try:
+        dto.add_edge('F', 'A')  # A -> D -> E -> F -> A would be a cycle
+    except ValueError as error:
+        print(error)  # Edge 'F' -> 'A' would create a cycle
+
+    # 20,000 random edge insertions on 5,000 nodes, compared with a full Kahn's run after every edge
+    random.seed(0)
+    n = 5000
+    rank = list(range(n))
+    random.shuffle(rank)  # Hidden order: edges always go from a smaller to a larger rank, so no cycles
+    edges = []
+    while len(edges) < 20000:
+        a, b = random.sample(range(n), 2)
+        edges.append((a, b) if rank[a] < rank[b] else (b, a))
+    dto = DynamicTopologicalOrder(range(n))
+    begin = time.perf_counter()
+    for u, v in edges:
+        dto.add_edge(u, v)
+    incremental = time.perf_counter() - begin
+    begin = time.perf_counter()
+    for _ in range(100):
+        dto._recompute()  # The same work as topological_sort.topological_sort after one insertion
+    full = (time.perf_counter() - begin) / 100 * len(edges)
+    print("Incremental: %.2f s, full recomputation after every edge: about %.0f s" % (incremental, full))
+    # Incremental: 0.07 s, full recomputation after every edge: about 69 s
+
+#Explanation of the Code:
+# 1 - add_node appends a new node at the end of the order, so the order stays valid.
+# 2 - add_edge: If ord[x] < ord[y], the edge is simply stored. Otherwise _search runs a depth-first search from y over successors, but only into nodes with a position <= ord[x] (delta_F); reaching x means a cycle, and a ValueError is raised before anything is changed. A second search from x over predecessors, only into nodes with a position >= ord[y], gives delta_B.
+# 3 - _reorder sorts both sets by their old positions, collects all their positions in increasing order, and reassigns them to delta_B followed by delta_F. This moves every node of delta_B before every node of delta_F, keeps the relative order inside each set, and does not touch any other node.
+# 4 - add_edges: Small batches use add_edge and undo the already added edges if one of them fails. Large batches add all edges and run Kahn's algorithm once (_recompute), which is cheaper than many reorderings; on a cycle the edges are removed again. In both cases _remove_nodes_from then drops the nodes that the rejected batch introduced and renumbers the positions of the rest.
+# 5 - remove_edge only updates the two sets: a topological order remains valid when edges disappear.
+
+#Time Complexity:
+# 1 - add_edge: O(1) for forward edges. For backward edges O(|delta| log |delta| + edges of delta), where delta = delta_F + delta_B is the affected region, usually a tiny part of the graph.
+# 2 - add_edges (large batch) and the full algorithm: O(V + E).
+# 3 - remove_edge, precedes: O(1).
@@ -24,6 +24,8 @@
 
 from collections import deque
 
+import numpy as np
+
 # Define possible movements (up, down, left, right)
 MOVES = [(-1, 0), (1, 0), (0, -1), (0, 1)]
 
@@ -64,25 +66,86 @@ def lee_algorithm(grid, start, target):
     # If there's no path to the target, return -1
     return -1
 
-# Example grid: 0 = free space, 1 = blocked cell
-grid = [
-    [0, 0, 0, 0, 0],
-    [0, 1, 1, 1, 0],
-    [0, 0, 0, 0, 0],
-    [0, 1, 1, 1, 0],
-    [0, 0, 0, 0, 0]
-]
+# Vectorized multi-source version: expands the whole wavefront per step with NumPy
+def wavefront_bfs(grid, sources):
+    """
+    Distance (in steps) from every cell to its nearest source, computed for all cells at once.
+
+    :param grid: 2D list or NumPy array, 0 = free cell, anything else = blocked
+    :param sources: List of (row, col) source cells (for example all exits of a map)
+    :return: int32 NumPy array with the distance of every cell, -1 for blocked or unreachable cells
+    """
+    free = np.asarray(grid) == 0
+    rows, cols = free.shape
+    sources = np.asarray(sources, dtype=np.int64).reshape(-1, 2)
+    if len(sources) and (sources.min() < 0 or sources[:, 0].max() >= rows or sources[:, 1].max() >= cols):
+        raise ValueError("Source cell outside the grid")
+
+    # Flat grid with a blocked border: a move is "index + shift", and no bounds checks are needed
+    width = cols + 2
+    open_cells = np.zeros((rows + 2) * width, dtype=bool)
+    open_cells.reshape(rows + 2, width)[1:-1, 1:-1] = free
+    distance = np.full(len(open_cells), -1, dtype=np.int32)
+    last_writer = np.zeros(len(open_cells), dtype=np.int64)  # Scratch array to remove duplicates
+    shifts = np.array([-width, width, -1, 1], dtype=np.int64)  # Same order as MOVES
+
+    frontier = (sources[:, 0] + 1) * width + sources[:, 1] + 1
+    frontier = np.unique(frontier[open_cells[frontier]])  # Blocked sources are ignored
+    distance[frontier] = 0
+    level = 0
+    while len(frontier):
+        level += 1
+        # All neighbors of the whole wavefront at once
+        candidates = (frontier[:, None] + shifts).ravel()
+        candidates = candidates[open_cells[candidates] & (distance[candidates] < 0)]
+        # A cell reached from several frontier cells is kept once: only the last write to last_writer survives
+        positions = np.arange(len(candidates))
+        last_writer[candidates] = positions
+        frontier = candidates[last_writer[candidates] == positions]
+        distance[frontier] = level
+    return distance.reshape(rows + 2, width)[1:-1, 1:-1].copy()
+
+# Backtrack from any cell to its nearest source using a distance map from wavefront_bfs
+def wavefront_path(distance, cell):
+    if distance[cell] < 0:
+        return None
+    path = [cell]
+    x, y = cell
+    while distance[x, y] > 0:
+        for dx, dy in MOVES:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < distance.shape[0] and 0 <= ny < distance.shape[1] and distance[nx, ny] == distance[x, y] - 1:
+                x, y = nx, ny
+                break
+        path.append((x, y))
+    return path
+
+if __name__ == "__main__":
+    # Example grid: 0 = free space, 1 = blocked cell
+    grid = [
+        [0, 0, 0, 0, 0],
+        [0, 1, 1, 1, 0],
+        [0, 0, 0, 0, 0],
+        [0, 1, 1, 1, 0],
+        [0, 0, 0, 0, 0]
+    ]
 
-start = (0, 0)  # Starting point (row, col)
-target = (4, 4)  # Target point (row, col)
+    start = (0, 0)  # Starting point (row, col)
+    target = (4, 4)  # Target point (row, col)
 
-# Run the Lee's Algorithm
-shortest_distance = lee_algorithm(grid, start, target)
+    # Run the Lee's Algorithm
+    shortest_distance = lee_algorithm(grid, start, target)
 
-if shortest_distance != -1:
-    print(f"The shortest path length is: {shortest_distance}")
-else:
-    print("No path found.")
+    if shortest_distance != -1:
+        print(f"The shortest path length is: {shortest_distance}")
+    else:
+        print("No path found.")
+
+    # Distance field: one wavefront computation answers "how far is the nearest exit" for every cell
+    exits = [(0, 4), (4, 0)]
+    distance = wavefront_bfs(grid, exits)
+    print(distance)
+    print("Path from (2, 2) to the nearest exit:", wavefront_path(distance, (2, 2)))
 
 #Explanation:
 # 1 - Grid Representation: The grid is represented as a 2D list, where 0 represents an open cell (free space), and 1 represents a blocked cell.
@@ -93,5 +156,12 @@ else:
 
 #Example Output:
 #For the provided grid, the output would be:
-The shortest path length is: 8
-This means the shortest path from (0, 0) to (4, 4) consists of 8 steps.
+#The shortest path length is: 8
+#This means the shortest path from (0, 0) to (4, 4) consists of 8 steps.
+
+#Vectorized Multi-Source Version (wavefront_bfs):
+# 1 - All sources start in the frontier with distance 0, so every cell gets the distance to its nearest source (a distance field).
+# 2 - The grid is flattened and surrounded by a blocked border, so the four moves become index shifts (-width, +width, -1, +1). Each step adds the shifts to the whole frontier at once and masks the result with the free cells that have no distance yet.
+# 3 - A cell can be reached from several frontier cells in the same step. Writing the candidate positions into the last_writer array keeps exactly one copy of each cell, in O(n) instead of sorting with np.unique.
+# 4 - The int32 distance map serves all queries: the distance from a cell to the nearest source is a lookup, and wavefront_path walks downhill to recover a path. With a single target as the source, the map gives the distance from every start cell.
+# 5 - Cost: O(R * C) NumPy work in total (every cell enters the frontier once) plus one Python iteration per distance level, instead of one Python iteration per cell.
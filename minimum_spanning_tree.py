@@ -0,0 +1,160 @@
+#kruskals_algorithm.kruskal keeps the edges as a list of (u, v, weight) tuples, sorts them with a Python key function and unions them one call at a time. For graphs with millions of edges, the edges should live in three NumPy arrays (u, v, w) instead, and the work should be done by array operations wherever the algorithm allows it. This file has three minimum spanning tree (MST) algorithms on such arrays.
+
+#Key Concepts:
+# 1 - Kruskal: Sort the edges by weight once (np.argsort) and scan them in that order, keeping every edge whose endpoints are still in different components (union-find). The scan stops as soon as V - 1 edges are taken.
+# 2 - Borůvka: In every round, each component picks its cheapest outgoing edge, and all these edges are added at once (they all belong to the MST). Every round at least halves the number of components, so there are at most log2(V) rounds, and each round is a "group by component, take the minimum" over all edges, which NumPy does in one pass. Since the components pick their edges independently, the rounds also parallelize naturally.
+# 3 - Filter-Kruskal: Sorting all edges is the expensive part of Kruskal, and most heavy edges end up inside a component anyway. Filter-Kruskal splits the edges around a pivot weight (like quicksort), solves the light half first, then throws away every heavy edge whose endpoints are already connected before splitting the rest further. It only sorts small groups of edges and never makes a sorted copy of the whole edge array, which matters when the edge arrays barely fit in memory.
+# 4 - Ties: All three functions break ties between equal weights by the position of the edge in the input, so they return exactly the same tree.
+
+#Python Implementation:
+#A graph is given as the number of vertices n and three arrays of the same length: u, v (vertex ids 0..n-1) and w (weights). Every function returns the positions of the MST edges in these arrays, in increasing order of weight, so the tree is (u[mst], v[mst], w[mst]). For a disconnected graph the result is a minimum spanning forest. The union-find is array_union_find.ArrayUnionFind.
+
+import numpy as np
+
+from array_union_find import ArrayUnionFind
+
+def _as_arrays(u, v, w):
+    u = np.asarray(u, dtype=np.int64)
+    v = np.asarray(v, dtype=np.int64)
+    w = np.asarray(w)
+    if not len(u) == len(v) == len(w):
+        raise ValueError("u, v and w must have the same length")
+    return u, v, w
+
+def _kruskal_scan(uf, u, v, order, tree):
+    """Append to tree the edges of order (already sorted) that join two components; returns False when done."""
+    parent, size = uf._parent, uf._size
+    for e, a, b in zip(order.tolist(), u[order].tolist(), v[order].tolist()):
+        while parent[a] != a:  # find with path halving, inlined for speed
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a == b:
+            continue
+        if size[a] < size[b]:
+            a, b = b, a
+        parent[b] = a
+        size[a] += size[b]
+        uf.num_components -= 1
+        tree.append(e)
+        if uf.num_components == 1:
+            return False
+    return True
+
+def kruskal_numpy(n, u, v, w):
+    """Kruskal's algorithm on edge arrays; returns the positions of the MST edges."""
+    u, v, w = _as_arrays(u, v, w)
+    tree = []
+    if n > 1:
+        _kruskal_scan(ArrayUnionFind(n), u, v, np.argsort(w, kind='stable'), tree)
+    return np.array(tree, dtype=np.int64)
+
+def boruvka(n, u, v, w):
+    """Borůvka's algorithm with one vectorized "cheapest edge per component" pass per round."""
+    u, v, w = _as_arrays(u, v, w)
+    order = np.argsort(w, kind='stable')
+    rank = np.empty(len(w), dtype=np.int64)
+    rank[order] = np.arange(len(w))  # Unique edge keys: weight, then position
+    component = np.arange(n, dtype=np.int64)
+    edges = np.flatnonzero(u != v)  # Self-loops never join two components
+    tree = []
+    num_components = n
+    while len(edges):
+        cu, cv = component[u[edges]], component[v[edges]]
+        cross = cu != cv
+        edges, cu, cv = edges[cross], cu[cross], cv[cross]  # Edges inside a component are gone for good
+        if not len(edges):
+            break
+        # Cheapest edge (smallest rank) of every component: a group-by minimum over both endpoints
+        best = np.full(num_components, len(w), dtype=np.int64)
+        edge_rank = rank[edges]
+        np.minimum.at(best, cu, edge_rank)
+        np.minimum.at(best, cv, edge_rank)
+        chosen = order[np.unique(best[best < len(w)])]  # Two components may choose the same edge
+        tree.append(chosen)
+        # Merge the components along the chosen edges and renumber them 0, 1, 2, ...
+        uf = ArrayUnionFind(num_components)
+        uf.union_many(component[u[chosen]], component[v[chosen]])
+        labels, num_components = uf.component_labels()
+        component = labels[component]
+    if not tree:
+        return np.zeros(0, dtype=np.int64)
+    tree = np.concatenate(tree)
+    return tree[np.argsort(rank[tree])]  # In increasing weight order, like kruskal_numpy
+
+def filter_kruskal(n, u, v, w, threshold=1 << 16):
+    """
+    Filter-Kruskal on edge arrays; returns the positions of the MST edges.
+
+    :param threshold: Groups with at most this many edges are sorted and scanned like Kruskal
+    """
+    u, v, w = _as_arrays(u, v, w)
+    uf = ArrayUnionFind(n)
+    tree = []
+    # Explicit stack of edge groups (arrays of positions); lighter groups are always on top
+    stack = [np.arange(len(w), dtype=np.int64)]
+    while stack and n > 1:
+        edges = stack.pop()
+        if len(edges) > threshold:
+            uf._compress()  # Every node points to its root, so parent[u] == parent[v] tests connectivity
+            edges = edges[uf.parent[u[edges]] != uf.parent[v[edges]]]  # The filter step
+        if len(edges) > threshold:
+            weights = w[edges]
+            pivot = np.partition(weights, len(weights) // 2)[len(weights) // 2]
+            light = weights < pivot
+            if not light.any():
+                light = weights <= pivot  # The pivot is the smallest weight
+            if not light.all():
+                stack.append(edges[~light])
+                stack.append(edges[light])
+                continue
+        # Small group (or all weights equal): sort by (weight, position) and scan
+        order = edges[np.lexsort((edges, w[edges]))]
+        if not _kruskal_scan(uf, u, v, order, tree):
+            break
+    return np.array(tree, dtype=np.int64)
+
+if __name__ == "__main__":
+    import time
+
+    # Example Usage: the graph of kruskals_algorithm.py
+    u = np.array([0, 0, 0, 1, 2])
+    v = np.array([1, 2, 3, 3, 3])
+    w = np.array([10, 6, 5, 15, 4])
+    for mst_function in (kruskal_numpy, boruvka, filter_kruskal):
+        mst = mst_function(4, u, v, w)
+        print(mst_function.__name__, list(zip(u[mst].tolist(), v[mst].tolist(), w[mst].tolist())))
+        # [(2, 3, 4), (0, 3, 5), (0, 1, 10)]
+
+    # A random sparse graph with 10^6 vertices and 5 * 10^6 edges
+    rng = np.random.default_rng(0)
+    n, m = 10 ** 6, 5 * 10 ** 6
+    u, v = rng.integers(0, n, m), rng.integers(0, n, m)
+    w = rng.random(m)
+    for mst_function in (kruskal_numpy, boruvka, filter_kruskal):
+        begin = time.perf_counter()
+        mst = mst_function(n, u, v, w)
+        print("%-14s %.1f s, %d edges, weight %.2f" % (mst_function.__name__, time.perf_counter() - begin,
+                                                     len(mst), w[mst].sum()))
+    # kruskal_numpy  6.3 s, 999939 edges, weight 120159.36
+    # boruvka        3.9 s, 999939 edges, weight 120159.36
+    # filter_kruskal 2.9 s, 999939 edges, weight 120159.36
+
+#Explanation of the Code:
+# 1 - _kruskal_scan walks over already sorted edge positions and does find (with path halving) and union by size directly on the memoryviews of an ArrayUnionFind, which avoids two method calls per edge. It stops when only one component is left.
+# 2 - kruskal_numpy sorts the weights once with a stable argsort (ties keep their input order) and scans all edges.
+# 3 - boruvka:
+# 3.1 - rank gives every edge a unique key (its position in the stable sorted order), so "the cheapest edge" is always unique and the chosen edges cannot form a cycle.
+# 3.2 - Every round keeps only edges between different components, then np.minimum.at computes the smallest rank per component over both endpoints.
+# 3.3 - The chosen edges are merged with ArrayUnionFind.union_many on the component ids, and component_labels renumbers the components so the arrays of the next round are smaller.
+# 4 - filter_kruskal:
+# 4.1 - A group of edges is first filtered: after _compress, an edge is useless if both endpoints have the same root.
+# 4.2 - A large group is split at its median weight (np.partition, no sorting) into a light and a heavy part. The light part is pushed last, so it is processed first, and the heavy part is filtered only after everything lighter is in the union-find.
+# 4.3 - Small groups are sorted by (weight, position) with np.lexsort and scanned like Kruskal, so the ties are broken exactly as in kruskal_numpy.
+
+#Time Complexity:
+# 1 - kruskal_numpy: O(E log E) for the sort + O(E α(V)) for the scan.
+# 2 - boruvka: O(log V) rounds of O(E + V) NumPy work, so O((E + V) log V).
+# 3 - filter_kruskal: O(E + V log V log(E / V)) expected for random weights; the sorting is done only on small groups, and most heavy edges are removed by the filter without being sorted.
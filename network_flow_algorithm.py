@@ -66,22 +66,23 @@ class Graph:
 
 # Example usage:
 
-# Create a graph given in the example
-g = Graph(6)  # 6 vertices
-g.graph = [
-    [0, 16, 13, 0, 0, 0],
-    [0, 0, 10, 12, 0, 0],
-    [0, 4, 0, 0, 14, 0],
-    [0, 0, 9, 0, 0, 20],
-    [0, 0, 0, 7, 0, 4],
-    [0, 0, 0, 0, 0, 0]
-]
-
-source = 0  # Source vertex
-sink = 5    # Sink vertex
-
-max_flow = g.edmonds_karp(source, sink)
-print("The maximum possible flow is:", max_flow)
+if __name__ == "__main__":
+    # Create a graph given in the example
+    g = Graph(6)  # 6 vertices
+    g.graph = [
+        [0, 16, 13, 0, 0, 0],
+        [0, 0, 10, 12, 0, 0],
+        [0, 4, 0, 0, 14, 0],
+        [0, 0, 9, 0, 0, 20],
+        [0, 0, 0, 7, 0, 4],
+        [0, 0, 0, 0, 0, 0]
+    ]
+
+    source = 0  # Source vertex
+    sink = 5    # Sink vertex
+
+    max_flow = g.edmonds_karp(source, sink)
+    print("The maximum possible flow is:", max_flow)
 
 #Explanation:
 # 1 - Graph Class:
@@ -0,0 +1,216 @@
+#Push-relabel (Goldberg-Tarjan) computes the maximum flow without augmenting paths. network_flow_algorithm.Graph.edmonds_karp searches a whole source-sink path for every unit of progress, and the paths of a dense network are long searches over the full matrix. Push-relabel instead moves flow locally, one arc at a time, with a "height" that guides the flow downhill towards the sink. On dense networks, such as the bipartite networks of assignment problems, it is usually the fastest max-flow method.
+
+#Key Concepts:
+# 1 - Preflow: Vertices may temporarily receive more flow than they send. The difference is the vertex's excess; a vertex with excess > 0 is active.
+# 2 - Heights: Every vertex has a height (label) that never exceeds its residual distance to the sink. Flow may only be pushed along an arc with residual capacity from height h to height h - 1 (an admissible arc).
+# 3 - Push and Relabel: An active vertex pushes as much of its excess as possible along admissible arcs. If it still has excess and no admissible arc is left, it is relabeled to 1 + the smallest height of its residual neighbors.
+# 4 - Highest Label: Always discharging the active vertex with the largest height moves flow in big waves towards the sink and gives the best bound, O(V^2 * sqrt(E)).
+# 5 - Gap Heuristic: If no vertex has height h anymore, every vertex above h has lost its way to the sink, so all of them jump to height V at once instead of being relabeled step by step.
+# 6 - Global Relabeling: Every so often, all heights are reset to the exact residual distances with a backward BFS from the sink. Without it, heights drift far below the true distances and the algorithm wastes most of its time on small relabels.
+# 7 - Two Phases: Phase 1 only moves flow towards the sink; when no vertex below height V is active, the excess of the sink is the maximum flow value. Phase 2 runs the same loop with the source as target, which sends the excess that is stuck (at height V) back to the source, so the result is a valid flow.
+
+#Python Implementation:
+#The residual graph is dinics_algorithm.ResidualGraph (arcs in CSR order, as NumPy arrays), and the result is the same FlowResult as dinics_algorithm.dinic, with the min cut. The global relabel BFS is vectorized with NumPy; the push and relabel loop reads and writes the residual capacities through a memoryview of the same array.
+
+import time
+
+import numpy as np
+
+from dinics_algorithm import ResidualGraph, dinic
+
+def _exact_heights(graph, target, blocked):
+    """Residual distance of every vertex to target (backward BFS, never through blocked); n if unreachable."""
+    n = graph.n
+    height = np.full(n, n, dtype=np.int64)
+    height[target] = 0
+    visited = np.zeros(n, dtype=bool)
+    visited[target] = visited[blocked] = True
+    frontier = np.array([target], dtype=np.int64)
+    depth = 0
+    while len(frontier):
+        starts = graph.offsets[frontier]
+        counts = graph.offsets[frontier + 1] - starts
+        arcs = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(int(counts.sum()))
+        # Arc y -> x of the frontier vertex y: x can reach y if the reverse arc x -> y has residual capacity
+        tails = graph.head[arcs[graph.residual[graph.reverse[arcs]] > 0]]
+        frontier = np.unique(tails[~visited[tails]])
+        depth += 1
+        height[frontier] = depth
+        visited[frontier] = True
+    return height
+
+def _discharge_phase(graph, target, blocked, excess, global_relabel_work):
+    """Highest-label push-relabel towards target until no vertex below height n is active."""
+    n = graph.n
+    head = graph.head.tolist()
+    reverse = graph.reverse.tolist()
+    offsets = graph.offsets.tolist()
+    residual = memoryview(graph.residual)
+    work = global_relabel_work  # Forces a global relabel before the first discharge
+    while True:
+        if work >= global_relabel_work:
+            # Global relabel: exact heights, and buckets of active vertices / all vertices by height
+            height = _exact_heights(graph, target, blocked).tolist()
+            height[blocked] = 2 * n  # Never admissible
+            active = [[] for _ in range(n)]
+            members = [set() for _ in range(n)]
+            for x in range(n):
+                if x != blocked and height[x] < n:
+                    members[height[x]].add(x)
+                    if excess[x] > 0 and x != target:
+                        active[height[x]].append(x)
+            current = offsets[:-1]  # Current-arc pointers
+            max_height = max((h for h in range(n) if members[h]), default=0)
+            highest = max_height
+            work = 0
+        while highest >= 0 and not active[highest]:
+            highest -= 1
+        if highest < 0:
+            return
+        v = active[highest].pop()
+        h = height[v]
+        if h != highest or excess[v] <= 0:
+            continue  # Stale entry: v was relabeled (or lifted by a gap) after it was added
+        i, end = current[v], offsets[v + 1]
+        while excess[v] > 0:
+            if i == end:
+                # Relabel v to 1 + the lowest residual neighbor
+                start = offsets[v]
+                work += 12 + end - start
+                new_height = 2 * n
+                for a in range(start, end):
+                    if residual[a] > 0 and height[head[a]] < new_height:
+                        new_height = height[head[a]]
+                new_height += 1
+                members[h].discard(v)
+                if not members[h]:
+                    # Gap: nothing is left at height h, so nothing above it can reach the target
+                    for above in range(h + 1, max_height + 1):
+                        for x in members[above]:
+                            height[x] = n
+                        members[above].clear()
+                    max_height = h - 1
+                    new_height = n
+                if new_height >= n:
+                    height[v] = n  # Inactive until the next phase
+                    break
+                height[v] = h = new_height
+                members[h].add(v)
+                max_height = max(max_height, h)
+                i = start
+                continue
+            w = head[i]
+            if residual[i] > 0 and height[w] == h - 1:
+                delta = min(excess[v], residual[i])
+                residual[i] -= delta
+                residual[reverse[i]] += delta
+                excess[v] -= delta
+                if excess[w] <= 0 and w != target:
+                    active[h - 1].append(w)
+                    highest = max(highest, h - 1)
+                excess[w] += delta
+                if residual[i] == 0:
+                    i += 1
+            else:
+                i += 1
+        current[v] = i
+
+def push_relabel(n, u, v, capacity, source, sink, global_relabel_work=None):
+    """
+    Maximum flow with highest-label push-relabel, gap and global relabeling.
+
+    :param global_relabel_work: Relabel work (arcs scanned) between two global relabels (default 6 * n + number of arcs)
+    :return: FlowResult(flow_value, edge_flow, source_side, cut_edges), as dinics_algorithm.dinic
+    """
+    if source == sink:
+        raise ValueError("source and sink must be different")
+    graph = ResidualGraph(n, u, v, capacity)
+    if global_relabel_work is None:
+        global_relabel_work = 6 * n + len(graph.head)
+    excess = [0] * n
+    residual = memoryview(graph.residual)
+    head, reverse = graph.head.tolist(), graph.reverse.tolist()
+    for a in range(graph.offsets[source], graph.offsets[source + 1]):  # Saturate every arc out of the source
+        delta = residual[a]
+        if delta > 0:
+            residual[a] = 0
+            residual[reverse[a]] += delta
+            excess[head[a]] += delta
+            excess[source] -= delta
+    _discharge_phase(graph, sink, source, excess, global_relabel_work)  # Phase 1: maximum preflow
+    _discharge_phase(graph, source, sink, excess, global_relabel_work)  # Phase 2: return the rest to the source
+    return graph.result(source)
+
+def assignment_network(k, density=0.5, seed=0):
+    """
+    A dense bipartite network: source 0 -> k workers -> k jobs -> sink 2k + 1. Every worker can take up to k - 1
+    units of work and every job can absorb up to k - 1, but a worker-job edge carries only 1 unit, so the
+    bottleneck is the dense middle layer.
+
+    :return: (n, u, v, capacity, source, sink)
+    """
+    rng = np.random.default_rng(seed)
+    workers, jobs = np.arange(1, k + 1), np.arange(k + 1, 2 * k + 1)
+    sink = 2 * k + 1
+    pairs = np.argwhere(rng.random((k, k)) < density)
+    u = np.concatenate((np.zeros(k, dtype=np.int64), workers[pairs[:, 0]], jobs))
+    v = np.concatenate((workers, jobs[pairs[:, 1]], np.full(k, sink)))
+    capacity = np.concatenate((rng.integers(1, k, k), np.ones(len(pairs), dtype=np.int64), rng.integers(1, k, k)))
+    return 2 * k + 2, u, v, capacity, 0, sink
+
+def benchmark(k=100, large_k=1000, density=0.5, seed=0):
+    """
+    Compare edmonds_karp (network_flow_algorithm.py), dinic and push_relabel on assignment networks.
+
+    edmonds_karp only runs on the small network (k workers); the large one (large_k workers) is far too slow for it.
+    """
+    from network_flow_algorithm import Graph
+    for workers in (k, large_k):
+        n, u, v, capacity, source, sink = assignment_network(workers, density, seed)
+        print("%d workers, %d jobs, %d edges:" % (workers, workers, len(u)))
+        if workers == k:
+            matrix = Graph(n)
+            for a, b, c in zip(u.tolist(), v.tolist(), capacity.tolist()):
+                matrix.graph[a][b] += c
+            begin = time.perf_counter()
+            flow = matrix.edmonds_karp(source, sink)
+            print("  %-13s flow %d in %.2f s" % ('edmonds_karp', flow, time.perf_counter() - begin))
+        for max_flow in (dinic, push_relabel):
+            begin = time.perf_counter()
+            flow = max_flow(n, u, v, capacity, source, sink).flow_value
+            print("  %-13s flow %d in %.2f s" % (max_flow.__name__, flow, time.perf_counter() - begin))
+
+if __name__ == "__main__":
+    # Example Usage: the network of edmonds_karp_algorithm.py
+    u = [0, 0, 1, 1, 2, 2, 3, 3, 4, 4]
+    v = [1, 2, 2, 3, 1, 4, 2, 5, 3, 5]
+    capacity = [16, 13, 10, 12, 4, 14, 9, 20, 7, 4]
+    result = push_relabel(6, u, v, capacity, 0, 5)
+    print("The maximum possible flow is", result.flow_value)  # 23
+    print("Flow on every edge:", result.edge_flow)  # [16  7  4 12  0 11  0 19  7  4]
+    print("Cut edges:", [(u[i], v[i], capacity[i]) for i in result.cut_edges])  # [(1, 3, 12), (4, 3, 7), (4, 5, 4)]
+
+    # Dense assignment networks with 100 and 1,000 workers (5,000 and 500,000 worker-job edges)
+    benchmark()
+    # 100 workers, 100 jobs, 5190 edges:
+    #   edmonds_karp  flow 3403 in 2.64 s
+    #   dinic         flow 3403 in 0.02 s
+    #   push_relabel  flow 3403 in 0.02 s
+    # 1000 workers, 1000 jobs, 502194 edges:
+    #   dinic         flow 331654 in 2.49 s
+    #   push_relabel  flow 331654 in 1.26 s
+
+#Explanation of the Code:
+# 1 - _exact_heights runs a frontier BFS backwards from the target: from a frontier vertex y it looks at the arcs y -> x and keeps those whose reverse arc x -> y still has residual capacity. The blocked vertex (the source in phase 1, the sink in phase 2) is never entered.
+# 2 - _discharge_phase:
+# 2.1 - Global relabel: heights are reset to the exact distances, active vertices are put in active[height], and members[height] holds all vertices of each height for the gap heuristic. It runs at the start and whenever the relabel work since the last one exceeds global_relabel_work.
+# 2.2 - The highest non-empty bucket gives the next vertex. Entries whose height changed since they were added are skipped (lazy deletion) instead of being searched and removed.
+# 2.3 - Discharge: starting at the current arc, push min(excess, residual) along admissible arcs; a vertex that receives its first excess becomes active. When the arcs run out, relabel.
+# 2.4 - Relabel: the new height is 1 + the lowest residual neighbor. If v was the last vertex at its old height, the gap heuristic lifts v and everything above it to height n, where they stay inactive until phase 2.
+# 3 - push_relabel saturates all arcs out of the source, runs phase 1 (the sink's excess is now the maximum flow) and phase 2 (stuck excess flows back to the source), and builds the FlowResult from the final flow exactly as dinic does.
+# 4 - assignment_network builds the test networks of the benchmark: workers and jobs with large random capacities and a random dense set of unit worker-job edges, so every augmenting path of edmonds_karp carries only 1 unit of flow.
+
+#Time Complexity:
+# 1 - Highest-label push-relabel: O(V^2 * sqrt(E)) in the worst case; with the gap and global relabel heuristics it is usually close to linear in practice.
+# 2 - Each global relabel: O(V + E), and they run at most once per O(V + E) relabel work, so they do not change the bound.
+# 3 - edmonds_karp with the adjacency matrix: O(V^2) per BFS and up to O(V * E) augmentations; Dinic: O(V^2 * E).
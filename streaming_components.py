@@ -0,0 +1,165 @@
+#Connected components of a graph with billions of edges: the edge list does not fit in memory, but the nodes do. Union-find only needs one parent entry per node, and the edges can be merged in any order, so the edge file can be streamed from disk chunk by chunk and each chunk merged in bulk. Only the parent array (one entry per node) stays in memory.
+
+#Key Concepts:
+# 1 - Memory Mapping: mmap maps the file into the address space. The operating system reads the pages when they are touched and can drop them again, so a chunk of the file is just a slice, without read() calls or copies into Python objects.
+# 2 - Chunked Bulk Union: Every chunk of edges becomes two NumPy arrays (sources and targets) and is merged with ArrayUnionFind.union_many (array_union_find.py), which replaces millions of Python calls to union_find_algorithm.UnionFind.union by a few vectorized passes.
+# 3 - Order Independence: The final components do not depend on the order in which edges are merged, so the stream can stop at any point and continue later from a saved parent array.
+# 4 - Checkpoints: Every few chunks, the parent array and the file position are written to disk (to a temporary file that then replaces the old checkpoint, so a crash during the write never corrupts it). A restarted run loads the checkpoint and skips the part of the file that was already merged.
+
+#File Formats:
+# 1 - Binary: Pairs of integers (u, v) one after another, little-endian, int32 or int64 (dtype parameter). This is the fastest format: a chunk is a view of the mapped file.
+# 2 - Text: One edge "u v" per line, separated by spaces or tabs, as in the SNAP datasets. Lines starting with '#' are comments. Chunks are cut at line ends.
+
+import mmap
+import os
+
+import numpy as np
+
+from array_union_find import ArrayUnionFind
+
+def iter_binary_edges(path, dtype=np.int64, chunk_edges=1 << 22, start=0):
+    """
+    Stream a binary edge file.
+
+    :param start: Byte position to start from (from a checkpoint)
+    :return: Generator of (byte position after the chunk, sources, targets)
+    """
+    dtype = np.dtype(dtype).newbyteorder('<')
+    edge_bytes = 2 * dtype.itemsize
+    size = os.path.getsize(path)
+    if size % edge_bytes:
+        raise ValueError("File size is not a multiple of %d bytes (one edge)" % edge_bytes)
+    if size == start:
+        return
+    edges = np.memmap(path, dtype=dtype, mode='r', shape=(size // edge_bytes, 2))
+    for first in range(start // edge_bytes, len(edges), chunk_edges):
+        chunk = edges[first:first + chunk_edges]
+        yield (first + len(chunk)) * edge_bytes, chunk[:, 0], chunk[:, 1]
+
+def iter_text_edges(path, chunk_bytes=1 << 26, start=0):
+    """
+    Stream a text edge file ("u v" per line).
+
+    :param start: Byte position to start from (from a checkpoint, always the start of a line)
+    :return: Generator of (byte position after the chunk, sources, targets)
+    """
+    size = os.path.getsize(path)
+    if size == start:
+        return
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        position = start
+        while position < size:
+            end = min(position + chunk_bytes, size)
+            if end < size:
+                cut = data.rfind(b'\n', position, end)
+                end = cut + 1 if cut != -1 else data.find(b'\n', end) + 1 or size  # A line longer than a chunk
+            text = data[position:end]
+            if b'#' in text:
+                text = b'\n'.join(line for line in text.split(b'\n') if not line.lstrip().startswith(b'#'))
+            text = text.strip()  # np.fromstring reads a blank string as [0]
+            numbers = np.fromstring(text, dtype=np.int64, sep=' ') if text else np.zeros(0, dtype=np.int64)
+            if len(numbers) % 2:
+                raise ValueError("Every line must contain exactly two node ids (near byte %d)" % position)
+            position = end
+            yield position, numbers[0::2], numbers[1::2]
+
+def _save_checkpoint(checkpoint, parent, position, file_size):
+    temporary = checkpoint + '.tmp.npz'  # np.savez adds .npz to names without it
+    np.savez(temporary, parent=parent, position=position, file_size=file_size)
+    os.replace(temporary, checkpoint)
+
+def streaming_components(path, num_nodes, binary=True, dtype=np.int64, chunk_size=1 << 22, checkpoint=None,
+                         checkpoint_every=16, labels_path=None, progress=None):
+    """
+    Connected components of the undirected graph in an edge file, reading it in chunks.
+
+    :param path: Edge file (binary pairs or text lines, see above)
+    :param num_nodes: Node ids must be in 0..num_nodes - 1
+    :param binary: True for binary files, False for text files
+    :param dtype: Integer type of binary files (np.int32 or np.int64)
+    :param chunk_size: Edges per chunk (binary) or bytes per chunk (text)
+    :param checkpoint: Path of a .npz checkpoint; if it exists, the run continues from it
+    :param checkpoint_every: Write the checkpoint every this many chunks (and at the end)
+    :param labels_path: If given, the labels are saved there with np.save (read them with np.load(mmap_mode='r'))
+    :param progress: Optional function(byte position, file size, number of components), called after each chunk
+    :return: (int64 component label for every node, number of components)
+    """
+    file_size = os.path.getsize(path)
+    uf = ArrayUnionFind(num_nodes, track_sizes=False)  # Only the parent array stays in memory
+    position = 0
+    if checkpoint is not None and os.path.exists(checkpoint):
+        with np.load(checkpoint) as saved:
+            if int(saved['file_size']) != file_size or len(saved['parent']) != num_nodes:
+                raise ValueError("Checkpoint %s belongs to a different edge file or node count" % checkpoint)
+            uf.parent[:] = saved['parent']
+            position = int(saved['position'])
+        uf.recount()  # The number of components of the loaded parent array
+
+    if binary:
+        chunks = iter_binary_edges(path, dtype, chunk_size, position)
+    else:
+        chunks = iter_text_edges(path, chunk_size, position)
+    for count, (position, u, v) in enumerate(chunks, 1):
+        if len(u) and (min(u.min(), v.min()) < 0 or max(u.max(), v.max()) >= num_nodes):
+            raise ValueError("Node id out of range 0..%d before byte %d" % (num_nodes - 1, position))
+        uf.union_many(u, v)
+        if checkpoint is not None and count % checkpoint_every == 0:
+            _save_checkpoint(checkpoint, uf.parent, position, file_size)
+        if progress is not None:
+            progress(position, file_size, uf.num_components)
+    if checkpoint is not None:
+        _save_checkpoint(checkpoint, uf.parent, file_size, file_size)
+
+    labels, num_components = uf.component_labels()
+    if labels_path is not None:
+        np.save(labels_path, labels)
+    return labels, num_components
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    directory = tempfile.mkdtemp()
+
+    # Example Usage: a small text file
+    text_file = os.path.join(directory, 'small.txt')
+    with open(text_file, 'w') as file:
+        file.write("# u v\n0 1\n1 2\n3 4\n")
+    print(streaming_components(text_file, 6, binary=False))  # (array([0, 0, 0, 1, 1, 2]), 3)
+
+    # 20M random edges on 10M nodes in a binary int32 file (160 MB), read in chunks of 2M edges
+    rng = np.random.default_rng(0)
+    n, m = 10 ** 7, 2 * 10 ** 7
+    edge_file = os.path.join(directory, 'edges.bin')
+    with open(edge_file, 'wb') as file:
+        for _ in range(10):
+            rng.integers(0, n, (m // 10, 2), dtype=np.int32).tofile(file)
+    checkpoint = os.path.join(directory, 'components.npz')
+
+    def interrupt_after_half(position, file_size, components):
+        if position >= file_size // 2:
+            raise KeyboardInterrupt  # Stands for a crash or a killed job
+
+    try:
+        streaming_components(edge_file, n, dtype=np.int32, chunk_size=2 * 10 ** 6, checkpoint=checkpoint,
+                             checkpoint_every=1, progress=interrupt_after_half)
+    except KeyboardInterrupt:
+        print("Interrupted, checkpoint at byte", int(np.load(checkpoint)['position']))  # 80000000
+    begin = time.perf_counter()
+    labels, count = streaming_components(edge_file, n, dtype=np.int32, chunk_size=2 * 10 ** 6,
+                                         checkpoint=checkpoint, labels_path=os.path.join(directory, 'labels.npy'))
+    print("Resumed and finished in %.1f s: %d components" % (time.perf_counter() - begin, count))
+
+#Explanation of the Code:
+# 1 - iter_binary_edges maps the file with np.memmap as an (edges x 2) array. Each chunk is a slice of it, so the only data read is the chunk itself. It also returns the byte position after the chunk, which is what a checkpoint stores.
+# 2 - iter_text_edges maps the file with mmap and cuts each chunk after the last newline before the chunk size, so no line is split. np.fromstring parses the whole chunk of numbers in C, and the even and odd entries are the sources and targets.
+# 3 - streaming_components:
+# 3.1 - The union-find is created with track_sizes=False, so there is no size array: union_many only hooks onto smaller roots and never needs one. A checkpoint is loaded only if it was made for a file of the same size and the same number of nodes; recount then gets the number of components from the loaded parents.
+# 3.2 - Every chunk is checked for ids out of range and merged with union_many, which only reads and writes the parents of the chunk's nodes and of their paths to the roots, never the whole array.
+# 3.3 - _save_checkpoint writes the parent array and the position to a temporary file and renames it over the old checkpoint (os.replace is atomic), so there is always one complete checkpoint.
+# 3.4 - component_labels numbers the components 0, 1, 2, ... in the order of their smallest node, and np.save writes them to disk if requested.
+
+#Time and Space Complexity:
+# 1 - Time: O(chunk * (rounds + path length)) NumPy work per chunk, independent of V, where rounds (usually a handful) is the number of hooking rounds of union_many. The file is read exactly once (plus the part after the last checkpoint, after a restart). Loading a checkpoint, saving one and the final labels are O(V) each.
+# 2 - Memory while streaming: the int64 parent array (8 bytes per node, 10^9 nodes need 8 GB whatever the number of edges) plus one chunk and a few chunk-sized temporaries. In the example (10^7 nodes) that is about 90 MB on top of the interpreter; the pages of the mapped edge file also count as resident, but the operating system can drop them at any time.
+# 3 - Memory at the end: component_labels needs up to three more V-sized int64 arrays (pointer jumping, the root numbers and the labels), and np.load of a checkpoint briefly holds a second copy of the parent array.
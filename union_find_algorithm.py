@@ -55,25 +55,26 @@ class UnionFind:
 # 4.1 - This function checks whether two elements belong to the same set by comparing their roots.
 
 #Example Usage:
-# Initialize UnionFind for 5 elements (0 to 4)
-uf = UnionFind(5)
+if __name__ == "__main__":
+    # Initialize UnionFind for 5 elements (0 to 4)
+    uf = UnionFind(5)
 
-# Union some sets
-uf.union(0, 1)
-uf.union(1, 2)
-uf.union(3, 4)
+    # Union some sets
+    uf.union(0, 1)
+    uf.union(1, 2)
+    uf.union(3, 4)
 
-# Check if 0 and 2 are connected (they are in the same set)
-print(uf.connected(0, 2))  # Output: True
+    # Check if 0 and 2 are connected (they are in the same set)
+    print(uf.connected(0, 2))  # Output: True
 
-# Check if 0 and 4 are connected (they are not in the same set)
-print(uf.connected(0, 4))  # Output: False
+    # Check if 0 and 4 are connected (they are not in the same set)
+    print(uf.connected(0, 4))  # Output: False
 
-# Union two sets: set containing 2 and set containing 4
-uf.union(2, 4)
+    # Union two sets: set containing 2 and set containing 4
+    uf.union(2, 4)
 
-# Now 0 and 4 should be connected
-print(uf.connected(0, 4))  # Output: True
+    # Now 0 and 4 should be connected
+    print(uf.connected(0, 4))  # Output: True
 
 #Time Complexity:
 # 1 - Find operation: O(α(n)), where α(n) is the inverse Ackermann function, which grows extremely slowly. For all practical purposes, it can be considered constant time.